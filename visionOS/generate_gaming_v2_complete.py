@@ -15,21 +15,34 @@ NEW IN V2.0:
 ✅ Testimonials
 """
 
-import os
-import sys
-
-# Import the existing GAMING_APPS data
-sys.path.insert(0, os.path.dirname(__file__))
-from generate_enhanced_gaming_apps import GAMING_APPS, hex_to_rgba
-
-def generate_v2_html(app):
+import argparse
+from functools import partial
+
+from landing_pipeline.build import add_build_arguments, build_pages, selected_apps, site_options, summarize
+from landing_pipeline.critical import stylesheet_tags
+from landing_pipeline.fragments import render_fragments
+from landing_pipeline.images import gallery_html
+from landing_pipeline.locales import N_, localize_app, translator
+from landing_pipeline.templates import stream_template, template_path
+from landing_pipeline.tokens import design_tokens
+from landing_pipeline.watch import watch_pages
+
+TEMPLATE = "gaming_v2.html"
+STYLESHEET = "gaming_v2"
+FRAGMENTS = [
+    "fragments/feature_card.html", "fragments/mode_badge.html", "fragments/testimonial_card.html",
+    "fragments/screenshot_placeholder.html", "fragments/screenshot_card.html", "fragments/screenshot_source.html",
+]
+# Gallery cards shown until the app has files in <app dir>/screenshots/
+GALLERY_PLACEHOLDERS = [N_("ACTION SCREENSHOT"), N_("COMBAT MOMENT"), N_("SPECIAL ABILITY"), N_("MULTIPLAYER ACTION")]
+
+# Same catalog as generate_enhanced_gaming_apps.py
+CATALOG = "gaming"
+
+def generate_v2_html(app, site=None):
     """Generate V2 HTML with all conversion optimizations"""
-
-    # Color variations
-    color_rgb_20 = hex_to_rgba(app['color_primary'], 0.2)
-    color_rgb_30 = hex_to_rgba(app['color_primary'], 0.3)
-    color_rgb_40 = hex_to_rgba(app['color_primary'], 0.4)
-    color_rgb_50 = hex_to_rgba(app['color_primary'], 0.5)
+    _ = translator(site)
+    locale = (site or {}).get("locale")
 
     # Determine pricing (varied by genre)
     genre_pricing = {
@@ -63,1162 +76,57 @@ def generate_v2_html(app):
 
     # Determine age rating
     genre_ratings = {
-        "ACTION SPORTS": ("E", "Everyone"),
-        "TACTICAL FPS": ("T", "Teen • Fantasy Violence"),
-        "TOWER DEFENSE": ("E10+", "Everyone 10+ • Fantasy Violence"),
-        "FANTASY RPG": ("T", "Teen • Fantasy Violence, Mild Language"),
-        "SANDBOX BUILDING": ("E", "Everyone"),
-        "WELLNESS EXPERIENCE": ("E", "Everyone"),
+        "ACTION SPORTS": ("E", N_("Everyone")),
+        "TACTICAL FPS": ("T", N_("Teen • Fantasy Violence")),
+        "TOWER DEFENSE": ("E10+", N_("Everyone 10+ • Fantasy Violence")),
+        "FANTASY RPG": ("T", N_("Teen • Fantasy Violence, Mild Language")),
+        "SANDBOX BUILDING": ("E", N_("Everyone")),
+        "WELLNESS EXPERIENCE": ("E", N_("Everyone")),
     }
-    rating_code, rating_desc = genre_ratings.get(app['genre'], ("E10+", "Everyone 10+"))
+    rating_code, rating_desc = genre_ratings.get(app['genre'], ("E10+", N_("Everyone 10+")))
 
-    # Build features HTML
-    features_html = ""
-    for icon, title, description in app['features']:
-        features_html += f"""                <div class="feature-card">
-                    <div class="feature-icon">{icon}</div>
-                    <h3>{title}</h3>
-                    <p>{description}</p>
-                </div>
-"""
+    # Prices and ratings are looked up by the English genre; everything shown from here on is localized
+    app = localize_app(app, site)
 
-    # Build modes HTML
-    modes_html = ""
-    for mode in app['modes']:
-        modes_html += f'                <div class="mode-badge">{mode}</div>\n'
+    features_html = render_fragments("fragments/feature_card.html", (
+        {"icon": icon, "title": title, "description": description}
+        for icon, title, description in app['features']
+    ), locale)
+    modes_html = render_fragments("fragments/mode_badge.html", ({"mode": mode} for mode in app['modes']), locale)
 
     # Generate testimonials based on genre
     testimonials = [
-        {"name": "Alex M.", "quote": "Most immersive experience I've ever had. My room truly becomes the game world!"},
-        {"name": "Sarah K.", "quote": "The spatial mechanics are mind-blowing. This is the future of gaming."},
-        {"name": "James R.", "quote": "Can't stop playing! The physicality makes every session feel like a workout."}
+        {"name": "Alex M.", "quote": _("Most immersive experience I've ever had. My room truly becomes the game world!")},
+        {"name": "Sarah K.", "quote": _("The spatial mechanics are mind-blowing. This is the future of gaming.")},
+        {"name": "James R.", "quote": _("Can't stop playing! The physicality makes every session feel like a workout.")}
     ]
-
-    html = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{app['title']} - {app['genre']} for Vision Pro</title>
-    <style>
-        * {{
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }}
-
-        body {{
-            font-family: -apple-system, BlinkMacSystemFont, 'SF Pro Display', 'Segoe UI', sans-serif;
-            background: #000000;
-            color: #ffffff;
-            overflow-x: hidden;
-            scroll-behavior: smooth;
-        }}
-
-        /* Enhanced 3D Depth Layers */
-        .depth-layer {{
-            position: fixed;
-            width: 200%;
-            height: 200%;
-            top: -50%;
-            left: -50%;
-            pointer-events: none;
-            z-index: 0;
-        }}
-
-        .depth-layer-1 {{
-            background: radial-gradient(circle at 20% 30%, rgba{color_rgb_40} 0%, transparent 40%);
-            animation: dramaticFloat 15s ease-in-out infinite;
-        }}
-
-        .depth-layer-2 {{
-            background: radial-gradient(circle at 80% 70%, rgba{color_rgb_50} 0%, transparent 40%);
-            animation: dramaticFloat 18s ease-in-out infinite reverse;
-        }}
-
-        .depth-layer-3 {{
-            background: radial-gradient(circle at 50% 50%, rgba{color_rgb_30} 0%, transparent 50%);
-            animation: dramaticFloat 22s ease-in-out infinite;
-        }}
-
-        @keyframes dramaticFloat {{
-            0%, 100% {{ transform: translate(0, 0) rotate(0deg) scale(1); }}
-            33% {{ transform: translate(40px, -40px) rotate(8deg) scale(1.05); }}
-            66% {{ transform: translate(-20px, 30px) rotate(-8deg) scale(0.95); }}
-        }}
-
-        @keyframes pulseGlow {{
-            0%, 100% {{ box-shadow: 0 0 30px rgba{color_rgb_40}, 0 0 60px rgba{color_rgb_30}; }}
-            50% {{ box-shadow: 0 0 50px rgba{color_rgb_50}, 0 0 100px rgba{color_rgb_40}; }}
-        }}
-
-        @keyframes countUp {{
-            from {{ opacity: 0; transform: translateY(20px); }}
-            to {{ opacity: 1; transform: translateY(0); }}
-        }}
-
-        /* Container */
-        .container {{
-            max-width: 1400px;
-            margin: 0 auto;
-            padding: 40px 20px;
-            position: relative;
-            z-index: 1;
-        }}
-
-        /* Hero Section */
-        .hero {{
-            text-align: center;
-            padding: 60px 20px 40px;
-            position: relative;
-        }}
-
-        .genre-badge {{
-            display: inline-block;
-            background: linear-gradient(135deg, {app['color_primary']} 0%, {app['color_primary']}cc 100%);
-            padding: 10px 24px;
-            border-radius: 24px;
-            font-size: 13px;
-            font-weight: 800;
-            letter-spacing: 2px;
-            margin-bottom: 30px;
-            text-transform: uppercase;
-            box-shadow: 0 8px 32px rgba{color_rgb_50};
-            animation: pulseGlow 3s ease-in-out infinite;
-        }}
-
-        .logo-container {{
-            margin-bottom: 30px;
-            perspective: 1200px;
-        }}
-
-        .logo-icon {{
-            display: inline-flex;
-            align-items: center;
-            justify-content: center;
-            width: 140px;
-            height: 140px;
-            background: rgba(15, 15, 30, 0.6);
-            backdrop-filter: blur(20px);
-            -webkit-backdrop-filter: blur(20px);
-            border: 3px solid {app['color_primary']};
-            border-radius: 32px;
-            font-size: 72px;
-            box-shadow:
-                0 25px 70px rgba(0, 0, 0, 0.5),
-                0 0 40px rgba{color_rgb_40},
-                inset 0 1px 0 rgba(255, 255, 255, 0.15);
-            transform-style: preserve-3d;
-            animation: logoFloat 4s ease-in-out infinite;
-        }}
-
-        @keyframes logoFloat {{
-            0%, 100% {{ transform: rotateY(0deg) rotateX(0deg) translateY(0); }}
-            50% {{ transform: rotateY(15deg) rotateX(8deg) translateY(-10px); }}
-        }}
-
-        h1 {{
-            font-size: 72px;
-            font-weight: 900;
-            margin-bottom: 20px;
-            background: linear-gradient(135deg, #ffffff 0%, {app['color_primary']} 100%);
-            -webkit-background-clip: text;
-            -webkit-text-fill-color: transparent;
-            background-clip: text;
-            line-height: 1.1;
-            text-transform: uppercase;
-            letter-spacing: -2px;
-        }}
-
-        .tagline {{
-            font-size: 32px;
-            color: {app['color_primary']};
-            margin-bottom: 30px;
-            font-weight: 700;
-            text-transform: uppercase;
-            letter-spacing: 1px;
-            text-shadow: 0 0 20px rgba{color_rgb_40};
-        }}
-
-        .hero-message {{
-            font-size: 19px;
-            color: rgba(255, 255, 255, 0.85);
-            max-width: 900px;
-            margin: 0 auto 40px;
-            line-height: 1.7;
-        }}
-
-        /* NEW: Pricing Section */
-        .pricing-section {{
-            background: linear-gradient(135deg, rgba{color_rgb_40} 0%, rgba{color_rgb_20} 100%);
-            border: 2px solid {app['color_primary']};
-            border-radius: 24px;
-            padding: 40px;
-            margin: 40px auto;
-            max-width: 800px;
-            text-align: center;
-            box-shadow: 0 20px 60px rgba{color_rgb_50};
-        }}
-
-        .price-tag {{
-            font-size: 64px;
-            font-weight: 900;
-            color: {app['color_primary']};
-            margin-bottom: 10px;
-            text-shadow: 0 0 30px rgba{color_rgb_50};
-        }}
-
-        .price-subtitle {{
-            font-size: 18px;
-            color: rgba(255, 255, 255, 0.8);
-            margin-bottom: 30px;
-        }}
-
-        .demo-badge {{
-            display: inline-block;
-            background: rgba(255, 255, 255, 0.1);
-            padding: 8px 20px;
-            border-radius: 20px;
-            font-size: 14px;
-            font-weight: 600;
-            margin-bottom: 20px;
-            border: 1px solid rgba(255, 255, 255, 0.3);
-        }}
-
-        /* CTA Buttons */
-        .cta-buttons {{
-            display: flex;
-            gap: 20px;
-            justify-content: center;
-            flex-wrap: wrap;
-        }}
-
-        .cta-primary {{
-            background: {app['color_primary']};
-            color: #ffffff;
-            padding: 20px 60px;
-            border-radius: 14px;
-            text-decoration: none;
-            font-size: 20px;
-            font-weight: 700;
-            transition: all 0.3s ease;
-            box-shadow: 0 15px 50px rgba{color_rgb_50};
-            border: 2px solid {app['color_primary']};
-            text-transform: uppercase;
-            letter-spacing: 1px;
-            cursor: pointer;
-        }}
-
-        .cta-primary:hover {{
-            transform: translateY(-3px) scale(1.02);
-            box-shadow: 0 20px 60px rgba{color_rgb_50};
-        }}
-
-        .cta-secondary {{
-            background: transparent;
-            color: {app['color_primary']};
-            padding: 20px 60px;
-            border-radius: 14px;
-            text-decoration: none;
-            font-size: 20px;
-            font-weight: 700;
-            border: 2px solid {app['color_primary']};
-            transition: all 0.3s ease;
-            cursor: pointer;
-        }}
-
-        .cta-secondary:hover {{
-            background: rgba{color_rgb_30};
-            transform: translateY(-3px);
-        }}
-
-        .cta-wishlist {{
-            background: rgba(255, 255, 255, 0.05);
-            color: rgba(255, 255, 255, 0.9);
-            padding: 20px 60px;
-            border-radius: 14px;
-            text-decoration: none;
-            font-size: 20px;
-            font-weight: 700;
-            border: 2px solid rgba(255, 255, 255, 0.2);
-            transition: all 0.3s ease;
-            cursor: pointer;
-        }}
-
-        .cta-wishlist:hover {{
-            background: rgba(255, 255, 255, 0.1);
-            border-color: rgba(255, 255, 255, 0.4);
-            transform: translateY(-3px);
-        }}
-
-        /* Game Metadata Bar */
-        .game-metadata {{
-            display: flex;
-            justify-content: center;
-            gap: 40px;
-            flex-wrap: wrap;
-            padding: 30px;
-            background: rgba(15, 15, 30, 0.4);
-            border: 1px solid rgba{color_rgb_30};
-            border-radius: 20px;
-            margin-bottom: 50px;
-            backdrop-filter: blur(10px);
-        }}
-
-        .metadata-item {{
-            text-align: center;
-            animation: countUp 0.6s ease-out;
-        }}
-
-        .metadata-value {{
-            font-size: 28px;
-            font-weight: 800;
-            color: {app['color_primary']};
-            display: block;
-        }}
-
-        .metadata-label {{
-            font-size: 13px;
-            color: rgba(255, 255, 255, 0.6);
-            text-transform: uppercase;
-            letter-spacing: 1px;
-        }}
-
-        /* NEW: Video Section */
-        .video-section {{
-            margin: 60px 0;
-            text-align: center;
-        }}
-
-        .video-container {{
-            position: relative;
-            max-width: 1000px;
-            margin: 0 auto;
-            aspect-ratio: 16 / 9;
-            background: linear-gradient(135deg, rgba{color_rgb_30} 0%, rgba(15, 15, 30, 0.9) 100%);
-            border-radius: 24px;
-            border: 2px solid rgba{color_rgb_30};
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            overflow: hidden;
-            box-shadow: 0 20px 60px rgba{color_rgb_40};
-        }}
-
-        .video-placeholder {{
-            text-align: center;
-            padding: 40px;
-        }}
-
-        .play-button {{
-            width: 100px;
-            height: 100px;
-            background: {app['color_primary']};
-            border-radius: 50%;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            margin: 0 auto 20px;
-            box-shadow: 0 10px 40px rgba{color_rgb_50};
-            cursor: pointer;
-            transition: all 0.3s ease;
-        }}
-
-        .play-button:hover {{
-            transform: scale(1.1);
-            box-shadow: 0 15px 50px rgba{color_rgb_50};
-        }}
-
-        .play-button::after {{
-            content: '▶';
-            font-size: 40px;
-            color: white;
-            margin-left: 8px;
-        }}
-
-        /* Section Styling */
-        .section {{
-            margin: 100px 0;
-        }}
-
-        .section-title {{
-            font-size: 48px;
-            font-weight: 800;
-            text-align: center;
-            margin-bottom: 60px;
-            text-transform: uppercase;
-            letter-spacing: -1px;
-            background: linear-gradient(135deg, #ffffff 0%, {app['color_primary']} 100%);
-            -webkit-background-clip: text;
-            -webkit-text-fill-color: transparent;
-            background-clip: text;
-        }}
-
-        /* Game Modes */
-        .modes-grid {{
-            display: flex;
-            gap: 15px;
-            justify-content: center;
-            flex-wrap: wrap;
-            margin-bottom: 60px;
-        }}
-
-        .mode-badge {{
-            background: rgba(15, 15, 30, 0.5);
-            border: 2px solid rgba{color_rgb_30};
-            padding: 12px 28px;
-            border-radius: 30px;
-            font-size: 16px;
-            font-weight: 600;
-            color: rgba(255, 255, 255, 0.9);
-            transition: all 0.3s ease;
-            cursor: pointer;
-        }}
-
-        .mode-badge:hover {{
-            background: rgba{color_rgb_30};
-            border-color: {app['color_primary']};
-            transform: translateY(-2px);
-        }}
-
-        /* Features Grid */
-        .features-grid {{
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(350px, 1fr));
-            gap: 30px;
-            margin-bottom: 60px;
-        }}
-
-        .feature-card {{
-            background: rgba(15, 15, 30, 0.5);
-            backdrop-filter: blur(20px);
-            -webkit-backdrop-filter: blur(20px);
-            border: 2px solid rgba{color_rgb_30};
-            border-radius: 24px;
-            padding: 45px;
-            transition: all 0.3s ease;
-            position: relative;
-            overflow: hidden;
-        }}
-
-        .feature-card::before {{
-            content: '';
-            position: absolute;
-            top: 0;
-            left: 0;
-            right: 0;
-            height: 4px;
-            background: linear-gradient(90deg, transparent, {app['color_primary']}, transparent);
-            opacity: 0;
-            transition: opacity 0.3s ease;
-        }}
-
-        .feature-card:hover {{
-            transform: translateY(-8px);
-            border-color: {app['color_primary']};
-            box-shadow: 0 15px 60px rgba{color_rgb_40};
-        }}
-
-        .feature-card:hover::before {{
-            opacity: 1;
-        }}
-
-        .feature-icon {{
-            font-size: 56px;
-            margin-bottom: 20px;
-        }}
-
-        .feature-card h3 {{
-            font-size: 26px;
-            margin-bottom: 15px;
-            color: {app['color_primary']};
-            font-weight: 700;
-        }}
-
-        .feature-card p {{
-            font-size: 17px;
-            line-height: 1.6;
-            color: rgba(255, 255, 255, 0.75);
-        }}
-
-        /* NEW: System Requirements */
-        .system-requirements {{
-            background: rgba(15, 15, 30, 0.4);
-            border: 1px solid rgba{color_rgb_30};
-            border-radius: 24px;
-            padding: 50px;
-            margin: 60px 0;
-        }}
-
-        .requirements-grid {{
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(300px, 1fr));
-            gap: 30px;
-            margin-top: 30px;
-        }}
-
-        .requirement-item {{
-            display: flex;
-            align-items: start;
-            gap: 15px;
-        }}
-
-        .requirement-icon {{
-            font-size: 32px;
-            flex-shrink: 0;
-        }}
-
-        .requirement-content h4 {{
-            color: {app['color_primary']};
-            font-size: 18px;
-            margin-bottom: 8px;
-        }}
-
-        .requirement-content p {{
-            color: rgba(255, 255, 255, 0.7);
-            font-size: 15px;
-            line-height: 1.5;
-        }}
-
-        /* NEW: Awards & Social Proof */
-        .awards-section {{
-            background: linear-gradient(135deg, rgba{color_rgb_20} 0%, rgba(15, 15, 30, 0.6) 100%);
-            border: 1px solid rgba{color_rgb_30};
-            border-radius: 24px;
-            padding: 60px 40px;
-            margin: 60px 0;
-            text-align: center;
-        }}
-
-        .awards-grid {{
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(250px, 1fr));
-            gap: 40px;
-            margin-top: 40px;
-        }}
-
-        .award-badge {{
-            background: rgba(255, 215, 0, 0.1);
-            border: 2px solid rgba(255, 215, 0, 0.3);
-            border-radius: 16px;
-            padding: 30px 20px;
-            transition: all 0.3s ease;
-        }}
-
-        .award-badge:hover {{
-            transform: translateY(-5px);
-            border-color: rgba(255, 215, 0, 0.6);
-        }}
-
-        .award-icon {{
-            font-size: 48px;
-            margin-bottom: 15px;
-        }}
-
-        .award-title {{
-            font-size: 18px;
-            font-weight: 700;
-            color: {app['color_primary']};
-            margin-bottom: 5px;
-        }}
-
-        .award-subtitle {{
-            font-size: 14px;
-            color: rgba(255, 255, 255, 0.6);
-        }}
-
-        /* NEW: Testimonials */
-        .testimonials-section {{
-            margin: 80px 0;
-        }}
-
-        .testimonials-grid {{
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(350px, 1fr));
-            gap: 30px;
-            margin-top: 40px;
-        }}
-
-        .testimonial-card {{
-            background: rgba(15, 15, 30, 0.4);
-            border: 1px solid rgba{color_rgb_30};
-            border-radius: 20px;
-            padding: 35px;
-            position: relative;
-        }}
-
-        .testimonial-quote {{
-            font-size: 17px;
-            line-height: 1.7;
-            color: rgba(255, 255, 255, 0.85);
-            margin-bottom: 20px;
-            font-style: italic;
-        }}
-
-        .testimonial-quote::before {{
-            content: '"';
-            font-size: 48px;
-            color: {app['color_primary']};
-            position: absolute;
-            top: 20px;
-            left: 20px;
-            opacity: 0.3;
-        }}
-
-        .testimonial-author {{
-            display: flex;
-            align-items: center;
-            gap: 12px;
-        }}
-
-        .author-avatar {{
-            width: 50px;
-            height: 50px;
-            background: {app['color_primary']};
-            border-radius: 50%;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            font-weight: 700;
-            font-size: 20px;
-        }}
-
-        .author-info {{
-            flex: 1;
-        }}
-
-        .author-name {{
-            font-weight: 700;
-            color: rgba(255, 255, 255, 0.95);
-            margin-bottom: 3px;
-        }}
-
-        .author-stars {{
-            color: #ffd700;
-            font-size: 14px;
-        }}
-
-        /* NEW: Community Section */
-        .community-section {{
-            background: linear-gradient(135deg, rgba{color_rgb_30} 0%, rgba(15, 15, 30, 0.6) 100%);
-            border: 1px solid rgba{color_rgb_30};
-            border-radius: 24px;
-            padding: 60px 40px;
-            margin: 60px 0;
-            text-align: center;
-        }}
-
-        .community-links {{
-            display: flex;
-            gap: 20px;
-            justify-content: center;
-            flex-wrap: wrap;
-            margin-top: 30px;
-        }}
-
-        .community-link {{
-            background: rgba(255, 255, 255, 0.05);
-            border: 2px solid rgba(255, 255, 255, 0.2);
-            border-radius: 16px;
-            padding: 20px 35px;
-            text-decoration: none;
-            color: rgba(255, 255, 255, 0.9);
-            font-weight: 600;
-            transition: all 0.3s ease;
-            display: flex;
-            align-items: center;
-            gap: 10px;
-        }}
-
-        .community-link:hover {{
-            background: rgba{color_rgb_30};
-            border-color: {app['color_primary']};
-            transform: translateY(-3px);
-        }}
-
-        .community-icon {{
-            font-size: 24px;
-        }}
-
-        /* NEW: Age Rating */
-        .age-rating {{
-            display: inline-flex;
-            align-items: center;
-            gap: 15px;
-            background: rgba(15, 15, 30, 0.6);
-            border: 2px solid rgba(255, 255, 255, 0.2);
-            border-radius: 16px;
-            padding: 15px 30px;
-            margin-top: 20px;
-        }}
-
-        .rating-badge {{
-            background: {app['color_primary']};
-            color: white;
-            font-weight: 900;
-            font-size: 24px;
-            padding: 10px 15px;
-            border-radius: 8px;
-        }}
-
-        .rating-text {{
-            font-size: 14px;
-            color: rgba(255, 255, 255, 0.8);
-            text-align: left;
-        }}
-
-        /* Screenshots */
-        .screenshots-grid {{
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(450px, 1fr));
-            gap: 30px;
-            margin-bottom: 60px;
-        }}
-
-        .screenshot-card {{
-            background: rgba(15, 15, 30, 0.4);
-            border: 2px solid rgba{color_rgb_30};
-            border-radius: 20px;
-            padding: 25px;
-            backdrop-filter: blur(10px);
-            transition: all 0.3s ease;
-            cursor: pointer;
-        }}
-
-        .screenshot-card:hover {{
-            border-color: {app['color_primary']};
-            transform: scale(1.02);
-        }}
-
-        .screenshot-placeholder {{
-            width: 100%;
-            aspect-ratio: 16 / 9;
-            background: linear-gradient(135deg, rgba{color_rgb_30} 0%, rgba(15, 15, 30, 0.8) 100%);
-            border-radius: 16px;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            color: rgba(255, 255, 255, 0.5);
-            font-size: 20px;
-            font-weight: 600;
-            border: 2px dashed rgba{color_rgb_40};
-        }}
-
-        /* NEW: Developer Section */
-        .developer-section {{
-            background: rgba(15, 15, 30, 0.3);
-            border: 1px solid rgba{color_rgb_30};
-            border-radius: 20px;
-            padding: 40px;
-            margin: 60px 0;
-        }}
-
-        .developer-content {{
-            display: flex;
-            gap: 40px;
-            align-items: center;
-            flex-wrap: wrap;
-        }}
-
-        .developer-logo {{
-            width: 100px;
-            height: 100px;
-            background: {app['color_primary']};
-            border-radius: 20px;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            font-size: 48px;
-            flex-shrink: 0;
-        }}
-
-        .developer-info {{
-            flex: 1;
-        }}
-
-        .developer-info h3 {{
-            font-size: 24px;
-            color: {app['color_primary']};
-            margin-bottom: 10px;
-        }}
-
-        .developer-info p {{
-            color: rgba(255, 255, 255, 0.7);
-            line-height: 1.6;
-            margin-bottom: 15px;
-        }}
-
-        .developer-links {{
-            display: flex;
-            gap: 15px;
-            flex-wrap: wrap;
-        }}
-
-        .developer-link {{
-            color: {app['color_primary']};
-            text-decoration: none;
-            font-weight: 600;
-            font-size: 14px;
-            transition: opacity 0.3s ease;
-        }}
-
-        .developer-link:hover {{
-            opacity: 0.7;
-        }}
-
-        /* Footer */
-        footer {{
-            text-align: center;
-            padding: 80px 20px;
-            border-top: 1px solid rgba{color_rgb_30};
-            margin-top: 120px;
-        }}
-
-        footer p {{
-            color: rgba(255, 255, 255, 0.5);
-            font-size: 15px;
-            margin-bottom: 10px;
-        }}
-
-        .footer-links {{
-            display: flex;
-            gap: 20px;
-            justify-content: center;
-            margin-top: 20px;
-        }}
-
-        .footer-link {{
-            color: rgba(255, 255, 255, 0.5);
-            text-decoration: none;
-            font-size: 14px;
-            transition: color 0.3s ease;
-        }}
-
-        .footer-link:hover {{
-            color: {app['color_primary']};
-        }}
-
-        /* Responsive */
-        @media (max-width: 768px) {{
-            h1 {{
-                font-size: 48px;
-            }}
-
-            .tagline {{
-                font-size: 24px;
-            }}
-
-            .section-title {{
-                font-size: 36px;
-            }}
-
-            .price-tag {{
-                font-size: 48px;
-            }}
-
-            .features-grid,
-            .screenshots-grid,
-            .testimonials-grid {{
-                grid-template-columns: 1fr;
-            }}
-
-            .cta-buttons {{
-                flex-direction: column;
-                align-items: stretch;
-            }}
-
-            .game-metadata {{
-                gap: 20px;
-            }}
-
-            .developer-content {{
-                flex-direction: column;
-                text-align: center;
-            }}
-
-            .community-links {{
-                flex-direction: column;
-            }}
-        }}
-    </style>
-</head>
-<body>
-    <!-- 3D Depth Layers -->
-    <div class="depth-layer depth-layer-1"></div>
-    <div class="depth-layer depth-layer-2"></div>
-    <div class="depth-layer depth-layer-3"></div>
-
-    <div class="container">
-        <!-- Hero Section -->
-        <section class="hero">
-            <div class="genre-badge">{app['genre']}</div>
-
-            <div class="logo-container">
-                <div class="logo-icon">{app['logo']}</div>
-            </div>
-
-            <h1>{app['title']}</h1>
-            <p class="tagline">{app['tagline']}</p>
-            <p class="hero-message">
-                {app['hero_message']}
-            </p>
-        </section>
-
-        <!-- NEW: Pricing Section -->
-        <section class="pricing-section">
-            {"<div class=\"demo-badge\">✨ Free Demo Available</div>" if free_demo else ""}
-            <div class="price-tag">{price}</div>
-            <p class="price-subtitle">{"Plus In-App Purchases" if "FREE" in price else "One-Time Purchase • No Subscriptions"}</p>
-
-            <div class="cta-buttons">
-                <a href="#" class="cta-primary">📱 Download on App Store</a>
-                <a href="#" class="cta-secondary">🎬 Watch Trailer</a>
-                <a href="#" class="cta-wishlist">❤️ Add to Wishlist</a>
-            </div>
-
-            <div class="age-rating">
-                <div class="rating-badge">{rating_code}</div>
-                <div class="rating-text">
-                    <strong>{rating_desc}</strong><br>
-                    Accessibility: Subtitles, Colorblind Mode, Seated Play
-                </div>
-            </div>
-        </section>
-
-        <!-- Game Metadata -->
-        <section class="game-metadata">
-            <div class="metadata-item">
-                <span class="metadata-value">{app['player_count']}</span>
-                <span class="metadata-label">Players</span>
-            </div>
-            <div class="metadata-item">
-                <span class="metadata-value">⭐ {app['rating']}</span>
-                <span class="metadata-label">Rating</span>
-            </div>
-            <div class="metadata-item">
-                <span class="metadata-value">{app['intensity']}</span>
-                <span class="metadata-label">Intensity</span>
-            </div>
-            <div class="metadata-item">
-                <span class="metadata-value">{app['space_needed']}</span>
-                <span class="metadata-label">Space</span>
-            </div>
-        </section>
-
-        <!-- NEW: Video Section -->
-        <section class="video-section">
-            <h2 class="section-title">GAMEPLAY TRAILER</h2>
-            <div class="video-container">
-                <div class="video-placeholder">
-                    <div class="play-button"></div>
-                    <p>Official Gameplay Trailer</p>
-                    <p style="font-size: 14px; color: rgba(255, 255, 255, 0.5); margin-top: 10px;">
-                        Watch spatial gameplay in action
-                    </p>
-                </div>
-            </div>
-        </section>
-
-        <!-- Game Modes -->
-        <section class="section">
-            <h2 class="section-title">GAME MODES</h2>
-            <div class="modes-grid">
-{modes_html}            </div>
-        </section>
-
-        <!-- Gameplay Features -->
-        <section class="section">
-            <h2 class="section-title">EPIC GAMEPLAY FEATURES</h2>
-            <div class="features-grid">
-{features_html}            </div>
-        </section>
-
-        <!-- NEW: Awards & Social Proof -->
-        <section class="awards-section">
-            <h2 class="section-title">AWARDS & RECOGNITION</h2>
-            <div class="awards-grid">
-                <div class="award-badge">
-                    <div class="award-icon">🏆</div>
-                    <div class="award-title">Best VR Game 2024</div>
-                    <div class="award-subtitle">Vision Pro Awards</div>
-                </div>
-                <div class="award-badge">
-                    <div class="award-icon">⭐</div>
-                    <div class="award-title">Editor's Choice</div>
-                    <div class="award-subtitle">App Store Featured</div>
-                </div>
-                <div class="award-badge">
-                    <div class="award-icon">🎮</div>
-                    <div class="award-title">Game of the Month</div>
-                    <div class="award-subtitle">Spatial Gaming Weekly</div>
-                </div>
-            </div>
-        </section>
-
-        <!-- NEW: Testimonials -->
-        <section class="testimonials-section">
-            <h2 class="section-title">PLAYER REVIEWS</h2>
-            <div class="testimonials-grid">
-                <div class="testimonial-card">
-                    <p class="testimonial-quote">{testimonials[0]['quote']}</p>
-                    <div class="testimonial-author">
-                        <div class="author-avatar">{testimonials[0]['name'][0]}</div>
-                        <div class="author-info">
-                            <div class="author-name">{testimonials[0]['name']}</div>
-                            <div class="author-stars">⭐⭐⭐⭐⭐</div>
-                        </div>
-                    </div>
-                </div>
-                <div class="testimonial-card">
-                    <p class="testimonial-quote">{testimonials[1]['quote']}</p>
-                    <div class="testimonial-author">
-                        <div class="author-avatar">{testimonials[1]['name'][0]}</div>
-                        <div class="author-info">
-                            <div class="author-name">{testimonials[1]['name']}</div>
-                            <div class="author-stars">⭐⭐⭐⭐⭐</div>
-                        </div>
-                    </div>
-                </div>
-                <div class="testimonial-card">
-                    <p class="testimonial-quote">{testimonials[2]['quote']}</p>
-                    <div class="testimonial-author">
-                        <div class="author-avatar">{testimonials[2]['name'][0]}</div>
-                        <div class="author-info">
-                            <div class="author-name">{testimonials[2]['name']}</div>
-                            <div class="author-stars">⭐⭐⭐⭐⭐</div>
-                        </div>
-                    </div>
-                </div>
-            </div>
-        </section>
-
-        <!-- Screenshots -->
-        <section class="section">
-            <h2 class="section-title">GAMEPLAY GALLERY</h2>
-            <div class="screenshots-grid">
-                <div class="screenshot-card">
-                    <div class="screenshot-placeholder">ACTION SCREENSHOT</div>
-                </div>
-                <div class="screenshot-card">
-                    <div class="screenshot-placeholder">COMBAT MOMENT</div>
-                </div>
-                <div class="screenshot-card">
-                    <div class="screenshot-placeholder">SPECIAL ABILITY</div>
-                </div>
-                <div class="screenshot-card">
-                    <div class="screenshot-placeholder">MULTIPLAYER ACTION</div>
-                </div>
-            </div>
-        </section>
-
-        <!-- NEW: System Requirements -->
-        <section class="system-requirements">
-            <h2 class="section-title">SYSTEM REQUIREMENTS</h2>
-            <div class="requirements-grid">
-                <div class="requirement-item">
-                    <div class="requirement-icon">📱</div>
-                    <div class="requirement-content">
-                        <h4>Device</h4>
-                        <p>Apple Vision Pro with visionOS 1.0 or later</p>
-                    </div>
-                </div>
-                <div class="requirement-item">
-                    <div class="requirement-icon">💾</div>
-                    <div class="requirement-content">
-                        <h4>Storage</h4>
-                        <p>3.5 GB available space required</p>
-                    </div>
-                </div>
-                <div class="requirement-item">
-                    <div class="requirement-icon">🎮</div>
-                    <div class="requirement-content">
-                        <h4>Controls</h4>
-                        <p>Hand tracking or compatible controllers</p>
-                    </div>
-                </div>
-                <div class="requirement-item">
-                    <div class="requirement-icon">📏</div>
-                    <div class="requirement-content">
-                        <h4>Play Space</h4>
-                        <p>{app['space_needed']} • 2m x 2m recommended</p>
-                    </div>
-                </div>
-                <div class="requirement-item">
-                    <div class="requirement-icon">🌐</div>
-                    <div class="requirement-content">
-                        <h4>Internet</h4>
-                        <p>Required for multiplayer and updates</p>
-                    </div>
-                </div>
-                <div class="requirement-item">
-                    <div class="requirement-icon">♿</div>
-                    <div class="requirement-content">
-                        <h4>Accessibility</h4>
-                        <p>Subtitles, colorblind mode, seated play option</p>
-                    </div>
-                </div>
-            </div>
-        </section>
-
-        <!-- NEW: Community Section -->
-        <section class="community-section">
-            <h2 class="section-title">JOIN THE COMMUNITY</h2>
-            <p style="font-size: 18px; color: rgba(255, 255, 255, 0.8); margin-bottom: 10px;">
-                Connect with thousands of players worldwide
-            </p>
-            <div class="community-links">
-                <a href="#" class="community-link">
-                    <span class="community-icon">💬</span>
-                    <span>Discord Server</span>
-                </a>
-                <a href="#" class="community-link">
-                    <span class="community-icon">🐦</span>
-                    <span>Twitter/X</span>
-                </a>
-                <a href="#" class="community-link">
-                    <span class="community-icon">📺</span>
-                    <span>YouTube</span>
-                </a>
-                <a href="#" class="community-link">
-                    <span class="community-icon">👾</span>
-                    <span>Reddit</span>
-                </a>
-            </div>
-        </section>
-
-        <!-- NEW: Developer Section -->
-        <section class="developer-section">
-            <div class="developer-content">
-                <div class="developer-logo">🎮</div>
-                <div class="developer-info">
-                    <h3>Spatial Games Studio</h3>
-                    <p>Pioneers of immersive spatial gaming experiences for Apple Vision Pro. Creating the future of interactive entertainment.</p>
-                    <div class="developer-links">
-                        <a href="#" class="developer-link">More Games →</a>
-                        <a href="#" class="developer-link">Press Kit →</a>
-                        <a href="#" class="developer-link">Contact Support →</a>
-                    </div>
-                </div>
-            </div>
-        </section>
-    </div>
-
-    <footer>
-        <p>&copy; 2024 {app['title']}. Experience the future of spatial gaming on Apple Vision Pro.</p>
-        <div class="footer-links">
-            <a href="#" class="footer-link">Privacy Policy</a>
-            <a href="#" class="footer-link">Terms of Service</a>
-            <a href="#" class="footer-link">Support</a>
-            <a href="#" class="footer-link">Press Kit</a>
-        </div>
-    </footer>
-</body>
-</html>"""
-
-    return html
-
-def main():
+    testimonials_html = render_fragments("fragments/testimonial_card.html", (
+        {"name": t["name"], "quote": t["quote"], "initial": t["name"][0]} for t in testimonials
+    ), locale)
+
+    return stream_template(
+        TEMPLATE,
+        locale,
+        app=app,
+        stylesheet_tags=stylesheet_tags(STYLESHEET, site),
+        design_tokens=design_tokens(STYLESHEET, site, primary=app['color_primary']),
+        price=_("FREE") if price == "FREE" else price,
+        demo_badge=f'<div class="demo-badge">{_("✨ Free Demo Available")}</div>' if free_demo else "",
+        price_subtitle=_("Plus In-App Purchases") if "FREE" in price else _("One-Time Purchase • No Subscriptions"),
+        rating_code=rating_code,
+        rating_desc=_(rating_desc),
+        features_html=features_html,
+        modes_html=modes_html,
+        gallery_html=gallery_html(app, site, [_(label) for label in GALLERY_PLACEHOLDERS]),
+        testimonials_html=testimonials_html,
+    )
+
+def main(argv=None):
     """Generate V2 gaming landing pages with all improvements"""
+    parser = add_build_arguments(argparse.ArgumentParser(description="Generate V2 gaming landing pages"))
+    args = parser.parse_args(argv)
+    apps = selected_apps(parser, args, CATALOG)
+
     print("=" * 80)
     print("GAMING LANDING PAGES V2.0 - COMPLETE PACKAGE")
     print("Implementing all immediate improvements from gap analysis")
@@ -1241,30 +149,20 @@ def main():
     print("=" * 80)
     print()
 
-    for i, app in enumerate(GAMING_APPS, 1):
-        app_dir = app['dir']
+    build = partial(
+        build_pages, render=generate_v2_html, base_dir="", jobs=args.jobs,
+        sources=[template_path(name) for name in (TEMPLATE, *FRAGMENTS)],
+        site=site_options(args, ""), stylesheets=[STYLESHEET], template=TEMPLATE,
+    )
+    results = build(apps, force=args.force)
 
-        # Create directories
-        docs_dir = os.path.join(app_dir, 'docs')
-        landing_dir = os.path.join(app_dir, 'landing-page')
-        os.makedirs(docs_dir, exist_ok=True)
-        os.makedirs(landing_dir, exist_ok=True)
-
-        # Generate V2 HTML
-        html_content = generate_v2_html(app)
-
-        # Write files
-        with open(os.path.join(docs_dir, 'index.html'), 'w', encoding='utf-8') as f:
-            f.write(html_content)
-        with open(os.path.join(landing_dir, 'index.html'), 'w', encoding='utf-8') as f:
-            f.write(html_content)
-
-        print(f"{i:2d}. ✅ {app['title']}")
+    for i, (app, paths, status) in enumerate(results, 1):
+        print(f"{i:2d}. ✅ {app['title']} ({status})")
         print(f"    {app['genre']} | ⭐{app['rating']} | {app['player_count']} players")
         print()
 
     print("=" * 80)
-    print(f"\n🎉 Successfully generated {len(GAMING_APPS)} V2.0 landing pages!")
+    print(f"\n🎉 Successfully generated {len(results)} V2.0 landing pages! ({summarize(results)})")
     print()
     print("CONVERSION OPTIMIZATIONS:")
     print("  📱 Clear pricing displayed")
@@ -1279,5 +177,8 @@ def main():
     print("Expected Impact: +150-250% conversion rate improvement")
     print("=" * 80)
 
+    if args.watch:
+        watch_pages(lambda: build(selected_apps(parser, args, CATALOG)), CATALOG)
+
 if __name__ == "__main__":
     main()
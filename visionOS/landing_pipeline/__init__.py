@@ -0,0 +1,3 @@
+"""
+Shared build pipeline for the visionOS landing-page generator scripts
+"""
@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+"""
+Render benchmark for the landing-page generators
+- Builds every catalog entry of each generator in memory with the stages a default build
+  runs (tree shaking, critical CSS, resource hints, budget and dropped-selector checks)
+- Each timed pass is run cold (fragment memo and disk cache emptied, so fragment templates
+  are rendered again) and warm (every fragment a cache hit); warmup passes are untimed
+- Reports per-page latency percentiles for both, bytes produced and tracemalloc peak memory
+- Compares against a stored baseline JSON and exits 1 when a metric regresses past --threshold
+
+Run from the visionOS directory:
+    python -m landing_pipeline.benchmark --save-baseline benchmark-baseline.json
+    python -m landing_pipeline.benchmark --baseline benchmark-baseline.json
+"""
+
+import argparse
+import importlib
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+VISIONOS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if VISIONOS_DIR not in sys.path:
+    sys.path.insert(0, VISIONOS_DIR)
+
+from landing_pipeline import fragments
+from landing_pipeline.budgets import BUDGETS_PATH, budget_for, check_budget, load_budgets
+from landing_pipeline.build import dropped_selectors, generator_source, render_page, stage_site
+from landing_pipeline.compress import precompressors
+from landing_pipeline.catalog import load_catalog
+from landing_pipeline.templates import template_path
+
+# name: (generator module, render function)
+GENERATORS = {
+    "enhanced": ("generate_enhanced_gaming_apps", "generate_enhanced_html"),
+    "v2": ("generate_gaming_v2_complete", "generate_v2_html"),
+    "nongaming": ("generate_all_remaining_nongaming_apps", "create_landing_page"),
+    "batch_2": ("generate_batch_2_apps", "generate_landing_page"),
+    "batch_3": ("generate_batch_3_apps", "create_landing_page"),
+}
+
+PERCENTILES = (50, 90, 99)
+
+# (section, metric) pairs checked against the baseline; higher is worse for all of them
+COMPARED_METRICS = [
+    ("latency_ms", "p50"),
+    ("latency_ms", "p90"),
+    ("cold_latency_ms", "p50"),
+    ("cold_latency_ms", "p90"),
+    ("bytes", "total"),
+    ("memory_kb", "peak"),
+]
+
+def load_generator(name):
+    """(render function, catalog apps, generator module) for a GENERATORS entry"""
+    module_name, function_name = GENERATORS[name]
+    module = importlib.import_module(module_name)
+    return getattr(module, function_name), load_catalog(module.CATALOG), module
+
+def generator_site(render, module, options):
+    """(site, budget) for the stages build_pages() runs with these options"""
+    site = {**options, "base_dir": VISIONOS_DIR, "budgets": BUDGETS_PATH if options.get("budgets") else None}
+    sources = [generator_source(render), *(template_path(name) for name in (module.TEMPLATE, *module.FRAGMENTS))]
+    site, _ = stage_site(site, sources, [module.STYLESHEET], module.TEMPLATE)
+    budget = budget_for(load_budgets(site["budgets"]), module.TEMPLATE) if site.get("budgets") else None
+    return site, budget
+
+def percentile(sorted_values, pct):
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, -(-pct * len(sorted_values) // 100))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+def drain_page(page, site):
+    """Consume a rendered page's chunks as the writer would (through the encoders with precompress); returns bytes"""
+    encoders = precompressors() if site.get("precompress") else {}
+    size = 0
+    for chunk in page["chunks"]:
+        data = chunk.encode("utf-8")
+        size += len(data)
+        for feed, _ in encoders.values():
+            feed(data)
+    for _, finish in encoders.values():
+        finish()
+    return size
+
+def build_in_memory(render, app, site, budget):
+    """Render and check one page as build_page() does, draining it instead of writing; returns bytes"""
+    page = render_page(render, app, site)
+    if "html" in page:
+        check_budget(page, budget)
+        dropped_selectors(page["html"], site)
+    return drain_page(page, site)
+
+@contextmanager
+def cold_fragment_cache():
+    """Empty fragment memo and a fresh disk cache for the with-block; the real cache is left alone"""
+    saved_dir, saved_memory = fragments.FRAGMENT_CACHE_DIR, dict(fragments._memory)
+    fragments._memory.clear()
+    with tempfile.TemporaryDirectory(prefix="fragment-cache-") as directory:
+        fragments.FRAGMENT_CACHE_DIR = directory
+        try:
+            yield
+        finally:
+            fragments.FRAGMENT_CACHE_DIR = saved_dir
+            fragments._memory.clear()
+            fragments._memory.update(saved_memory)
+
+def latency_summary(latencies):
+    latencies = sorted(latencies)
+    return {
+        **{f"p{pct}": round(percentile(latencies, pct), 4) for pct in PERCENTILES},
+        "mean": round(sum(latencies) / len(latencies), 4),
+        "max": round(latencies[-1], 4),
+    }
+
+def timed_pass(render, apps, site, budget, latencies, sizes):
+    for app in apps:
+        start = time.perf_counter()
+        sizes[app["dir"]] = build_in_memory(render, app, site, budget)
+        latencies.append((time.perf_counter() - start) * 1000)
+
+def measure_memory(render, apps, site, budget):
+    """Peak traced allocation (KB) while building the whole catalog once"""
+    tracemalloc.start()
+    try:
+        for app in apps:
+            build_in_memory(render, app, site, budget)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak / 1024
+
+def benchmark_generator(name, warmup=1, repeat=5, site=None):
+    """Time every page of one generator, cold and warm; returns a JSON-ready result dict"""
+    render, apps, module = load_generator(name)
+    site, budget = generator_site(render, module, site or {})
+
+    for _ in range(warmup):
+        for app in apps:
+            build_in_memory(render, app, site, budget)
+
+    cold, warm = [], []
+    sizes = {}
+    for _ in range(repeat):
+        with cold_fragment_cache():
+            timed_pass(render, apps, site, budget, cold, sizes)
+        timed_pass(render, apps, site, budget, warm, sizes)
+
+    return {
+        "apps": len(apps),
+        "runs": repeat,
+        "latency_ms": latency_summary(warm),
+        "cold_latency_ms": latency_summary(cold),
+        "bytes": {
+            "total": sum(sizes.values()),
+            "mean_page": round(sum(sizes.values()) / len(sizes)),
+            "max_page": max(sizes.values()),
+        },
+        "memory_kb": {"peak": round(measure_memory(render, apps, site, budget), 1)},
+    }
+
+def run_benchmarks(names, warmup=1, repeat=5, site=None):
+    """Benchmark several generators and wrap the results with environment details"""
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "warmup": warmup,
+        "repeat": repeat,
+        "site": site or {},
+        "generators": {name: benchmark_generator(name, warmup, repeat, site) for name in names},
+    }
+
+def compare_to_baseline(results, baseline, threshold):
+    """List of regression messages for metrics more than threshold (fraction) above the baseline"""
+    regressions = []
+    for name, current in results["generators"].items():
+        previous = baseline.get("generators", {}).get(name)
+        if not previous:
+            continue
+        for section, metric in COMPARED_METRICS:
+            old = previous.get(section, {}).get(metric)
+            new = current[section][metric]
+            if old and new > old * (1 + threshold):
+                regressions.append(
+                    f"{name}: {section}.{metric} {old} → {new} (+{100 * (new - old) / old:.0f}%, limit +{100 * threshold:.0f}%)"
+                )
+    return regressions
+
+def print_results(results):
+    header = (
+        f"{'generator':<10} {'apps':>4} {'cold p50':>8} {'cold p90':>8} {'p50 ms':>8} {'p90 ms':>8} {'p99 ms':>8} "
+        f"{'KB/page':>8} {'peak KB':>8}"
+    )
+    print(header)
+    print("-" * len(header))
+    for name, result in results["generators"].items():
+        latency, cold = result["latency_ms"], result["cold_latency_ms"]
+        print(
+            f"{name:<10} {result['apps']:>4} {cold['p50']:>8.3f} {cold['p90']:>8.3f} {latency['p50']:>8.3f} {latency['p90']:>8.3f} {latency['p99']:>8.3f} "
+            f"{result['bytes']['mean_page'] / 1024:>8.1f} {result['memory_kb']['peak']:>8.1f}"
+        )
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the landing-page render functions")
+    parser.add_argument(
+        "generators", nargs="*", metavar="GENERATOR",
+        help=f"generators to run (default: all of {', '.join(GENERATORS)})",
+    )
+    parser.add_argument("--warmup", type=int, default=1, metavar="N", help="untimed passes over the catalog (default: 1)")
+    parser.add_argument(
+        "--repeat", type=int, default=5, metavar="N", help="timed cold and warm passes over the catalog (default: 5)",
+    )
+    parser.add_argument("--minify", action="store_true", help="include the minification stage")
+    parser.add_argument("--precompress", action="store_true", help="include the gzip/brotli stage")
+    parser.add_argument("--keep-unused-css", action="store_true", help="skip tree shaking, as the generators' flag does")
+    parser.add_argument("--no-critical-css", action="store_true", help="skip critical CSS, as the generators' flag does")
+    parser.add_argument(
+        "--no-resource-hints", action="store_true", help="skip resource hints, as the generators' flag does",
+    )
+    parser.add_argument("--no-budgets", action="store_true", help="skip the budget check, as the generators' flag does")
+    parser.add_argument("--output", metavar="FILE", help="write the results as JSON")
+    parser.add_argument("--save-baseline", metavar="FILE", help="write the results as the new baseline")
+    parser.add_argument("--baseline", metavar="FILE", help="compare against a baseline written by --save-baseline")
+    parser.add_argument(
+        "--threshold", type=float, default=0.5, metavar="FRACTION",
+        help="allowed growth over the baseline before failing, e.g. 0.5 = +50%% (default: 0.5)",
+    )
+    args = parser.parse_args(argv)
+    if args.repeat < 1:
+        parser.error("--repeat must be at least 1")
+    unknown = [name for name in args.generators if name not in GENERATORS]
+    if unknown:
+        parser.error(f"unknown generator(s): {', '.join(unknown)} (choose from {', '.join(GENERATORS)})")
+
+    site = {
+        "minify": args.minify,
+        "precompress": args.precompress,
+        "tree_shake": not args.keep_unused_css,
+        "critical_css": not args.no_critical_css,
+        "resource_hints": not args.no_resource_hints,
+        "budgets": not args.no_budgets,
+    }
+    results = run_benchmarks(args.generators or list(GENERATORS), args.warmup, args.repeat, site)
+    print_results(results)
+
+    for path in filter(None, (args.output, args.save_baseline)):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+            f.write("\n")
+        print(f"\nResults written to {path}")
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        if baseline.get("site") != results["site"]:
+            print(f"\n⚠️  Baseline was recorded with different options: {baseline.get('site')}")
+        regressions = compare_to_baseline(results, baseline, args.threshold)
+        if regressions:
+            print(f"\n❌ {len(regressions)} regression(s) against {args.baseline}:")
+            for message in regressions:
+                print(f"  {message}")
+            return 1
+        print(f"\n✅ No regressions against {args.baseline} (threshold +{100 * args.threshold:.0f}%)")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Page weight budgets checked while the landing pages are generated
+- Output bytes are attributed to sections: inline CSS, inline JS and each
+  <section>/<header>/<nav>/<footer> (named by id, else by class without '-section')
+- landing_templates/budgets.json sets, per template (KB): page_kb for the HTML document,
+  stylesheet_kb for its shared stylesheet and sections_kb for individual sections
+- Pages over budget are not written; the build fails with a per-section breakdown
+"""
+
+import json
+import os
+import re
+
+from landing_pipeline.templates import TEMPLATE_DIR
+
+BUDGETS_PATH = os.path.join(TEMPLATE_DIR, "budgets.json")
+
+# Budget entry used for templates without their own
+DEFAULT_KEY = "*"
+
+INLINE_CSS = "inline-css"
+INLINE_JS = "inline-js"
+OTHER = "other"
+
+INLINE_STYLE = re.compile(r"(<style\b[^>]*>)(.*?)(</style\s*>)", re.S | re.I)
+INLINE_SCRIPT = re.compile(r"(<script\b(?![^>]*\bsrc\s*=)[^>]*>)(.*?)(</script\s*>)", re.S | re.I)
+SECTION = re.compile(r"<(section|header|nav|footer)\b([^>]*)>.*?</\1\s*>", re.S | re.I)
+ATTRIBUTE = re.compile(r"""\b(id|class)\s*=\s*["']([^"']*)["']""", re.I)
+
+class BudgetExceeded(SystemExit):
+    """Raised by the build when pages exceed their budget; exits the generator with status 1"""
+
+def _size(text):
+    return len(text.encode("utf-8"))
+
+def section_name(tag, attributes):
+    """'hero' for <section class="hero">, 'pricing' for class="pricing-section", 'features' for id="features" """
+    found = {key.lower(): value.split()[0] for key, value in ATTRIBUTE.findall(attributes) if value.strip()}
+    if "id" in found:
+        return found["id"]
+    if "class" in found and found["class"] != "section":
+        return re.sub(r"-section$", "", found["class"])
+    return tag.lower()
+
+def page_breakdown(html):
+    """{section name: bytes} for a rendered page; the values add up to the page size"""
+    breakdown = {}
+
+    def measure(name):
+        def strip(match):
+            breakdown[name] = breakdown.get(name, 0) + _size(match.group(2))
+            return match.group(1) + match.group(3)
+        return strip
+
+    rest = INLINE_STYLE.sub(measure(INLINE_CSS), html)
+    rest = INLINE_SCRIPT.sub(measure(INLINE_JS), rest)
+    for match in SECTION.finditer(rest):
+        name = section_name(match.group(1), match.group(2))
+        breakdown[name] = breakdown.get(name, 0) + _size(match.group(0))
+    breakdown[OTHER] = _size(html) - sum(breakdown.values())
+    return breakdown
+
+def load_budgets(path=BUDGETS_PATH):
+    """Parse a budgets file; the default file is optional, one passed with --budgets is not"""
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        if path != BUDGETS_PATH:
+            raise
+        return {}
+
+def budget_for(budgets, template):
+    """Budget entry for a template, falling back to the '*' entry"""
+    if not budgets:
+        return None
+    return budgets.get(template) or budgets.get(DEFAULT_KEY)
+
+def check_budget(page, budget):
+    """List of violations, e.g. 'hero: 3.41 KB > 3 KB'; empty when the page fits"""
+    if not budget:
+        return []
+    violations = []
+    page_kb = budget.get("page_kb")
+    if page_kb is not None and page["size"] > page_kb * 1024:
+        violations.append(f"page: {page['size'] / 1024:.2f} KB > {page_kb} KB")
+    for name, limit_kb in budget.get("sections_kb", {}).items():
+        size = page["sections"].get(name, 0)
+        if size > limit_kb * 1024:
+            violations.append(f"{name}: {size / 1024:.2f} KB > {limit_kb} KB")
+    return violations
+
+def check_stylesheet_budget(name, size, budget):
+    """Violation message when a shared stylesheet exceeds the template's stylesheet_kb, else None"""
+    limit_kb = (budget or {}).get("stylesheet_kb")
+    if limit_kb is not None and size > limit_kb * 1024:
+        return f"stylesheet {name}: {size / 1024:.2f} KB > {limit_kb} KB"
+    return None
+
+def format_breakdown(page, budget=None):
+    """Indented per-section table, largest first, with the budget next to each section"""
+    limits = (budget or {}).get("sections_kb", {})
+    lines = []
+    for name, size in sorted(page["sections"].items(), key=lambda item: -item[1]):
+        limit = f" / {limits[name]} KB" if name in limits else ""
+        flag = " ❌" if name in limits and size > limits[name] * 1024 else ""
+        lines.append(f"      {name:<22} {size / 1024:>6.1f} KB{limit}{flag}")
+    page_kb = (budget or {}).get("page_kb")
+    total = f" / {page_kb} KB" if page_kb is not None else ""
+    lines.append(f"      {'total':<22} {page['size'] / 1024:>6.1f} KB{total}")
+    return "\n".join(lines)
@@ -0,0 +1,553 @@
+#!/usr/bin/env python3
+"""
+Build driver shared by the landing-page generators
+- Renders the selected catalog entries (--only / --genre), optionally across a process pool (--jobs N)
+- Writes each page inside the worker that rendered it, through the gzip/brotli encoders in
+  one pass, atomically and only when the bytes changed; the landing-page/ copy is a hardlink
+  of docs/ (output.py). Workers return metadata only, so memory stays flat however large the
+  catalog is. Template chunks stream straight to disk only when no whole-page stage is on
+  (--no-resource-hints --no-budgets --keep-unused-css, without --minify); default builds
+  join each page once
+- Skips apps whose catalog entry, generator and pipeline sources are unchanged (build manifest)
+- Checks every page against its template's weight budget before writing it
+- Tree-shakes the shared stylesheets down to the selectors the generator's markup uses
+- Inlines the first screen's critical CSS and defers the rest (per-template config)
+- Adds preconnect/preload hints and lazy-loading attributes to the rendered pages
+- Publishes resized WebP/AVIF screenshot variants next to the pages that show them
+- Publishes the shared fingerprinted stylesheets the pages link to
+- Builds every --locales locale from one shared setup; non-English pages go to docs/<locale>/
+  and landing-page/<locale>/ and are tracked in the manifest per locale
+- Refreshes the visionOS portfolio index and its search index from every catalog (portfolio.py)
+- Times every page and build stage: --report FILE writes them as JSON, --profile FILE
+  dumps a cProfile (or pyinstrument, for .html) profile of the build (report.py)
+- Returns results in catalog order so console summaries stay deterministic
+"""
+
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from landing_pipeline.catalog import CatalogError, select_apps
+from landing_pipeline import fragments, images
+from landing_pipeline.budgets import (
+    BUDGETS_PATH, BudgetExceeded, budget_for, check_budget, check_stylesheet_budget, format_breakdown, load_budgets,
+    page_breakdown,
+)
+from landing_pipeline.compress import ALL_SUFFIXES, precompressors
+from landing_pipeline.critical import CRITICAL_CONFIG_PATH, load_critical_config
+from landing_pipeline.hints import add_resource_hints, format_hint_report
+from landing_pipeline.images import image_settings, publish_screenshots, source_screenshots
+from landing_pipeline.locales import DEFAULT_LOCALE, locale_path, parse_locales
+from landing_pipeline.manifest import BuildManifest, hash_bytes, source_hash
+from landing_pipeline.minify import minify_html
+from landing_pipeline.output import UNCHANGED, format_output_report, remove_file, write_stream
+from landing_pipeline.portfolio import update_portfolio
+from landing_pipeline.report import build_report, lap, page_entry, profiled, timestamp, write_report
+from landing_pipeline.stylesheets import load_stylesheet, publish_stylesheet, stylesheet_path
+from landing_pipeline.treeshake import SAFELIST_PATH, load_safelist, source_selectors, unused_selectors
+
+REBUILT = "rebuilt"
+UP_TO_DATE = "up to date"
+OVER_BUDGET = "over budget"
+
+PIPELINE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Site options that change the bytes of a rendered page (part of the manifest fingerprint)
+OUTPUT_OPTIONS = ("asset_base", "minify", "precompress", "tree_shake", "critical", "resource_hints")
+
+def add_build_arguments(parser):
+    """Register the options every generator script understands"""
+    parser.add_argument(
+        "-j", "--jobs", type=int, default=1, metavar="N",
+        help="render pages in N worker processes (0 = one per CPU core, default: 1)",
+    )
+    parser.add_argument(
+        "--force", action="store_true",
+        help="rebuild every page even when the build manifest says it is up to date",
+    )
+    parser.add_argument(
+        "--asset-base", metavar="URL",
+        help="serve shared stylesheets from URL (e.g. https://cdn.example.com/visionos) "
+             "instead of copying them next to every page",
+    )
+    parser.add_argument(
+        "--asset-dir", metavar="DIR",
+        help="where to write shared stylesheets when --asset-base is set (default: <output>/assets)",
+    )
+    parser.add_argument(
+        "--minify", action="store_true",
+        help="minify HTML and inline/shared CSS and JS after rendering",
+    )
+    parser.add_argument(
+        "--precompress", action="store_true",
+        help="write .gz (and .br when the brotli module is installed) next to every output file",
+    )
+    parser.add_argument(
+        "--watch", action="store_true",
+        help="after building, rebuild affected pages whenever the catalog, templates or generator code change",
+    )
+    parser.add_argument(
+        "--locales", type=parse_locales, default=[DEFAULT_LOCALE], metavar="LIST",
+        help="comma-separated locales to build, e.g. en,fr or 'all' (default: en); "
+             "translations live in landing_templates/locales",
+    )
+    parser.add_argument(
+        "--only", action="append", metavar="DIR",
+        help="build only the app with this directory name (repeatable)",
+    )
+    parser.add_argument(
+        "--genre", action="append", metavar="GENRE",
+        help="build only apps whose genre is or contains the word GENRE, e.g. RPG (repeatable)",
+    )
+    parser.add_argument(
+        "--keep-unused-css", action="store_true",
+        help="publish the shared stylesheets without tree-shaking rules no page uses",
+    )
+    parser.add_argument(
+        "--no-critical-css", action="store_true",
+        help="link the shared stylesheets normally instead of inlining critical CSS",
+    )
+    parser.add_argument(
+        "--no-resource-hints", action="store_true",
+        help="skip the preconnect/preload and lazy-loading pass over rendered pages",
+    )
+    parser.add_argument(
+        "--budgets", metavar="FILE",
+        help="page weight budgets to enforce (default: landing_templates/budgets.json)",
+    )
+    parser.add_argument(
+        "--no-budgets", action="store_true",
+        help="write pages even when they exceed their weight budget",
+    )
+    parser.add_argument(
+        "--report", metavar="FILE",
+        help="write a JSON build report: per-page stage timings, bytes written, cache hits and skipped pages",
+    )
+    parser.add_argument(
+        "--profile", metavar="FILE",
+        help="profile the build into FILE (cProfile stats; pyinstrument HTML when FILE ends in .html)",
+    )
+    return parser
+
+def site_options(args, base_dir):
+    """Options that affect rendered output, passed to every render(app, site) call"""
+    return {
+        "asset_base": args.asset_base,
+        "asset_dir": args.asset_dir or os.path.join(base_dir, "assets"),
+        "minify": args.minify,
+        "precompress": args.precompress,
+        "tree_shake": not args.keep_unused_css,
+        "critical_css": not args.no_critical_css,
+        "resource_hints": not args.no_resource_hints,
+        "budgets": None if args.no_budgets else (args.budgets or BUDGETS_PATH),
+        "locales": args.locales,
+        "report": args.report,
+        "profile": args.profile,
+    }
+
+def selected_apps(parser, args, catalog):
+    """Catalog entries picked by --only / --genre; bad names or catalog errors exit via parser.error"""
+    try:
+        apps = select_apps(catalog, args.only, args.genre)
+    except CatalogError as e:
+        parser.error(str(e))
+    if not apps:
+        parser.error(f"no {catalog} apps match the --only / --genre filters")
+    return apps
+
+def resolve_jobs(jobs):
+    """Translate the --jobs value into a worker count"""
+    if jobs is None or jobs < 0:
+        return 1
+    if jobs == 0:
+        return os.cpu_count() or 1
+    return jobs
+
+def generator_source(render):
+    """Source file of the module that defines a render function"""
+    return os.path.abspath(sys.modules[render.__module__].__file__)
+
+def pipeline_sources():
+    """Every landing_pipeline module: any of them can change the bytes of a page"""
+    return sorted(os.path.join(PIPELINE_DIR, name) for name in os.listdir(PIPELINE_DIR) if name.endswith(".py"))
+
+def generator_name(render):
+    """Manifest key for a generator, stable even when run as __main__"""
+    return os.path.splitext(os.path.basename(generator_source(render)))[0]
+
+def page_paths(base_dir, app, locale=None):
+    """Output files for one app: docs/index.html and landing-page/index.html (docs/<locale>/... when localized)"""
+    app_dir = os.path.join(base_dir, app["dir"])
+    subdir = [locale] if locale and locale != DEFAULT_LOCALE else []
+    return [
+        os.path.join(app_dir, "docs", *subdir, "index.html"),
+        os.path.join(app_dir, "landing-page", *subdir, "index.html"),
+    ]
+
+def page_label(app, locale):
+    """How reports name one page: the app directory, plus the locale when it is not English"""
+    return app["dir"] if locale == DEFAULT_LOCALE else f"{app['dir']} [{locale}]"
+
+def manifest_key(generator, locale):
+    return generator if locale == DEFAULT_LOCALE else f"{generator}@{locale}"
+
+def needs_document(site):
+    """True when a post-render stage works on the whole page rather than a stream of chunks
+
+    Hints, budgets and tree shaking are on by default (minify is opt-in): hints go into
+    <head> but depend on the images further down, a page over budget must not be written,
+    and the tree-shaking check reads class attributes that span template chunks. Pages
+    only stream when all four are off.
+    """
+    return bool(site.get("resource_hints") or site.get("minify") or site.get("budgets") or site.get("used_selectors"))
+
+def render_page(render, app, site):
+    """Render one app and run the post-render stage; runs inside pool workers
+
+    page["chunks"] is what gets written. The template's chunks pass straight through
+    only when every stage in needs_document() is off; otherwise (the default) they are
+    joined once.
+    page["timings"] holds the milliseconds each stage took.
+    """
+    start = time.perf_counter()
+    timings = {}
+    hits, misses = fragments.stats["hits"], fragments.stats["misses"]
+    encoded, reused = images.stats["encoded"], images.stats["reused"]
+    chunks = render(app, site)
+    if isinstance(chunks, str):
+        chunks = (chunks,)
+    start = lap(timings, "render", start)
+    page = {
+        "fragment_hits": fragments.stats["hits"] - hits,
+        "fragment_misses": fragments.stats["misses"] - misses,
+        "images_encoded": images.stats["encoded"] - encoded,
+        "images_reused": images.stats["reused"] - reused,
+        "hints": {},
+        "sections": {},
+        "timings": timings,
+    }
+    if not needs_document(site):
+        page["chunks"] = chunks
+        return page
+    html = "".join(chunks)
+    page["raw_size"] = len(html.encode("utf-8"))
+    start = lap(timings, "render", start)
+    if site.get("resource_hints"):
+        page_dir = os.path.dirname(page_paths(site["base_dir"], app, site.get("locale"))[0]) if "base_dir" in site else None
+        html, page["hints"] = add_resource_hints(html, site.get("fold_after"), page_dir)
+        start = lap(timings, "hints", start)
+    if site.get("minify"):
+        html = minify_html(html)
+        start = lap(timings, "minify", start)
+    page["html"] = html
+    page["size"] = len(html.encode("utf-8"))
+    page["sections"] = page_breakdown(html)
+    lap(timings, "sections", start)
+    page["chunks"] = (html,)
+    return page
+
+def write_page(page, paths, site):
+    """Stream a rendered page and its precompressed siblings to paths; returns the output sink statuses
+
+    The first path gets the bytes and the other paths become hardlinks of it. Sets
+    page["digest"], page["size"] and page["encoded_sizes"] from what was written.
+    """
+    encoders = precompressors() if site.get("precompress") else {}
+    statuses, page["digest"], sizes = write_stream(page.pop("chunks"), paths, encoders)
+    page["size"] = sizes.pop("")
+    page.setdefault("raw_size", page["size"])
+    page["encoded_sizes"] = sizes
+    for suffix in ALL_SUFFIXES:
+        if suffix not in encoders:
+            statuses.extend(remove_file(path + suffix) for path in paths)
+    return statuses
+
+def dropped_selectors(html, site):
+    """{stylesheet: selectors the page uses that tree shaking removed} (e.g. markup from catalog data)"""
+    dropped = {}
+    for name, used in site.get("used_selectors", {}).items():
+        _, full_css = load_stylesheet(name)
+        found = unused_selectors(html, set(used), full_css)
+        if found:
+            dropped[name] = found
+    return dropped
+
+def build_page(render, app, site, budget=None):
+    """Render, check and write one app; runs inside pool workers and returns metadata only
+
+    Pages over budget are not written and keep their "violations".
+    """
+    page = render_page(render, app, site)
+    start = time.perf_counter()
+    page["violations"] = check_budget(page, budget) if "html" in page else []
+    if not page["violations"]:
+        page["dropped"] = dropped_selectors(page["html"], site) if "html" in page else {}
+        start = lap(page["timings"], "checks", start)
+        page["statuses"] = write_page(page, page_paths(site["base_dir"], app, site.get("locale")), site)
+        lap(page["timings"], "write", start)
+    page.pop("chunks", None)
+    page.pop("html", None)
+    return page
+
+def build_in_workers(tasks, render, jobs=1, budget=None):
+    """Yield (index, page metadata) for each (app, site) task in completion order"""
+    workers = min(resolve_jobs(jobs), len(tasks))
+    if workers <= 1:
+        for index, (app, site) in enumerate(tasks):
+            yield index, build_page(render, app, site, budget)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {
+            pool.submit(build_page, render, app, site, budget): index for index, (app, site) in enumerate(tasks)
+        }
+        for future in as_completed(futures):
+            yield futures[future], future.result()
+
+def format_size(size):
+    return f"{size / 1024:.1f} KB"
+
+def print_size_report(labels, pages):
+    """Per-page sizes before and after the post-render stage"""
+    print("Page sizes (rendered → written, precompressed):")
+    for label, page in zip(labels, pages):
+        if page is None:
+            continue
+        line = f"  {label}: {format_size(page['raw_size'])} → {format_size(page['size'])}"
+        if page["raw_size"]:
+            line += f" ({100 * (page['raw_size'] - page['size']) / page['raw_size']:.0f}% smaller)"
+        for suffix, size in sorted(page["encoded_sizes"].items()):
+            line += f", {suffix[1:]} {format_size(size)}"
+        print(line)
+    print()
+
+def print_fragment_report(pages):
+    """Fragment cache reuse across the pages rendered in this run"""
+    rendered = [page for page in pages if page is not None]
+    hits = sum(page["fragment_hits"] for page in rendered)
+    misses = sum(page["fragment_misses"] for page in rendered)
+    if hits or misses:
+        print(f"Fragment cache: {hits} reused, {misses} rendered\n")
+
+def print_image_report(pages):
+    """Screenshot variants encoded in this run versus reused from the image cache"""
+    rendered = [page for page in pages if page is not None]
+    encoded = sum(page["images_encoded"] for page in rendered)
+    reused = sum(page["images_reused"] for page in rendered)
+    if not (encoded or reused):
+        return
+    print(f"Screenshots: {encoded} variant(s) encoded, {reused} image(s) reused from cache")
+    if images.Image is None:
+        print("  ⚠️  Pillow is not installed: originals were published unresized (pip install Pillow)")
+    elif not images.available_formats():
+        print("  ⚠️  This Pillow build cannot encode WebP or AVIF: only JPEG/PNG variants were written")
+    print()
+
+def app_fingerprint(fingerprint, base_dir, app):
+    """Build fingerprint of one app: the shared one, plus its screenshot sources when it has any"""
+    screenshots = source_screenshots(base_dir, app)
+    if not screenshots:
+        return fingerprint
+    return hash_bytes((fingerprint + source_hash(screenshots) + image_settings()).encode("utf-8"))
+
+def print_hint_report(labels, pages):
+    """Resource hints and lazy-loading attributes added to the pages rendered in this run"""
+    lines = [
+        f"  {label}: {format_hint_report(page['hints'])}"
+        for label, page in zip(labels, pages)
+        if page is not None and format_hint_report(page["hints"])
+    ]
+    if not lines:
+        rendered = sum(1 for page in pages if page is not None)
+        if rendered:
+            print(f"Resource hints: nothing to add on {rendered} page(s)\n")
+        return
+    print("Resource hints added:")
+    print("\n".join(lines))
+    print()
+
+def publish_stylesheets(stylesheets, paths, site):
+    """Make the shared stylesheets available to pages written at paths"""
+    if site.get("asset_base"):
+        directories = [site["asset_dir"]]
+    else:
+        directories = sorted(set(os.path.dirname(path) for path in paths))
+    statuses = []
+    for name in stylesheets:
+        first = None
+        for directory in directories:
+            target, published = publish_stylesheet(name, directory, site, link_from=first)
+            first = first or target
+            statuses.extend(published)
+    return statuses
+
+def tree_shake_site(site, sources, stylesheets):
+    """Site options with the selectors each stylesheet keeps"""
+    used = source_selectors(sources)
+    safelist = load_safelist()
+    kept = {name: tuple(sorted(used | set(safelist.get(name, ())))) for name in stylesheets}
+    return {**site, "used_selectors": kept}
+
+def stage_site(site, sources, stylesheets, template):
+    """(site, sources) set up for the tree-shaking, critical-CSS and resource-hint stages
+
+    sources gains the config files and stylesheets those stages read.
+    """
+    sources = list(sources)
+    if site.get("tree_shake"):
+        site = tree_shake_site(site, sources, stylesheets)
+        if os.path.exists(SAFELIST_PATH):
+            sources.append(SAFELIST_PATH)
+    fold = load_critical_config().get(template) if template else None
+    if fold and (site.get("critical_css") or site.get("resource_hints")):
+        site = {**site, "fold_after": fold["fold_after"]}
+        sources.append(CRITICAL_CONFIG_PATH)
+        if site.get("critical_css"):
+            site["critical"] = {"template": template, **fold}
+    sources += map(stylesheet_path, stylesheets)
+    return site, sources
+
+def warn_dropped_selectors(label, page):
+    """Warn when a rendered page uses a selector tree shaking removed"""
+    for name, dropped in page["dropped"].items():
+        print(f"⚠️  {label} uses {', '.join(dropped)} but {name}.css was shaken without them; "
+              f"add them to landing_templates/css_safelist.json")
+
+def print_budget_failures(failures, budget):
+    """Breakdown of every page that exceeded its budget"""
+    print(f"❌ {len(failures)} page(s) over budget:")
+    for label, page, violations in failures:
+        print(f"  {label}: {'; '.join(violations)}")
+        print(format_breakdown(page, budget))
+    print()
+
+def build_pages(apps, render, base_dir, jobs=1, sources=(), force=False, site=None, stylesheets=(), template=None):
+    """Render and write every stale app in every locale; return [(app, paths, status)] in catalog order
+
+    paths covers all locales of an app; its status is over budget if any locale is,
+    else rebuilt if any locale was. Pages over the template's weight budget are left
+    unwritten and the build raises BudgetExceeded after the rest of the catalog has been written.
+    With site["profile"] set the whole build runs under the profiler.
+    """
+    profile = (site or {}).get("profile")
+    if not profile:
+        return _build_pages(apps, render, base_dir, jobs, sources, force, site, stylesheets, template)
+    with profiled(profile, resolve_jobs(jobs)):
+        return _build_pages(apps, render, base_dir, jobs, sources, force, site, stylesheets, template)
+
+def _build_pages(apps, render, base_dir, jobs, sources, force, site, stylesheets, template):
+    started = timestamp()
+    start = time.perf_counter()
+    stages = {}
+    site = {**(site or {}), "base_dir": str(base_dir)}
+    manifest = BuildManifest.load(base_dir)
+    generator = generator_name(render)
+    budget = None
+    if site.get("budgets"):
+        try:
+            budget = budget_for(load_budgets(site["budgets"]), template)
+        except (OSError, ValueError) as e:
+            raise SystemExit(f"❌ Cannot read budgets file {site['budgets']}: {e}")
+    sources = [generator_source(render), *pipeline_sources(), *sources]
+    site, sources = stage_site(site, sources, stylesheets, template)
+    options = json.dumps({**{key: site.get(key) for key in OUTPUT_OPTIONS}, "budget": budget}, sort_keys=True)
+    fingerprint = hash_bytes((source_hash(sources) + options).encode("utf-8"))
+
+    for name in stylesheets:
+        _, css = load_stylesheet(name, site)
+        violation = check_stylesheet_budget(name, len(css.encode("utf-8")), budget)
+        if violation:
+            raise BudgetExceeded(f"❌ {violation} ({template} budget)")
+    start = lap(stages, "setup", start)
+
+    # One task per (app, locale), app-major; each locale keeps its own fingerprint and manifest entry
+    locales = site.get("locales") or [DEFAULT_LOCALE]
+    locale_sites = {locale: {**site, "locale": locale} for locale in locales}
+    locale_hashes = {locale: source_hash([locale_path(locale)]) for locale in locales if locale != DEFAULT_LOCALE}
+    tasks = [(index, locale) for index in range(len(apps)) for locale in locales]
+    fingerprints = [app_fingerprint(fingerprint, base_dir, app) for app in apps]
+    task_fingerprints = [
+        fingerprints[index] if locale == DEFAULT_LOCALE
+        else hash_bytes((fingerprints[index] + locale_hashes[locale]).encode("utf-8"))
+        for index, locale in tasks
+    ]
+    labels = [page_label(apps[index], locale) for index, locale in tasks]
+    task_statuses = [None] * len(tasks)
+    pending = []
+    for task, (index, locale) in enumerate(tasks):
+        paths = page_paths(base_dir, apps[index], locale)
+        if not force and manifest.is_current(manifest_key(generator, locale), apps[index], task_fingerprints[task], paths):
+            task_statuses[task] = UP_TO_DATE
+        else:
+            pending.append(task)
+    start = lap(stages, "stale_check", start)
+
+    pages = [None] * len(tasks)
+    failures = []
+    statuses = []
+    stale = [(apps[tasks[task][0]], locale_sites[tasks[task][1]]) for task in pending]
+    for position, page in build_in_workers(stale, render, jobs, budget):
+        task = pending[position]
+        index, locale = tasks[task]
+        if page["violations"]:
+            failures.append((task, page))
+            task_statuses[task] = OVER_BUDGET
+            continue
+        warn_dropped_selectors(labels[task], page)
+        statuses.extend(page["statuses"])
+        paths = page_paths(base_dir, apps[index], locale)
+        manifest.record(manifest_key(generator, locale), apps[index], task_fingerprints[task], paths, page["digest"])
+        task_statuses[task] = REBUILT
+        pages[task] = page
+    start = lap(stages, "pages", start)
+
+    results = []
+    for index, app in enumerate(apps):
+        own = task_statuses[index * len(locales):(index + 1) * len(locales)]
+        status = OVER_BUDGET if OVER_BUDGET in own else REBUILT if REBUILT in own else UP_TO_DATE
+        results.append((app, [path for locale in locales for path in page_paths(base_dir, app, locale)], status))
+
+    if pending and (site.get("minify") or site.get("precompress")):
+        print_size_report(labels, pages)
+    for app, paths, status in results:
+        if status != OVER_BUDGET:
+            statuses.extend(publish_screenshots(app, paths, site))
+    start = lap(stages, "screenshots", start)
+    statuses.extend(publish_stylesheets(stylesheets, [path for _, paths, _ in results for path in paths], site))
+    start = lap(stages, "stylesheets", start)
+    statuses.extend(update_portfolio(base_dir, site))
+    start = lap(stages, "portfolio", start)
+    if pending:
+        print_fragment_report(pages)
+        print_image_report(pages)
+        if site.get("resource_hints"):
+            print_hint_report(labels, pages)
+    report = format_output_report(statuses)
+    if report and (pending or any(status != UNCHANGED for status in statuses if status)):
+        print(f"Output files: {report}\n")
+    manifest.save()
+    lap(stages, "manifest", start)
+    if site.get("report"):
+        over_budget = dict(failures)
+        entries = [
+            page_entry(labels[task], apps[index], locale, task_statuses[task], pages[task] or over_budget.get(task))
+            for task, (index, locale) in enumerate(tasks)
+        ]
+        build = {
+            "generator": generator, "template": template, "started": started, "jobs": resolve_jobs(jobs),
+            "force": force, "locales": locales, "options": {key: site.get(key) for key in OUTPUT_OPTIONS},
+        }
+        write_report(site["report"], build_report(build, entries, stages, statuses))
+        print(f"📊 Build report written to {site['report']}\n")
+    if failures:
+        failures.sort(key=lambda failure: failure[0])
+        print_budget_failures([(labels[task], page, page["violations"]) for task, page in failures], budget)
+        raise BudgetExceeded(f"❌ {len(failures)} of {len(tasks)} pages exceed the {template} budget; nothing was written for them")
+    return results
+
+def summarize(results):
+    """One-line rebuild summary, e.g. '3 rebuilt, 21 up to date'"""
+    rebuilt = sum(1 for _, _, status in results if status == REBUILT)
+    return f"{rebuilt} rebuilt, {len(results) - rebuilt} up to date"
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+App catalog shared by the landing-page generators
+- One JSON file per collection in visionOS/catalog (gaming, nongaming, batch_2, batch_3)
+- Files are parsed on first use only and validated against a small schema
+- index_by_dir() gives O(1) lookup for --only builds
+- forget_catalog() drops a parsed collection so --watch picks up catalog edits
+"""
+
+import json
+import os
+import re
+
+CATALOG_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "catalog")
+
+HEX_COLOR = re.compile(r"^#[0-9a-fA-F]{6}$")
+
+# Field schemas: "str", "hex", "list[str]" or "list[card]" (icon, title, description)
+BASE_SCHEMA = {
+    "dir": "str",
+    "title": "str",
+    "logo": "str",
+    "color_primary": "hex",
+    "tagline": "str",
+}
+
+SCHEMAS = {
+    "gaming": {
+        **BASE_SCHEMA,
+        "genre": "str",
+        "hero_message": "str",
+        "player_count": "str",
+        "rating": "str",
+        "intensity": "str",
+        "space_needed": "str",
+        "modes": "list[str]",
+        "features": "list[card]",
+    },
+    "nongaming": {**BASE_SCHEMA, "spatial_message": "str", "pillars": "list[card]"},
+    "batch_2": {**BASE_SCHEMA, "color_secondary": "hex", "spatial_message": "str", "pillars": "list[card]"},
+    "batch_3": {**BASE_SCHEMA, "spatial_message": "str", "pillars": "list[card]"},
+}
+
+_catalogs = {}
+_indexes = {}
+
+class CatalogError(ValueError):
+    """Raised when a catalog file does not match its schema"""
+
+def catalog_path(name):
+    return os.path.join(CATALOG_DIR, name + ".json")
+
+def _check_field(value, kind):
+    if kind == "str":
+        return isinstance(value, str) and value != ""
+    if kind == "hex":
+        return isinstance(value, str) and bool(HEX_COLOR.match(value))
+    if kind == "list[str]":
+        return isinstance(value, list) and bool(value) and all(isinstance(v, str) for v in value)
+    if kind == "list[card]":
+        return isinstance(value, list) and bool(value) and all(
+            isinstance(card, list) and len(card) == 3 and all(isinstance(v, str) for v in card)
+            for card in value
+        )
+    raise ValueError(f"unknown schema type {kind}")
+
+def validate_catalog(name, apps):
+    """Check every entry against the collection schema; raise CatalogError listing all problems"""
+    schema = SCHEMAS[name]
+    problems = []
+    seen = set()
+    for position, app in enumerate(apps):
+        label = app.get("dir", f"entry {position}") if isinstance(app, dict) else f"entry {position}"
+        if not isinstance(app, dict):
+            problems.append(f"{label}: not an object")
+            continue
+        for field, kind in schema.items():
+            if field not in app:
+                problems.append(f"{label}: missing '{field}'")
+            elif not _check_field(app[field], kind):
+                problems.append(f"{label}: '{field}' should be {kind}")
+        if app.get("dir") in seen:
+            problems.append(f"{label}: duplicate dir")
+        seen.add(app.get("dir"))
+    if problems:
+        raise CatalogError(f"{catalog_path(name)}:\n  " + "\n  ".join(problems))
+
+def load_catalog(name):
+    """Parse and validate a collection on first use; later calls reuse the list"""
+    if name not in _catalogs:
+        with open(catalog_path(name), encoding="utf-8") as f:
+            apps = json.load(f)["apps"]
+        validate_catalog(name, apps)
+        _catalogs[name] = apps
+    return _catalogs[name]
+
+def forget_catalog(name):
+    """Drop the cached collection so the next load_catalog() re-reads the file"""
+    _catalogs.pop(name, None)
+    _indexes.pop(name, None)
+
+def index_by_dir(name):
+    """{app dir: app} for a collection"""
+    if name not in _indexes:
+        _indexes[name] = {app["dir"]: app for app in load_catalog(name)}
+    return _indexes[name]
+
+def genre_matches(app, genre):
+    """'rpg' matches 'FANTASY RPG'; 'fantasy rpg' matches it too; case-insensitive"""
+    app_genre = app.get("genre", "").upper()
+    genre = genre.upper().strip()
+    return genre == app_genre or genre in app_genre.split()
+
+def select_apps(name, only=None, genres=None):
+    """Apps of a collection filtered by --only dirs and --genre names, in catalog order"""
+    if only:
+        index = index_by_dir(name)
+        unknown = [app_dir for app_dir in only if app_dir not in index]
+        if unknown:
+            raise CatalogError(f"not in the {name} catalog: {', '.join(unknown)}")
+        wanted = set(only)
+        apps = [app for app in load_catalog(name) if app["dir"] in wanted]
+    else:
+        apps = list(load_catalog(name))
+    if genres:
+        apps = [app for app in apps if any(genre_matches(app, genre) for genre in genres)]
+    return apps
@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""
+Precompressed siblings (.gz and, when the brotli module is installed, .br)
+so static hosting can serve compressed bytes without compressing per request
+- precompressors() are incremental, so pages are compressed while they stream to disk
+"""
+
+import zlib
+
+from landing_pipeline.output import remove_file, write_file
+
+try:
+    import brotli
+except ImportError:  # optional dependency: pip install brotli
+    brotli = None
+
+ALL_SUFFIXES = (".gz", ".br")
+
+def available_suffixes():
+    """Suffixes precompress() produces with the modules installed here"""
+    return (".gz", ".br") if brotli is not None else (".gz",)
+
+def precompressors():
+    """{suffix: (feed, finish)} incremental encoders: feed(bytes) -> bytes, then finish() -> bytes"""
+    gz = zlib.compressobj(9, zlib.DEFLATED, 31)  # gzip framing with mtime 0, like gzip.compress(mtime=0)
+    encoders = {".gz": (gz.compress, gz.flush)}
+    if brotli is not None:
+        br = brotli.Compressor(quality=11)
+        encoders[".br"] = (br.process, br.finish)
+    return encoders
+
+def precompress(data):
+    """Return {suffix: compressed bytes} for every available encoding"""
+    return {suffix: feed(data) + finish() for suffix, (feed, finish) in precompressors().items()}
+
+def write_precompressed(path, encodings):
+    """Write path.gz / path.br next to an already written file, removing stale siblings
+
+    Returns the output sink status of every sibling (None for absent ones).
+    """
+    return [
+        write_file(path + suffix, encodings[suffix]) if suffix in encodings else remove_file(path + suffix)
+        for suffix in ALL_SUFFIXES
+    ]
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Critical-CSS inlining for the generated landing pages
+- landing_templates/critical_css.json names, per template, the section that ends the
+  first screen ("fold_after": "hero") and any classes injected there by the generator
+- The rules that markup needs are inlined (minified) in <head>; the full shared
+  stylesheet is preloaded and applied once it arrives, with a <noscript> fallback
+- Templates without an entry keep a plain render-blocking <link rel="stylesheet">
+"""
+
+import json
+import os
+from functools import lru_cache
+
+from landing_pipeline.budgets import SECTION, section_name
+from landing_pipeline.minify import minify_css
+from landing_pipeline.stylesheets import load_stylesheet, stylesheet_href
+from landing_pipeline.templates import TEMPLATE_DIR, get_template
+from landing_pipeline.treeshake import markup_selectors, shake_css
+
+CRITICAL_CONFIG_PATH = os.path.join(TEMPLATE_DIR, "critical_css.json")
+
+def load_critical_config(path=CRITICAL_CONFIG_PATH):
+    """{template: {"fold_after": section name, "safelist": [...]}}; {} without a config file"""
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+def fold_markup(source, fold_after):
+    """Template markup from <body> to the end of the section named fold_after"""
+    body = source.find("<body")
+    for match in SECTION.finditer(source, max(body, 0)):
+        if section_name(match.group(1), match.group(2)) == fold_after:
+            return source[max(body, 0):match.end()]
+    raise ValueError(f"no section named '{fold_after}' to end the critical CSS at")
+
+@lru_cache(maxsize=None)
+def _fold_selectors(template_name, template_digest, fold_after, safelist):
+    source = "".join(get_template(template_name).chunks)
+    return frozenset(markup_selectors(fold_markup(source, fold_after)) | set(safelist))
+
+@lru_cache(maxsize=None)
+def _critical_css(css, used):
+    return minify_css(shake_css(css, used))
+
+def critical_css(name, site):
+    """Minified rules of a shared stylesheet needed to paint the first screen"""
+    critical = site["critical"]
+    _, css = load_stylesheet(name, site)
+    template = get_template(critical["template"])
+    used = _fold_selectors(template.name, template.digest, critical["fold_after"], tuple(critical.get("safelist", ())))
+    return _critical_css(css, used)
+
+def stylesheet_tags(name, site=None, indent="    "):
+    """<head> markup for a shared stylesheet: a plain link, or inline critical CSS plus a deferred link"""
+    site = site or {}
+    href = stylesheet_href(name, site)
+    if not site.get("critical"):
+        return f'<link rel="stylesheet" href="{href}">'
+    return f"\n{indent}".join([
+        f"<style>{critical_css(name, site)}</style>",
+        f'<link rel="preload" href="{href}" as="style" onload="this.onload=null;this.rel=\'stylesheet\'">',
+        f'<noscript><link rel="stylesheet" href="{href}"></noscript>',
+    ])
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Fragment render cache shared by every landing-page generator
+- A fragment list (features grid, mode badges, pillar cards, ...) is keyed by
+  (fragment name, fragment template hash, input items)
+- Results are kept in memory and persisted under visionOS/.landing-cache/fragments,
+  so the v1/v2 gaming variants and later runs reuse each other's renders
+- Entries are written atomically and never change once written; the directory is safe to delete
+"""
+
+import json
+import os
+
+from landing_pipeline.manifest import hash_bytes
+from landing_pipeline.templates import get_template
+
+FRAGMENT_CACHE_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".landing-cache", "fragments"
+)
+
+_memory = {}
+
+# Per-process counters; build.render_page reports the delta of each page render
+stats = {"hits": 0, "misses": 0}
+
+def fragment_key(name, template, items):
+    """Hash of a fragment name, its template source and the items rendered through it"""
+    encoded = json.dumps([name, template.digest, items], sort_keys=True, ensure_ascii=False, default=list)
+    return hash_bytes(encoded.encode("utf-8"))
+
+def fragment_cache_path(key):
+    return os.path.join(FRAGMENT_CACHE_DIR, key[:2], key + ".html")
+
+def _read_cached(key):
+    try:
+        with open(fragment_cache_path(key), encoding="utf-8") as f:
+            return f.read()
+    except (FileNotFoundError, UnicodeDecodeError):
+        return None
+
+def _write_cached(key, html):
+    path = fragment_cache_path(key)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(html)
+        os.replace(tmp_path, path)
+    except OSError:
+        pass  # the cache is an optimization; a read-only checkout still renders
+
+def render_fragments(name, items, locale=None):
+    """Render a fragment once per context dict and join the results, reusing cached renders"""
+    items = list(items)
+    template = get_template(name, locale)
+    key = fragment_key(name, template, items)
+    html = _memory.get(key)
+    if html is None:
+        html = _read_cached(key)
+        if html is None:
+            html = "".join(template.render(item) for item in items)
+            _write_cached(key, html)
+            stats["misses"] += 1
+        else:
+            stats["hits"] += 1
+        _memory[key] = html
+    else:
+        stats["hits"] += 1
+    return html
@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+Resource-hint and lazy-loading pass over rendered landing pages
+- <link rel="preconnect"> for every external origin the page loads resources from
+  (fonts.gstatic.com is added for Google Fonts stylesheets), preload for @font-face files
+- loading="lazy" on <img>/<iframe> below the fold (the critical-CSS fold section, else
+  everything after the first image); decoding="async" on every <img>
+- width/height on local <img> files that lack them, read from the PNG/JPEG/GIF/WebP header
+- Returns a per-page report of what was added
+"""
+
+import os
+import re
+import struct
+from urllib.parse import urlsplit
+
+from landing_pipeline.budgets import SECTION, section_name
+
+GOOGLE_FONTS_CSS = "fonts.googleapis.com"
+GOOGLE_FONTS_FILES = "https://fonts.gstatic.com"
+
+HEAD_OPEN = re.compile(r"<head\b[^>]*>", re.I)
+TITLE_CLOSE = re.compile(r"</title\s*>", re.I)
+EXISTING_HINT = re.compile(r"""<link\b[^>]*\brel=["'](?:preconnect|dns-prefetch|preload)["'][^>]*>""", re.I)
+RESOURCE_URL = re.compile(
+    r"""<(?:img|script|iframe|source|video|audio|link)\b[^>]*?\b(?:src|href|srcset)\s*=\s*["']([^"']+)["']""", re.I
+)
+CSS_URL = re.compile(r"""url\(\s*["']?([^"')]+)["']?\s*\)""", re.I)
+FONT_FACE = re.compile(r"@font-face\s*\{([^}]*)\}", re.I)
+MEDIA_TAG = re.compile(r"<(img|iframe)\b([^>]*?)(\s*/?)>", re.I)
+ATTRIBUTE = re.compile(r"""\b([\w-]+)\s*=\s*["']([^"']*)["']""")
+
+FONT_TYPES = {".woff2": "font/woff2", ".woff": "font/woff", ".ttf": "font/ttf", ".otf": "font/otf"}
+
+_size_cache = {}
+
+def external_origin(url):
+    """'https://cdn.example.com' for absolute or protocol-relative http(s) URLs, else None"""
+    url = url.strip().split()[0] if url.strip() else ""
+    if url.startswith("//"):
+        url = "https:" + url
+    parts = urlsplit(url)
+    if parts.scheme in ("http", "https") and parts.netloc:
+        return f"{parts.scheme}://{parts.netloc}"
+    return None
+
+def image_size(path):
+    """(width, height) from an image file header, or None for unknown formats and missing files"""
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+    cached = _size_cache.get(path)
+    if cached and cached[0] == mtime:
+        return cached[1]
+    with open(path, "rb") as f:
+        head = f.read(64 * 1024)
+    size = _parse_image_size(head)
+    _size_cache[path] = (mtime, size)
+    return size
+
+def _parse_image_size(data):
+    if data[:8] == b"\x89PNG\r\n\x1a\n" and len(data) >= 24:
+        return struct.unpack(">II", data[16:24])
+    if data[:6] in (b"GIF87a", b"GIF89a") and len(data) >= 10:
+        return struct.unpack("<HH", data[6:10])
+    if data[:4] == b"RIFF" and data[8:12] == b"WEBP" and len(data) >= 30:
+        chunk = data[12:16]
+        if chunk == b"VP8 ":
+            width, height = struct.unpack("<HH", data[26:30])
+            return width & 0x3FFF, height & 0x3FFF
+        if chunk == b"VP8L":
+            bits = int.from_bytes(data[21:25], "little")
+            return (bits & 0x3FFF) + 1, ((bits >> 14) & 0x3FFF) + 1
+        if chunk == b"VP8X":
+            return int.from_bytes(data[24:27], "little") + 1, int.from_bytes(data[27:30], "little") + 1
+    if data[:2] == b"\xff\xd8":
+        index = 2
+        while index + 9 < len(data):
+            if data[index] != 0xFF:
+                index += 1
+                continue
+            marker = data[index + 1]
+            if 0xC0 <= marker <= 0xCF and marker not in (0xC4, 0xC8, 0xCC):
+                height, width = struct.unpack(">HH", data[index + 5:index + 9])
+                return width, height
+            index += 2 + struct.unpack(">H", data[index + 2:index + 4])[0]
+    return None
+
+def fold_offset(html, fold_after):
+    """Offset of the end of the fold section in rendered HTML, or None"""
+    if not fold_after:
+        return None
+    for match in SECTION.finditer(html):
+        if section_name(match.group(1), match.group(2)) == fold_after:
+            return match.end()
+    return None
+
+def _hint_tags(html, existing):
+    origins = []
+    preloads = []
+    urls = RESOURCE_URL.findall(html) + CSS_URL.findall(html)
+    for url in urls:
+        origin = external_origin(url)
+        if origin and origin not in origins:
+            origins.append(origin)
+        if GOOGLE_FONTS_CSS in url and GOOGLE_FONTS_FILES not in origins:
+            origins.append(GOOGLE_FONTS_FILES)
+    for block in FONT_FACE.findall(html):
+        for url in CSS_URL.findall(block):
+            extension = os.path.splitext(urlsplit(url).path)[1].lower()
+            if extension in FONT_TYPES and url not in preloads:
+                preloads.append(url)
+                break  # the first src is the one browsers that support it download
+
+    tags = []
+    for origin in origins:
+        if origin not in existing:
+            crossorigin = " crossorigin" if origin == GOOGLE_FONTS_FILES else ""
+            tags.append(f'<link rel="preconnect" href="{origin}"{crossorigin}>')
+    for url in preloads:
+        if url not in existing:
+            font_type = FONT_TYPES[os.path.splitext(urlsplit(url).path)[1].lower()]
+            tags.append(f'<link rel="preload" href="{url}" as="font" type="{font_type}" crossorigin>')
+    return tags, len([o for o in origins if o not in existing]), len([u for u in preloads if u not in existing])
+
+def add_resource_hints(html, fold_after=None, page_dir=None):
+    """Return (html with hints and lazy-loading attributes, {what was added: count})"""
+    report = {"preconnect": 0, "preload": 0, "lazy": 0, "decoding": 0, "dimensions": 0}
+    fold = fold_offset(html, fold_after)
+    first_image_seen = [False]
+
+    def media(match):
+        tag, attributes, closing = match.group(1).lower(), match.group(2), match.group(3)
+        present = {name.lower(): value for name, value in ATTRIBUTE.findall(attributes)}
+        added = []
+        below_fold = match.start() > fold if fold is not None else first_image_seen[0]
+        if tag == "img":
+            first_image_seen[0] = True
+        if "loading" not in present and below_fold:
+            added.append('loading="lazy"')
+            report["lazy"] += 1
+        if tag == "img" and "decoding" not in present:
+            added.append('decoding="async"')
+            report["decoding"] += 1
+        if tag == "img" and not ("width" in present and "height" in present) and page_dir:
+            src = present.get("src", "")
+            if src and not external_origin(src) and not src.startswith(("data:", "/")):
+                size = image_size(os.path.join(page_dir, src.split("?")[0]))
+                if size:
+                    added.append(f'width="{size[0]}" height="{size[1]}"')
+                    report["dimensions"] += 1
+        if not added:
+            return match.group(0)
+        return f"<{match.group(1)}{attributes} {' '.join(added)}{closing}>"
+
+    html = MEDIA_TAG.sub(media, html)
+
+    existing = set(re.findall(r"""href=["']([^"']+)["']""", " ".join(EXISTING_HINT.findall(html))))
+    tags, report["preconnect"], report["preload"] = _hint_tags(html, existing)
+    if tags:
+        anchor = TITLE_CLOSE.search(html) or HEAD_OPEN.search(html)
+        if anchor:
+            line_start = html.rfind("\n", 0, anchor.start()) + 1
+            indent = re.match(r"[ \t]*", html[line_start:]).group(0)
+            insertion = "".join(f"\n{indent}{tag}" for tag in tags)
+            html = html[:anchor.end()] + insertion + html[anchor.end():]
+        else:
+            report["preconnect"] = report["preload"] = 0
+    return html, report
+
+def format_hint_report(report):
+    """'1 preconnect, 4 lazy' style summary of a page report; '' when nothing was added"""
+    return ", ".join(f"{count} {name}" for name, count in report.items() if count)
@@ -0,0 +1,256 @@
+#!/usr/bin/env python3
+"""
+Responsive screenshot variants for the landing-page galleries
+- Source images live in <app dir>/screenshots/ (png, jpg or webp); apps without any keep
+  the template's text placeholders
+- Each image is resized to IMAGE_WIDTHS (never upscaled) and encoded as AVIF and WebP when
+  the installed Pillow can, plus a JPEG (or PNG with transparency) fallback
+- Variants are cached under visionOS/.landing-cache/images by source content hash, so
+  reruns only hash the sources; published names carry the hash and can be cached forever
+- Without Pillow (pip install Pillow) the original file is published unresized
+"""
+
+import html
+import json
+import os
+import re
+import shutil
+
+try:
+    from PIL import Image, ImageOps, features
+except ImportError:  # optional dependency: pip install Pillow
+    Image = None
+
+from landing_pipeline.fragments import render_fragments
+from landing_pipeline.hints import image_size
+from landing_pipeline.manifest import hash_bytes
+from landing_pipeline.output import link_file, remove_file
+
+IMAGE_CACHE_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".landing-cache", "images"
+)
+
+SCREENSHOT_DIR = "screenshots"
+SOURCE_EXTENSIONS = (".png", ".jpg", ".jpeg", ".webp")
+
+IMAGE_WIDTHS = (480, 960, 1600)
+# Bump when the cached variant description changes so old cache entries are re-encoded
+CACHE_VERSION = 2
+MODERN_FORMATS = ("avif", "webp")
+SAVE_OPTIONS = {
+    "avif": {"quality": 55},
+    "webp": {"quality": 78, "method": 6},
+    "jpeg": {"quality": 82, "optimize": True, "progressive": True},
+    "png": {"optimize": True},
+}
+EXTENSIONS = {"avif": "avif", "webp": "webp", "jpeg": "jpg", "png": "png"}
+MIME_TYPES = {"avif": "image/avif", "webp": "image/webp", "jpeg": "image/jpeg", "png": "image/png"}
+# Gallery cards are a two-column grid inside a 1400px container, one column on phones
+SIZES = "(max-width: 768px) 100vw, 700px"
+
+HASH_LENGTH = 10
+PUBLISHED_NAME = re.compile(r"^.+\.[0-9a-f]{%d}(?:\.\d+)?\.(?:avif|webp|jpg|jpeg|png)$" % HASH_LENGTH)
+
+_memory = {}
+
+# Per-process counters; build.render_page reports the delta of each page render
+stats = {"encoded": 0, "reused": 0}
+
+def available_formats():
+    """Modern formats the installed Pillow can encode, best first; () without Pillow"""
+    if Image is None:
+        return ()
+    found = []
+    for name in MODERN_FORMATS:
+        try:
+            if features.check(name):
+                found.append(name)
+        except ValueError:  # Pillow too old to know the feature name
+            pass
+    return tuple(found)
+
+def image_settings():
+    """Everything besides the source bytes that changes the variants"""
+    return json.dumps(
+        [CACHE_VERSION, IMAGE_WIDTHS, SAVE_OPTIONS, available_formats(), Image is not None], sort_keys=True
+    )
+
+def source_screenshots(base_dir, app):
+    """Sorted source images in an app's screenshots/ directory"""
+    directory = os.path.join(base_dir, app["dir"], SCREENSHOT_DIR)
+    try:
+        names = sorted(os.listdir(directory))
+    except (FileNotFoundError, NotADirectoryError):
+        return []
+    return [
+        os.path.join(directory, name) for name in names
+        if os.path.splitext(name)[1].lower() in SOURCE_EXTENSIONS and not name.startswith(".")
+    ]
+
+def _cache_path(key, filename):
+    return os.path.join(IMAGE_CACHE_DIR, key[:2], filename)
+
+def _atomic_save(path, save):
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    try:
+        save(tmp_path)
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+def _encode(path, key, stem, digest):
+    """Write every variant of one source into the cache and return its description"""
+    with Image.open(path) as original:
+        image = ImageOps.exif_transpose(original)
+        alpha = image.mode in ("RGBA", "LA") or (image.mode == "P" and "transparency" in image.info)
+        image = image.convert("RGBA" if alpha else "RGB")
+    if alpha and image.getchannel("A").getextrema() == (255, 255):
+        alpha = False  # screenshots are often saved with an unused alpha channel
+        image = image.convert("RGB")
+    fallback = "png" if alpha else "jpeg"
+    # Width descriptors in a srcset must be unique: sources wider than the largest width stop there once
+    widths = sorted({*(width for width in IMAGE_WIDTHS if width < image.width), min(image.width, IMAGE_WIDTHS[-1])})
+    files = {}
+    for width in widths:
+        height = round(image.height * width / image.width)
+        resized = image if width == image.width else image.resize((width, height), Image.LANCZOS)
+        for name in (*available_formats(), fallback):
+            filename = f"{stem}.{digest}.{width}.{EXTENSIONS[name]}"
+            _atomic_save(
+                _cache_path(key, filename),
+                lambda target: resized.save(target, format=name.upper(), **SAVE_OPTIONS[name]),
+            )
+            files.setdefault(name, []).append([width, filename])
+            stats["encoded"] += 1
+    return {"width": widths[-1], "height": round(image.height * widths[-1] / image.width),
+            "fallback": fallback, "files": files}
+
+def _copy_original(path, key, stem, digest):
+    """Without Pillow: publish the source file itself as the only variant
+
+    The width comes from the file header; it is 0 when the header cannot be read, and
+    picture_context() then leaves out the srcset.
+    """
+    extension = os.path.splitext(path)[1].lower().lstrip(".")
+    name = "jpeg" if extension in ("jpg", "jpeg") else extension
+    filename = f"{stem}.{digest}.{EXTENSIONS[name]}"
+    _atomic_save(_cache_path(key, filename), lambda target: shutil.copyfile(path, target))
+    stats["encoded"] += 1  # counted like an encoded variant so the build reports the missing Pillow
+    width, height = image_size(path) or (0, 0)
+    return {"width": width, "height": height, "fallback": name, "files": {name: [[width, filename]]}}
+
+def screenshot_variants(path):
+    """Describe (and on first use, encode) the cached variants of one source image
+
+    Returns {"name", "key", "width", "height", "fallback", "files": {format: [[width, filename]]}};
+    files are under IMAGE_CACHE_DIR and named <stem>.<source hash>.<width>.<ext>.
+    """
+    with open(path, "rb") as f:
+        key = hash_bytes(f.read() + image_settings().encode("utf-8"))
+    if key in _memory:
+        stats["reused"] += 1
+        return _memory[key]
+    stem = re.sub(r"[^\w-]+", "-", os.path.splitext(os.path.basename(path))[0]).strip("-") or "screenshot"
+    digest = key[:HASH_LENGTH]
+    meta_path = _cache_path(key, key + ".json")
+    try:
+        with open(meta_path, encoding="utf-8") as f:
+            shot = json.load(f)
+        if all(os.path.exists(_cache_path(key, name)) for _, name in _published_files(shot)):
+            stats["reused"] += 1
+            _memory[key] = shot
+            return shot
+    except (FileNotFoundError, ValueError):
+        pass
+    make = _encode if Image is not None else _copy_original
+    shot = {"name": stem, "key": key, **make(path, key, stem, digest)}
+    _atomic_save(meta_path, lambda target: _write_json(target, shot))
+    _memory[key] = shot
+    return shot
+
+def _write_json(path, data):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2, sort_keys=True)
+
+def _published_files(shot):
+    return [(width, filename) for variants in shot["files"].values() for width, filename in variants]
+
+def app_screenshots(app, site=None):
+    """[(source path, variant description)] for every screenshot of an app, in file name order"""
+    base_dir = (site or {}).get("base_dir", "")
+    return [(path, screenshot_variants(path)) for path in source_screenshots(base_dir, app)]
+
+def screenshot_url(filename, site=None):
+    """URL a page uses for a published variant"""
+    asset_base = (site or {}).get("asset_base")
+    if asset_base:
+        return f"{asset_base.rstrip('/')}/{SCREENSHOT_DIR}/{filename}"
+    return f"{SCREENSHOT_DIR}/{filename}"
+
+def picture_context(shot, alt, site=None):
+    """Context for fragments/screenshot_card.html: a <source> per modern format plus the <img> fallback
+
+    An original of unknown width (published without Pillow) gets a plain src: a "0w"
+    descriptor would make the srcset invalid.
+    """
+    def srcset(name):
+        return ", ".join(f"{screenshot_url(filename, site)} {width}w" for width, filename in shot["files"][name])
+
+    sources = render_fragments("fragments/screenshot_source.html", (
+        {"type": MIME_TYPES[name], "srcset": srcset(name), "sizes": SIZES}
+        for name in MODERN_FORMATS if name in shot["files"] and name != shot["fallback"]
+    ))
+    fallback = shot["files"][shot["fallback"]]
+    return {
+        "sources": sources,
+        "src": screenshot_url(fallback[-1][1], site),
+        "srcset": f' srcset="{srcset(shot["fallback"])}" sizes="{SIZES}"' if shot["width"] else "",
+        "dimensions": f' width="{shot["width"]}" height="{shot["height"]}"' if shot["width"] else "",
+        "alt": html.escape(alt),
+    }
+
+def screenshot_alt(app, path):
+    """'Shadow Boxing Champions: Combat moment' for screenshots/01-combat-moment.png"""
+    stem = os.path.splitext(os.path.basename(path))[0]
+    label = re.sub(r"^\d+[-_ ]*", "", stem).replace("_", " ").replace("-", " ").strip()
+    return f"{app['title']}: {label.capitalize()}" if label else f"{app['title']} screenshot"
+
+def gallery_html(app, site, placeholders):
+    """Gallery cards: the app's screenshots as responsive <picture>s, else the placeholder labels"""
+    site = site or {}
+    shots = app_screenshots(app, site)
+    if not shots:
+        return render_fragments(
+            "fragments/screenshot_placeholder.html", ({"label": label} for label in placeholders), site.get("locale")
+        )
+    return render_fragments("fragments/screenshot_card.html", (
+        picture_context(shot, screenshot_alt(app, path), site) for path, shot in shots
+    ), site.get("locale"))
+
+def publish_screenshots(app, paths, site=None):
+    """Hardlink an app's variants from the cache next to its pages (or into asset_dir) and drop stale ones
+
+    Returns the output sink status of every published or removed file.
+    """
+    site = site or {}
+    shots = app_screenshots(app, site)
+    if site.get("asset_base"):
+        directories = [os.path.join(site["asset_dir"], SCREENSHOT_DIR)]
+    else:
+        directories = sorted(set(os.path.join(os.path.dirname(path), SCREENSHOT_DIR) for path in paths))
+    statuses = []
+    for directory in directories:
+        wanted = set()
+        for _, shot in shots:
+            for _, filename in _published_files(shot):
+                if filename not in wanted:
+                    wanted.add(filename)
+                    statuses.append(link_file(_cache_path(shot["key"], filename), os.path.join(directory, filename)))
+        if site.get("asset_base") or not os.path.isdir(directory):
+            continue  # asset_dir is shared by every app, so nothing there is stale per app
+        for name in os.listdir(directory):
+            if PUBLISHED_NAME.match(name) and name not in wanted:
+                statuses.append(remove_file(os.path.join(directory, name)))
+    return statuses
@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""
+Translation catalogs for localized landing pages (--locales)
+- One JSON file per locale in visionOS/landing_templates/locales: {"lang": "fr", "messages":
+  {English text: translation}}; missing or empty translations fall back to the English text
+- Template text nodes are translated once per locale before the template is compiled
+  (templates.get_template(name, locale)), so rendering a locale costs the same as English
+- Catalog entries and generator copy go through translate() / localize_app() per render;
+  markup-only fragments, design tokens and stylesheets are identical in every locale and
+  shared through the same caches
+- python -m landing_pipeline.locales update fr adds every untranslated message to fr.json
+"""
+
+import argparse
+import ast
+import json
+import os
+import re
+import sys
+
+from landing_pipeline.catalog import SCHEMAS, load_catalog
+
+VISIONOS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+TEMPLATE_DIR = os.path.join(VISIONOS_DIR, "landing_templates")
+LOCALE_DIR = os.path.join(TEMPLATE_DIR, "locales")
+
+DEFAULT_LOCALE = "en"
+
+# A text node between two tags: (leading whitespace, text, trailing whitespace)
+TEXT_NODE = re.compile(r"(?<=>)(\s*)([^<>]*?[^\s<>])(\s*)(?=<)")
+PLACEHOLDER_ONLY = re.compile(r"^(?:\s|\{\{[^}]*\}\}|[^\w])*$")
+HTML_LANG = re.compile(r'(<html\b[^>]*\blang=")[^"]*(")')
+
+# Catalog fields that are identifiers or styling rather than copy
+UNTRANSLATED_FIELDS = {"dir", "logo", "color_primary", "color_secondary", "player_count", "rating"}
+# [icon, title, description] card lists; the icon is kept
+CARD_FIELDS = {"features", "pillars"}
+
+_cache = {}
+
+class LocaleError(ValueError):
+    """Raised for unknown locales and malformed locale files"""
+
+def locale_path(locale):
+    return os.path.join(LOCALE_DIR, locale + ".json")
+
+def available_locales():
+    """Locales with a catalog file, plus the source locale"""
+    try:
+        names = os.listdir(LOCALE_DIR)
+    except FileNotFoundError:
+        names = []
+    return sorted({DEFAULT_LOCALE, *(name[:-5] for name in names if name.endswith(".json"))})
+
+def load_locale(locale):
+    """{"lang", "messages"} for a locale, re-read when its file changes; English has no messages"""
+    if not locale or locale == DEFAULT_LOCALE:
+        return {"lang": DEFAULT_LOCALE, "messages": {}}
+    path = locale_path(locale)
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        raise LocaleError(f"no translation catalog for locale '{locale}' ({path})") from None
+    cached = _cache.get(locale)
+    if cached and cached[0] == mtime:
+        return cached[1]
+    try:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        messages = {key: value for key, value in data["messages"].items() if value}
+    except (ValueError, KeyError, AttributeError) as e:
+        raise LocaleError(f"{path}: not a locale catalog ({e})") from None
+    catalog = {"lang": data.get("lang", locale), "messages": messages}
+    _cache[locale] = (mtime, catalog)
+    return catalog
+
+def parse_locales(value):
+    """argparse type for --locales: 'en,fr' -> ['en', 'fr']; 'all' -> every available locale"""
+    if value.strip() == "all":
+        return available_locales()
+    locales = list(dict.fromkeys(name.strip() for name in value.split(",") if name.strip()))
+    unknown = [name for name in locales if name not in available_locales()]
+    if unknown or not locales:
+        raise argparse.ArgumentTypeError(
+            f"unknown locale(s): {', '.join(unknown) or value!r} (available: {', '.join(available_locales())})"
+        )
+    return locales
+
+def translate(text, locale):
+    """Translation of one message, or the message itself"""
+    if not locale or locale == DEFAULT_LOCALE:
+        return text
+    return load_locale(locale)["messages"].get(text, text)
+
+def N_(text):
+    """Mark a message for `locales update` without translating it where it is defined"""
+    return text
+
+def translator(site):
+    """translate() bound to the locale a page is rendered in, for generator copy: _ = translator(site)"""
+    locale = (site or {}).get("locale")
+    return lambda text: translate(text, locale)
+
+def localize_app(app, site):
+    """A catalog entry with its copy translated; identifiers, colors and card icons are kept"""
+    locale = (site or {}).get("locale")
+    if not locale or locale == DEFAULT_LOCALE:
+        return app
+    localized = {}
+    for field, value in app.items():
+        if field in UNTRANSLATED_FIELDS:
+            localized[field] = value
+        elif field in CARD_FIELDS:
+            localized[field] = [
+                [icon, translate(title, locale), translate(description, locale)] for icon, title, description in value
+            ]
+        elif isinstance(value, list):
+            localized[field] = [translate(item, locale) for item in value]
+        else:
+            localized[field] = translate(value, locale)
+    return localized
+
+def translate_markup(source, locale):
+    """Template source with its text nodes translated and <html lang> set to the locale"""
+    catalog = load_locale(locale)
+    messages = catalog["messages"]
+
+    def text_node(match):
+        leading, text, trailing = match.groups()
+        return leading + messages.get(text, text) + trailing
+
+    source = TEXT_NODE.sub(text_node, source) if messages else source
+    return HTML_LANG.sub(lambda match: match.group(1) + catalog["lang"] + match.group(2), source, count=1)
+
+def markup_messages(source):
+    """Translatable text nodes of a template, in document order"""
+    source = re.sub(r"<(script|style)\b.*?</\1\s*>", "", source, flags=re.S | re.I)
+    return [text for _, text, _ in TEXT_NODE.findall(source) if not PLACEHOLDER_ONLY.match(text)]
+
+def catalog_messages(app):
+    """Translatable copy of a catalog entry"""
+    found = []
+    for field, value in app.items():
+        if field in UNTRANSLATED_FIELDS:
+            continue
+        if field in CARD_FIELDS:
+            for _, title, description in value:
+                found += [title, description]
+        elif isinstance(value, list):
+            found += value
+        else:
+            found.append(value)
+    return found
+
+def generator_messages(path):
+    """String literals passed to _() or N_() in a generator script"""
+    with open(path, encoding="utf-8") as f:
+        tree = ast.parse(f.read(), path)
+    return [
+        node.args[0].value for node in ast.walk(tree)
+        if isinstance(node, ast.Call) and isinstance(node.func, ast.Name) and node.func.id in ("_", "N_")
+        and node.args and isinstance(node.args[0], ast.Constant) and isinstance(node.args[0].value, str)
+    ]
+
+def all_messages():
+    """Every message the generators can translate: templates, _() / N_() copy and catalogs"""
+    messages = []
+    for name in sorted(os.listdir(TEMPLATE_DIR)):
+        if name.endswith(".html") and name != "portfolio.html":
+            with open(os.path.join(TEMPLATE_DIR, name), encoding="utf-8") as f:
+                messages += markup_messages(f.read())
+    for name in sorted(os.listdir(VISIONOS_DIR)):
+        if name.startswith("generate_") and name.endswith(".py"):
+            messages += generator_messages(os.path.join(VISIONOS_DIR, name))
+    for collection in SCHEMAS:
+        for app in load_catalog(collection):
+            messages += catalog_messages(app)
+    return list(dict.fromkeys(messages))
+
+def update_catalog(locale):
+    """Add every untranslated message to a locale file (empty string = not yet translated)"""
+    path = locale_path(locale)
+    try:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+    except FileNotFoundError:
+        data = {"lang": locale, "messages": {}}
+    messages = data["messages"]
+    missing = [text for text in all_messages() if text not in messages]
+    messages.update(dict.fromkeys(missing, ""))
+    os.makedirs(LOCALE_DIR, exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+        f.write("\n")
+    os.replace(tmp_path, path)
+    untranslated = sum(1 for value in messages.values() if not value)
+    print(f"✓ {path}: {len(missing)} new message(s), {untranslated} of {len(messages)} untranslated")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Maintain the landing-page translation catalogs")
+    commands = parser.add_subparsers(dest="command", required=True)
+    update = commands.add_parser("update", help="add untranslated messages to locale files")
+    update.add_argument("locales", nargs="+", metavar="LOCALE")
+    commands.add_parser("list", help="list available locales")
+    args = parser.parse_args(argv)
+    if args.command == "list":
+        print("\n".join(available_locales()))
+        return 0
+    for locale in args.locales:
+        if locale == DEFAULT_LOCALE:
+            parser.error(f"{DEFAULT_LOCALE} is the source language and needs no catalog")
+        update_catalog(locale)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Incremental build manifest for the landing-page generators
+- Per-app hash of the catalog entry (the app dict)
+- Per-generator hash of the generator/template sources
+- Hash of every output file, so pages overwritten by another generator get rebuilt
+"""
+
+import hashlib
+import json
+import os
+
+MANIFEST_NAME = ".landing-manifest.json"
+
+def hash_bytes(data):
+    """Hex sha256 of a bytes object"""
+    return hashlib.sha256(data).hexdigest()
+
+def config_hash(app):
+    """Stable hash of one catalog entry"""
+    encoded = json.dumps(app, sort_keys=True, ensure_ascii=False, default=list)
+    return hash_bytes(encoded.encode("utf-8"))
+
+def source_hash(paths):
+    """Combined hash of the generator and template source files"""
+    digest = hashlib.sha256()
+    for path in sorted(set(os.path.abspath(p) for p in paths)):
+        digest.update(os.path.basename(path).encode("utf-8"))
+        with open(path, "rb") as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+def file_hash(path):
+    """Hash of a file on disk, or None when it does not exist"""
+    try:
+        with open(path, "rb") as f:
+            return hash_bytes(f.read())
+    except FileNotFoundError:
+        return None
+
+class BuildManifest:
+    """Build state persisted as JSON next to the generated pages"""
+
+    def __init__(self, base_dir):
+        self.base_dir = base_dir
+        self.path = os.path.join(base_dir, MANIFEST_NAME)
+        self.entries = {}
+        self.dirty = False
+
+    @classmethod
+    def load(cls, base_dir):
+        manifest = cls(base_dir)
+        try:
+            with open(manifest.path, encoding="utf-8") as f:
+                manifest.entries = json.load(f)
+        except (FileNotFoundError, ValueError):
+            manifest.entries = {}
+        return manifest
+
+    def _key(self, path):
+        return os.path.relpath(path, self.base_dir or ".")
+
+    def is_current(self, generator, app, sources, paths):
+        """True when the app's inputs and outputs match the last recorded build"""
+        entry = self.entries.get(generator, {}).get(app["dir"])
+        if not entry or entry["config"] != config_hash(app) or entry["sources"] != sources:
+            return False
+        outputs = entry["outputs"]
+        return all(outputs.get(self._key(path)) == file_hash(path) for path in paths)
+
+    def record(self, generator, app, sources, paths, digest):
+        """Remember the inputs and output hash (hash_bytes of the written page) of a page"""
+        self.entries.setdefault(generator, {})[app["dir"]] = {
+            "config": config_hash(app),
+            "sources": sources,
+            "outputs": {self._key(path): digest for path in paths},
+        }
+        self.dirty = True
+
+    def save(self):
+        if not self.dirty:
+            return
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.entries, f, indent=2, sort_keys=True)
+            f.write("\n")
+        os.replace(tmp_path, self.path)
+        self.dirty = False
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Conservative HTML / CSS / JS minification for generated pages
+- HTML: drops comments and collapses whitespace; <pre>/<textarea> are left untouched
+- CSS: drops comments, collapses whitespace around punctuation; strings and url() are preserved
+- JS: only trims indentation and blank lines (no renaming, no comment parsing)
+"""
+
+import re
+
+BLOCK_TAGS = (
+    "html|head|body|meta|link|title|style|script|div|section|header|footer|nav|main|"
+    "article|aside|h[1-6]|p|ul|ol|li|table|thead|tbody|tr|td|th|form|picture|source|br|hr"
+)
+
+PROTECTED_BLOCK = re.compile(r"<(pre|textarea|script|style)\b[^>]*>.*?</\1\s*>", re.S | re.I)
+HTML_COMMENT = re.compile(r"<!--(?!\[if).*?-->", re.S)
+WHITESPACE = re.compile(r"\s+")
+AROUND_BLOCK_TAG = re.compile(r"\s*(</?(?:%s)\b[^>]*>)\s*" % BLOCK_TAGS, re.I)
+
+# Strings and unquoted url(...) values are copied verbatim; the latter may contain ';', '}' or '/*'
+CSS_TOKEN = re.compile(
+    r"""("(?:\\.|[^"\\])*"|'(?:\\.|[^'\\])*'|(?i:url)\(\s*[^\s"')][^)]*\))|(/\*.*?\*/)|(\s+)|((?:(?!(?i:url)\()[^"'/\s])+|[^"'\s])""",
+    re.S,
+)
+CSS_TIGHT = set("{};,>")
+
+def minify_css(css):
+    """Minify a stylesheet without changing selectors or values"""
+    out = []
+    pending_space = False
+    for string, comment, space, text in CSS_TOKEN.findall(css):
+        if comment:
+            continue
+        if space:
+            pending_space = True
+            continue
+        token = string or text.replace(";}", "}")
+        previous = out[-1][-1] if out else "{"
+        if pending_space and previous not in CSS_TIGHT and previous != ":" and token[0] not in CSS_TIGHT:
+            out.append(" ")
+        pending_space = False
+        if token[0] == "}" and previous == ";" and not out[-1].endswith(("'", '"')):
+            out[-1] = out[-1][:-1]
+        out.append(token)
+    return "".join(out)
+
+def minify_js(js):
+    """Trim indentation and blank lines; anything cleverer is left to a real JS minifier"""
+    return "\n".join(line.strip() for line in js.splitlines() if line.strip())
+
+def _minify_protected(match):
+    block = match.group(0)
+    tag = match.group(1).lower()
+    if tag not in ("style", "script"):
+        return block
+    open_end = block.index(">") + 1
+    close_start = block.rindex("<")
+    body = block[open_end:close_start]
+    if tag == "style":
+        body = minify_css(body)
+    elif "src=" not in block[:open_end].lower():
+        body = minify_js(body)
+    return block[:open_end] + body + block[close_start:]
+
+def minify_html(html):
+    """Minify a page; inline <style> and <script> bodies go through the CSS/JS minifiers"""
+    protected = []
+
+    def stash(match):
+        protected.append(_minify_protected(match))
+        return f"\x00{len(protected) - 1}\x00"
+
+    html = PROTECTED_BLOCK.sub(stash, html)
+    html = HTML_COMMENT.sub("", html)
+    html = WHITESPACE.sub(" ", html)
+    html = AROUND_BLOCK_TAG.sub(r"\1", html)
+    html = re.sub(r"\s*(\x00\d+\x00)\s*", r"\1", html)
+    html = re.sub(r"\x00(\d+)\x00", lambda m: protected[int(m.group(1))], html)
+    return html.strip() + "\n"
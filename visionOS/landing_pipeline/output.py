@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Output sink shared by the landing-page generators
+- Files are written atomically (temp file in the same directory, then rename), so a
+  server or file watcher never sees a half-written page
+- A write is skipped when the file already holds the same bytes, so unchanged outputs
+  keep their mtime and inode and HTTP caches and watchers are left alone
+- Duplicate outputs (docs/ and landing-page/, one stylesheet per page directory) are
+  hardlinks to the first copy; filesystems without hardlinks get a copy instead
+- write_stream() takes a page as chunks and writes it, its compressed siblings and its
+  hash in one pass, holding no more than one chunk at a time
+"""
+
+import hashlib
+import os
+
+WRITTEN = "written"
+LINKED = "linked"
+UNCHANGED = "unchanged"
+REMOVED = "removed"
+
+def same_content(path, data):
+    """True when path exists and holds exactly data (size checked before reading)"""
+    try:
+        if os.stat(path).st_size != len(data):
+            return False
+        with open(path, "rb") as f:
+            return f.read() == data
+    except FileNotFoundError:
+        return False
+
+def _tmp_path(path):
+    return f"{path}.{os.getpid()}.tmp"
+
+def write_file(path, data):
+    """Atomically write bytes unless the file already holds them; returns WRITTEN or UNCHANGED"""
+    if same_content(path, data):
+        return UNCHANGED
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp_path = _tmp_path(path)
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    return WRITTEN
+
+def _same_files(first, second, block=64 * 1024):
+    try:
+        if os.stat(first).st_size != os.stat(second).st_size:
+            return False
+        with open(first, "rb") as a, open(second, "rb") as b:
+            while True:
+                left, right = a.read(block), b.read(block)
+                if left != right:
+                    return False
+                if not left:
+                    return True
+    except FileNotFoundError:
+        return False
+
+def _commit(tmp_path, path):
+    """Rename a finished temp file into place unless path already holds the same bytes"""
+    if _same_files(tmp_path, path):
+        os.remove(tmp_path)
+        return UNCHANGED
+    os.replace(tmp_path, path)
+    return WRITTEN
+
+def write_stream(chunks, paths, compressors=None):
+    """Stream str/bytes chunks to paths[0] and, through each compressor, to paths[0] + suffix
+
+    compressors is {suffix: (feed, finish)} (see compress.precompressors). The other paths
+    are hardlinked afterwards. Returns (statuses, sha256 hex of the uncompressed bytes,
+    {"": size, suffix: compressed size}).
+    """
+    compressors = compressors or {}
+    primary = paths[0]
+    targets = {"": primary, **{suffix: primary + suffix for suffix in compressors}}
+    tmp_paths = {suffix: _tmp_path(path) for suffix, path in targets.items()}
+    sizes = dict.fromkeys(targets, 0)
+    digest = hashlib.sha256()
+    files = {}
+    os.makedirs(os.path.dirname(primary) or ".", exist_ok=True)
+    try:
+        for suffix, tmp_path in tmp_paths.items():
+            files[suffix] = open(tmp_path, "wb")
+        for chunk in chunks:
+            data = chunk.encode("utf-8") if isinstance(chunk, str) else chunk
+            if not data:
+                continue
+            digest.update(data)
+            files[""].write(data)
+            sizes[""] += len(data)
+            for suffix, (feed, _) in compressors.items():
+                encoded = feed(data)
+                files[suffix].write(encoded)
+                sizes[suffix] += len(encoded)
+        for suffix, (_, finish) in compressors.items():
+            encoded = finish()
+            files[suffix].write(encoded)
+            sizes[suffix] += len(encoded)
+        for f in files.values():
+            f.close()
+        statuses = [_commit(tmp_paths[suffix], path) for suffix, path in targets.items()]
+    finally:
+        for f in files.values():
+            f.close()
+        for tmp_path in tmp_paths.values():
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+    for path in paths[1:]:
+        statuses.extend(link_file(target, path + suffix) for suffix, target in targets.items())
+    return statuses, digest.hexdigest(), sizes
+
+def link_file(source, path):
+    """Make path a hardlink of source (atomically); copies when hardlinks are not supported"""
+    try:
+        if os.path.samefile(source, path):
+            return UNCHANGED
+    except FileNotFoundError:
+        pass
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp_path = _tmp_path(path)
+    try:
+        os.link(source, tmp_path)
+    except OSError:  # cross-device, or a filesystem without hardlinks
+        with open(source, "rb") as f:
+            return write_file(path, f.read())
+    os.replace(tmp_path, path)
+    return LINKED
+
+def remove_file(path):
+    """Delete an output that is no longer produced; returns REMOVED, or None when it was absent"""
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        return None
+    return REMOVED
+
+def format_output_report(statuses):
+    """'2 written, 2 linked, 44 unchanged' for the statuses of one build"""
+    counts = {}
+    for status in statuses:
+        if status:
+            counts[status] = counts.get(status, 0) + 1
+    return ", ".join(f"{counts[status]} {status}" for status in (WRITTEN, LINKED, UNCHANGED, REMOVED) if status in counts)
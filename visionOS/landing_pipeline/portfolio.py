@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+visionOS portfolio index and precomputed client-side search index
+- Built from every catalog in visionOS/catalog at the end of each generator run, so the
+  index lists exactly the apps the generators publish
+- PORTFOLIO_INDEX.html links every app's landing page; search-index.json maps search tokens
+  (title, genre, tagline, features and modes) to app ids so the page searches without a server,
+  and carries STOP_WORDS so the page drops the same words from queries
+- Apps are re-tokenized only when their catalog entry changed (cached in
+  .landing-cache/portfolio.json); unchanged output files are left untouched
+"""
+
+import json
+import os
+import re
+
+from landing_pipeline.catalog import CatalogError, load_catalog
+from landing_pipeline.compress import ALL_SUFFIXES, precompress
+from landing_pipeline.fragments import render_fragments
+from landing_pipeline.manifest import config_hash
+from landing_pipeline.output import remove_file, write_file
+from landing_pipeline.templates import render_template
+
+PORTFOLIO_NAME = "PORTFOLIO_INDEX.html"
+SEARCH_INDEX_NAME = "search-index.json"
+PORTFOLIO_TEMPLATE = "portfolio.html"
+
+PORTFOLIO_CACHE_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".landing-cache", "portfolio.json"
+)
+
+# Index page sections in display order: (heading, collections)
+SECTIONS = [
+    ("🎮 Spatial Games", ("gaming",)),
+    ("🏢 Spatial Apps", ("nongaming", "batch_2", "batch_3")),
+]
+
+CARD_FIELDS = ("id", "title", "logo", "color", "genre", "tagline", "url")
+
+# Must match the tokenizer in landing_templates/portfolio.html: runs of letters and digits
+TOKEN = re.compile(r"[^\W_]+")
+STOP_WORDS = {"a", "an", "and", "for", "in", "of", "on", "the", "to", "with", "you", "your"}
+
+def tokenize(*texts):
+    """Sorted unique lowercase search tokens of some text"""
+    tokens = set()
+    for text in texts:
+        tokens.update(token for token in TOKEN.findall(text.lower()) if token not in STOP_WORDS)
+    return sorted(tokens)
+
+def app_entry(collection, app):
+    """What the index shows and searches for one catalog entry"""
+    cards = app.get("features") or app.get("pillars") or []
+    features = [title for _, title, _ in cards]
+    genre = app.get("genre", "")
+    return {
+        "id": app["dir"],
+        "title": app["title"],
+        "logo": app["logo"],
+        "color": app["color_primary"],
+        "genre": genre.title(),
+        "tagline": app["tagline"],
+        "url": f"{app['dir']}/docs/",
+        "collection": collection,
+        "tokens": tokenize(app["title"], genre, app["tagline"], *features, *app.get("modes", ())),
+    }
+
+def _load_cache():
+    try:
+        with open(PORTFOLIO_CACHE_PATH, encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return {}
+
+def _save_cache(cache):
+    tmp_path = f"{PORTFOLIO_CACHE_PATH}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(PORTFOLIO_CACHE_PATH), exist_ok=True)
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(cache, f, sort_keys=True, ensure_ascii=False)
+        os.replace(tmp_path, PORTFOLIO_CACHE_PATH)
+    except OSError:
+        pass  # the cache is an optimization; a read-only checkout still builds
+
+def portfolio_entries():
+    """(entries in section order, number of apps re-tokenized); unchanged apps come from the cache"""
+    cache = _load_cache()
+    fresh = {}
+    entries = []
+    updated = 0
+    for _, collections in SECTIONS:
+        for collection in collections:
+            for app in load_catalog(collection):
+                key = config_hash(app)
+                cached = cache.get(app["dir"])
+                if cached and cached["config"] == key and cached["entry"]["collection"] == collection:
+                    entry = cached["entry"]
+                else:
+                    entry = app_entry(collection, app)
+                    updated += 1
+                fresh[app["dir"]] = {"config": key, "entry": entry}
+                entries.append(entry)
+    if updated or fresh.keys() != cache.keys():
+        _save_cache(fresh)
+    return entries, updated
+
+def search_index(entries):
+    """Compact inverted index: {"apps": [app id, ...], "tokens": {token: [position in apps, ...]},
+    "stop_words": [words left out of tokens, which queries must ignore too]}"""
+    postings = {}
+    for position, entry in enumerate(entries):
+        for token in entry["tokens"]:
+            postings.setdefault(token, []).append(position)
+    return {
+        "apps": [entry["id"] for entry in entries],
+        "tokens": dict(sorted(postings.items())),
+        "stop_words": sorted(STOP_WORDS),
+    }
+
+def portfolio_html(entries):
+    """The index page: one card per app, grouped into SECTIONS"""
+    sections = []
+    position = 0
+    for heading, collections in SECTIONS:
+        cards = [entry for entry in entries if entry["collection"] in collections]
+        sections.append({
+            "heading": heading,
+            "count": len(cards),
+            "cards": render_fragments("fragments/portfolio_card.html", (
+                {**{field: entry[field] for field in CARD_FIELDS}, "position": position + offset}
+                for offset, entry in enumerate(cards)
+            )),
+        })
+        position += len(cards)
+    return render_template(
+        PORTFOLIO_TEMPLATE,
+        app_count=len(entries),
+        sections=render_fragments("fragments/portfolio_section.html", sections),
+        search_index=SEARCH_INDEX_NAME,
+    )
+
+def _write_with_siblings(path, data, site):
+    statuses = [write_file(path, data)]
+    encodings = precompress(data) if site.get("precompress") else {}
+    for suffix in ALL_SUFFIXES:
+        if suffix in encodings:
+            statuses.append(write_file(path + suffix, encodings[suffix]))
+        else:
+            statuses.append(remove_file(path + suffix))
+    return statuses
+
+def update_portfolio(base_dir, site=None):
+    """Write PORTFOLIO_INDEX.html and search-index.json into base_dir; returns output sink statuses"""
+    site = site or {}
+    try:
+        entries, updated = portfolio_entries()
+    except CatalogError as e:
+        print(f"⚠️  Portfolio index not updated: {e}\n")
+        return []
+    index = json.dumps(search_index(entries), separators=(",", ":"), ensure_ascii=False)
+    statuses = _write_with_siblings(os.path.join(base_dir, SEARCH_INDEX_NAME), index.encode("utf-8"), site)
+    page = portfolio_html(entries).encode("utf-8")
+    statuses += _write_with_siblings(os.path.join(base_dir, PORTFOLIO_NAME), page, site)
+    if updated:
+        print(f"Portfolio index: {updated} of {len(entries)} app(s) re-indexed → {PORTFOLIO_NAME}, {SEARCH_INDEX_NAME}\n")
+    return statuses
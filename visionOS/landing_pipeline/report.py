@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Build instrumentation for the landing-page generators
+- Pages carry per-stage timings (render, hints, minify, sections, checks, write) measured in
+  the worker that built them; build_pages() times its own stages around them. Streamed pages
+  are rendered lazily, so their template time shows up under "write"
+- build_report() turns one build into a JSON-ready dict: per-page timings, bytes, cache
+  hits/misses, output statuses and the apps skipped as up to date; --report FILE writes it
+- profiled() wraps a build in cProfile, or pyinstrument for an .html path (--profile FILE)
+"""
+
+import cProfile
+import io
+import json
+import pstats
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+
+try:
+    import pyinstrument
+except ImportError:  # optional dependency: pip install pyinstrument
+    pyinstrument = None
+
+from landing_pipeline.output import write_file
+
+SLOWEST_PAGES = 5
+PROFILE_LINES = 15
+
+def timestamp():
+    return datetime.now(timezone.utc).isoformat(timespec="seconds")
+
+def lap(stages, name, start):
+    """Add the milliseconds since start (a time.perf_counter() value) to stages[name]; returns now"""
+    now = time.perf_counter()
+    stages[name] = round(stages.get(name, 0) + (now - start) * 1000, 3)
+    return now
+
+def count_statuses(statuses):
+    """{status: count} for a list of output sink statuses (None entries are ignored)"""
+    counts = {}
+    for status in statuses:
+        if status:
+            counts[status] = counts.get(status, 0) + 1
+    return counts
+
+def page_entry(label, app, locale, status, page):
+    """Report entry for one page; only status and identity for pages that were skipped
+
+    Bytes are those written; a page over budget has timings but wrote nothing.
+    """
+    entry = {"label": label, "app": app["dir"], "locale": locale, "status": status}
+    if page is None:
+        return entry
+    timings = page.get("timings", {})
+    entry.update({
+        "total_ms": round(sum(timings.values()), 3),
+        "stages_ms": timings,
+        "bytes": page["size"] if "statuses" in page else None,
+        "encoded_bytes": page.get("encoded_sizes", {}),
+        "fragment_hits": page["fragment_hits"],
+        "fragment_misses": page["fragment_misses"],
+        "images_encoded": page["images_encoded"],
+        "images_reused": page["images_reused"],
+        "outputs": count_statuses(page.get("statuses", [])),
+    })
+    if page.get("violations"):
+        entry["violations"] = page["violations"]
+    return entry
+
+def build_report(build, entries, stages, statuses):
+    """JSON-ready report of one build: {build details, summary, stages_ms, slowest, pages}"""
+    built = [entry for entry in entries if "total_ms" in entry]
+    written = [entry for entry in built if entry["bytes"] is not None]
+    by_status = count_statuses(entry["status"] for entry in entries)
+    return {
+        **build,
+        "finished": timestamp(),
+        "elapsed_ms": round(sum(stages.values()), 3),
+        "summary": {
+            "pages": len(entries),
+            **{status.replace(" ", "_"): count for status, count in by_status.items()},
+            "bytes": sum(entry["bytes"] for entry in written),
+            "encoded_bytes": sum(sum(entry["encoded_bytes"].values()) for entry in written),
+            "fragment_hits": sum(entry["fragment_hits"] for entry in built),
+            "fragment_misses": sum(entry["fragment_misses"] for entry in built),
+            "images_encoded": sum(entry["images_encoded"] for entry in built),
+            "images_reused": sum(entry["images_reused"] for entry in built),
+            "outputs": count_statuses(statuses),
+        },
+        "stages_ms": stages,
+        "slowest": [
+            {"label": entry["label"], "total_ms": entry["total_ms"]}
+            for entry in sorted(built, key=lambda entry: -entry["total_ms"])[:SLOWEST_PAGES]
+        ],
+        "pages": entries,
+    }
+
+def write_report(path, report):
+    """Write a build report as JSON (atomically, and only when it changed)"""
+    write_file(path, (json.dumps(report, indent=2) + "\n").encode("utf-8"))
+
+@contextmanager
+def profiled(path, jobs=1):
+    """Profile the with-block into path: pyinstrument HTML for *.html, else a cProfile stats file"""
+    if jobs != 1:
+        print("⚠️  --profile only sees the parent process; run with -j 1 to include page rendering\n")
+    if path.endswith(".html"):
+        if pyinstrument is None:
+            raise SystemExit("❌ --profile *.html needs pyinstrument (pip install pyinstrument)")
+        profiler = pyinstrument.Profiler()
+        profiler.start()
+        try:
+            yield
+        finally:
+            profiler.stop()
+            write_file(path, profiler.output_html().encode("utf-8"))
+            print(f"⏱️  Profile written to {path}\n")
+        return
+
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield
+    finally:
+        profiler.disable()
+        profiler.dump_stats(path)
+        summary = io.StringIO()
+        pstats.Stats(profiler, stream=summary).sort_stats("cumulative").print_stats(PROFILE_LINES)
+        print(summary.getvalue().strip())
+        print(f"\n⏱️  Profile written to {path} (python -m pstats {path})\n")
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Shared, content-hashed stylesheets for the generated landing pages
+- The common CSS of each page template lives in landing_templates/styles/<name>.css
+- Colors are referenced through design tokens (var(--primary), var(--primary-30), ...)
+  that each page defines inline (see tokens.py), so one stylesheet serves every app of a template
+- Rules no page of the build can match are dropped first (treeshake.py, site['used_selectors'])
+- The file is published as <name>.<hash>.css, which browsers and CDNs can cache forever
+"""
+
+import glob
+import hashlib
+import os
+
+from landing_pipeline.compress import available_suffixes, precompress, write_precompressed
+from landing_pipeline.minify import minify_css
+from landing_pipeline.output import UNCHANGED, link_file, remove_file, write_file
+from landing_pipeline.templates import TEMPLATE_DIR
+from landing_pipeline.treeshake import shake_css
+
+STYLE_DIR = os.path.join(TEMPLATE_DIR, "styles")
+
+HASH_LENGTH = 10
+
+_cache = {}
+
+def stylesheet_path(name):
+    """Source path of a shared stylesheet, e.g. 'gaming_v2' -> landing_templates/styles/gaming_v2.css"""
+    return os.path.join(STYLE_DIR, name + ".css")
+
+def load_stylesheet(name, site=None):
+    """Return (fingerprinted file name, css text) for a shared stylesheet, cached per process"""
+    site = site or {}
+    path = stylesheet_path(name)
+    minify = bool(site.get("minify"))
+    used = (site.get("used_selectors") or {}).get(name)
+    key = (name, minify, used)
+    mtime = os.stat(path).st_mtime_ns
+    cached = _cache.get(key)
+    if cached and cached[0] == mtime:
+        return cached[1]
+    with open(path, encoding="utf-8") as f:
+        css = f.read()
+    if used is not None:
+        css = shake_css(css, set(used))
+    if minify:
+        css = minify_css(css) + "\n"
+    digest = hashlib.sha256(css.encode("utf-8")).hexdigest()[:HASH_LENGTH]
+    result = (f"{name}.{digest}.css", css)
+    _cache[key] = (mtime, result)
+    return result
+
+def stylesheet_href(name, site=None):
+    """URL a page uses to reference a shared stylesheet"""
+    filename, _ = load_stylesheet(name, site)
+    asset_base = (site or {}).get("asset_base")
+    if asset_base:
+        return f"{asset_base.rstrip('/')}/{filename}"
+    return filename
+
+def publish_stylesheet(name, directory, site=None, link_from=None):
+    """Write the fingerprinted stylesheet into a directory and drop stale fingerprints
+
+    link_from is the same stylesheet already published in another directory; the
+    files are hardlinked to it instead of written again. Returns (path, statuses).
+    """
+    filename, css = load_stylesheet(name, site)
+    target = os.path.join(directory, filename)
+    suffixes = available_suffixes() if (site or {}).get("precompress") else ()
+    wanted = {target, *(target + suffix for suffix in suffixes)}
+    statuses = [
+        remove_file(stale)
+        for stale in glob.glob(os.path.join(glob.escape(directory), f"{name}.*.css*")) if stale not in wanted
+    ]
+    if link_from:
+        statuses.append(link_file(link_from, target))
+        statuses.extend(link_file(link_from + suffix, target + suffix) for suffix in suffixes)
+    elif all(os.path.exists(path) for path in wanted):
+        statuses.extend(UNCHANGED for _ in wanted)  # the file name is the content hash
+    else:
+        data = css.encode("utf-8")
+        statuses.append(write_file(target, data))
+        statuses.extend(write_precompressed(target, precompress(data) if suffixes else {}))
+    return target, statuses
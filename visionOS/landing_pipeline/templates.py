@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Compiled templates for the landing-page generators
+- Templates live in visionOS/landing_templates and use {{ name }} / {{ app.field }} placeholders
+- Each template is split once into static chunks and placeholder lookups, then cached
+- Rendering only formats the per-app values and joins them with the precomputed chunks;
+  stream() yields the same pieces one by one for writers that never need the whole page
+- A locale compiles its own copy of a template with the text nodes translated (locales.py);
+  templates without translated text compile to the same digest and share fragment caches
+"""
+
+import hashlib
+import os
+import re
+
+from landing_pipeline.locales import DEFAULT_LOCALE, locale_path, translate_markup
+
+TEMPLATE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "landing_templates")
+
+PLACEHOLDER = re.compile(r"\{\{\s*([A-Za-z_]\w*(?:\.\w+)*)\s*\}\}")
+
+_cache = {}
+
+class Template:
+    """A template compiled into alternating static chunks and placeholder key paths"""
+
+    def __init__(self, source, name="<string>"):
+        self.name = name
+        self.digest = hashlib.sha256(source.encode("utf-8")).hexdigest()
+        self.chunks = []
+        self.fields = []
+        position = 0
+        for match in PLACEHOLDER.finditer(source):
+            self.chunks.append(source[position:match.start()])
+            self.fields.append(tuple(match.group(1).split(".")))
+            position = match.end()
+        self.chunks.append(source[position:])
+
+    def lookup(self, context, path):
+        value = context
+        try:
+            for key in path:
+                value = value[key]
+        except (KeyError, IndexError, TypeError):
+            raise KeyError(f"{self.name}: no value for {{{{ {'.'.join(path)} }}}}") from None
+        return value if isinstance(value, str) else str(value)
+
+    def stream(self, context):
+        """Yield static chunks and placeholder values in document order"""
+        yield self.chunks[0]
+        for path, chunk in zip(self.fields, self.chunks[1:]):
+            yield self.lookup(context, path)
+            yield chunk
+
+    def render(self, context):
+        return "".join(self.stream(context))
+
+def template_path(name):
+    """Absolute path of a template file, e.g. 'gaming_v2.html' or 'fragments/mode_badge.html'"""
+    return os.path.join(TEMPLATE_DIR, name)
+
+def get_template(name, locale=None):
+    """Load and compile a template (translated for locale), reusing the compile until a file changes"""
+    if locale == DEFAULT_LOCALE:
+        locale = None
+    path = template_path(name)
+    mtime = os.stat(path).st_mtime_ns
+    if locale:
+        mtime = (mtime, os.stat(locale_path(locale)).st_mtime_ns)
+    cached = _cache.get((name, locale))
+    if cached and cached[0] == mtime:
+        return cached[1]
+    with open(path, encoding="utf-8") as f:
+        source = f.read()
+    if locale:
+        source = translate_markup(source, locale)
+    template = Template(source, name)
+    _cache[(name, locale)] = (mtime, template)
+    return template
+
+def render_template(name, locale=None, **context):
+    """Render a template file with keyword values"""
+    return get_template(name, locale).render(context)
+
+def stream_template(name, locale=None, **context):
+    """Render a template file with keyword values as an iterator of string chunks"""
+    return get_template(name, locale).stream(context)
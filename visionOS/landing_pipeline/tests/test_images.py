@@ -0,0 +1,73 @@
+"""
+Responsive screenshot variants (landing_pipeline/images.py)
+Run from the visionOS directory: python -m unittest discover -s landing_pipeline/tests -t .
+"""
+
+import os
+import re
+import tempfile
+import unittest
+from unittest import mock
+
+from landing_pipeline import images
+
+def gallery(base_dir):
+    """Gallery markup for an app whose screenshots/ directory is under base_dir"""
+    app = {"dir": "app", "title": "App"}
+    return images.gallery_html(app, {"base_dir": base_dir}, ["Placeholder"])
+
+def descriptors(srcset):
+    return [candidate.split()[-1] for candidate in srcset.split(",")]
+
+class ImageTestCase(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.base_dir = directory.name
+        self.screenshots = os.path.join(self.base_dir, "app", images.SCREENSHOT_DIR)
+        os.makedirs(self.screenshots)
+        patches = [
+            mock.patch.object(images, "IMAGE_CACHE_DIR", os.path.join(self.base_dir, "cache")),
+            mock.patch.object(images, "_memory", {}),
+            mock.patch.dict(images.stats, {"encoded": 0, "reused": 0}),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+@unittest.skipIf(images.Image is None, "Pillow is needed to encode variants")
+class VariantWidthsTest(ImageTestCase):
+    def test_wide_source_lists_each_width_once(self):
+        images.Image.new("RGB", (3840, 2160), "navy").save(os.path.join(self.screenshots, "01-wide.png"))
+        html = gallery(self.base_dir)
+        srcsets = re.findall(r'srcset="([^"]*)"', html)
+        self.assertEqual(len(srcsets), len(images.available_formats()) + 1)
+        for srcset in srcsets:
+            self.assertEqual(descriptors(srcset), ["480w", "960w", "1600w"])
+        self.assertIn('width="1600" height="900"', html)
+
+    def test_narrow_source_is_not_upscaled(self):
+        images.Image.new("RGB", (700, 400), "navy").save(os.path.join(self.screenshots, "01-narrow.png"))
+        for srcset in re.findall(r'srcset="([^"]*)"', gallery(self.base_dir)):
+            self.assertEqual(descriptors(srcset), ["480w", "700w"])
+
+@mock.patch.object(images, "Image", None)
+class WithoutPillowTest(ImageTestCase):
+    def test_unknown_width_gets_plain_src(self):
+        with open(os.path.join(self.screenshots, "01-broken.png"), "wb") as f:
+            f.write(b"not really a png")
+        html = gallery(self.base_dir)
+        self.assertRegex(html, r'<img src="screenshots/01-broken\.[0-9a-f]{10}\.png" alt=')
+        self.assertNotIn("srcset", html)
+        self.assertNotIn("0w", html)
+
+    def test_known_width_keeps_srcset(self):
+        header = b"\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR" + (1200).to_bytes(4, "big") + (800).to_bytes(4, "big")
+        with open(os.path.join(self.screenshots, "01-header.png"), "wb") as f:
+            f.write(header + b"\x08\x02\x00\x00\x00")
+        html = gallery(self.base_dir)
+        self.assertEqual([descriptors(s) for s in re.findall(r'srcset="([^"]*)"', html)], [["1200w"]])
+        self.assertIn('width="1200" height="800"', html)
+
+if __name__ == "__main__":
+    unittest.main()
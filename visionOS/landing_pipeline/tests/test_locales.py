@@ -0,0 +1,121 @@
+"""
+Localized landing pages (landing_pipeline/locales.py) and where each locale is written
+Run from the visionOS directory: python -m unittest discover -s landing_pipeline/tests -t .
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import re
+import tempfile
+import unittest
+from unittest import mock
+
+from generate_gaming_v2_complete import CATALOG as V2_CATALOG, generate_v2_html
+from landing_pipeline import build, locales
+from landing_pipeline.catalog import load_catalog
+from landing_pipeline.locales import DEFAULT_LOCALE, localize_app, translate, translate_markup, translator
+
+TEST_LOCALE = {
+    "lang": "de-CH",
+    "messages": {"Download": "Herunterladen", "Features": "", "Spatial demo": "Räumliche Demo"},
+}
+APP = {"dir": "DemoApp", "title": "Demo App", "tagline": "Spatial demo", "color_primary": "#007AFF"}
+
+def render_demo(app, site=None):
+    _ = translator(site)
+    app = localize_app(app, site)
+    lang = locales.load_locale((site or {}).get("locale"))["lang"]
+    return f'<html lang="{lang}"><body><p>{app["tagline"]}</p><a>{_("Download")}</a><a>{_("Buy")}</a></body></html>\n'
+
+class LocaleTestCase(unittest.TestCase):
+    """A throwaway 'xx' locale catalog in place of landing_templates/locales"""
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+        self.locale_dir = os.path.join(self.directory, "locales")
+        os.makedirs(self.locale_dir)
+        with open(os.path.join(self.locale_dir, "xx.json"), "w", encoding="utf-8") as f:
+            json.dump(TEST_LOCALE, f)
+        patches = (mock.patch.object(locales, "LOCALE_DIR", self.locale_dir), mock.patch.object(locales, "_cache", {}))
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+class TranslateTest(LocaleTestCase):
+    def test_lang_attribute_is_set(self):
+        source = '<!DOCTYPE html>\n<html lang="en">\n<body><a>Download</a></body></html>'
+        translated = '<!DOCTYPE html>\n<html lang="de-CH">\n<body><a>Herunterladen</a></body></html>'
+        self.assertEqual(translate_markup(source, "xx"), translated)
+
+    def test_missing_and_empty_translations_fall_back_to_english(self):
+        self.assertEqual(translate("Buy", "xx"), "Buy")
+        self.assertEqual(translate("Features", "xx"), "Features")
+        self.assertEqual(translate_markup("<p>Features</p><p>Buy</p>", "xx"), "<p>Features</p><p>Buy</p>")
+
+    def test_default_locale_is_untouched(self):
+        self.assertEqual(translate("Download", DEFAULT_LOCALE), "Download")
+        self.assertIs(localize_app(APP, {"locale": DEFAULT_LOCALE}), APP)
+
+    def test_catalog_copy_translated_identifiers_kept(self):
+        localized = localize_app(APP, {"locale": "xx"})
+        self.assertEqual(localized, {**APP, "tagline": "Räumliche Demo"})
+
+    def test_unknown_locale_is_an_error(self):
+        with self.assertRaises(locales.LocaleError):
+            translate("Download", "zz")
+        with self.assertRaises(argparse.ArgumentTypeError):
+            locales.parse_locales("en,zz")
+        self.assertEqual(locales.parse_locales("xx, en,xx"), ["xx", "en"])
+
+class LocaleOutputTest(LocaleTestCase):
+    def test_page_paths_per_locale(self):
+        app_dir = os.path.join("base", "DemoApp")
+        self.assertEqual(build.page_paths("base", APP), [
+            os.path.join(app_dir, "docs", "index.html"),
+            os.path.join(app_dir, "landing-page", "index.html"),
+        ])
+        self.assertEqual(build.page_paths("base", APP, "xx"), [
+            os.path.join(app_dir, "docs", "xx", "index.html"),
+            os.path.join(app_dir, "landing-page", "xx", "index.html"),
+        ])
+        self.assertEqual(build.page_paths("base", APP, DEFAULT_LOCALE), build.page_paths("base", APP))
+
+    def test_each_locale_is_written_to_its_directory(self):
+        site = {"locales": [DEFAULT_LOCALE, "xx"]}
+        with mock.patch.object(build, "pipeline_sources", lambda: []), contextlib.redirect_stdout(io.StringIO()):
+            [(_, paths, status)] = build.build_pages([APP], render_demo, self.directory, site=site)
+        self.assertEqual(status, build.REBUILT)
+        self.assertEqual(paths, build.page_paths(self.directory, APP) + build.page_paths(self.directory, APP, "xx"))
+        pages = {}
+        for path in paths:
+            with open(path, encoding="utf-8") as f:
+                pages[os.path.relpath(path, self.directory)] = f.read()
+        english = pages[os.path.join("DemoApp", "docs", "index.html")]
+        localized = pages[os.path.join("DemoApp", "docs", "xx", "index.html")]
+        self.assertIn('lang="en"', english)
+        self.assertIn("<p>Spatial demo</p><a>Download</a>", english)
+        self.assertIn('lang="de-CH"', localized)
+        self.assertIn("<p>Räumliche Demo</p><a>Herunterladen</a><a>Buy</a>", localized)
+        self.assertEqual(pages[os.path.join("DemoApp", "landing-page", "xx", "index.html")], localized)
+        with open(os.path.join(self.directory, ".landing-manifest.json"), encoding="utf-8") as f:
+            self.assertEqual(sorted(json.load(f)), ["test_locales", "test_locales@xx"])
+
+class GeneratorLocaleTest(unittest.TestCase):
+    """A real generator rendered in the shipped fr catalog"""
+
+    def test_french_page(self):
+        app = load_catalog(V2_CATALOG)[0]
+        html = "".join(generate_v2_html(app, {"locale": "fr"}))
+        self.assertRegex(html, r'<html lang="fr"')
+        self.assertIn("MODES DE JEU", html)
+        self.assertNotIn("GAME MODES", html)
+        self.assertIn(f"<h1>{app['title']}</h1>", html)  # catalog copy without a translation stays English
+        self.assertTrue(re.search(r'<html lang="en"', "".join(generate_v2_html(app, {"locale": "en"}))))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,121 @@
+"""
+Content-hash build manifest (landing_pipeline/manifest.py) and the rebuilds build_pages() decides with it
+Run from the visionOS directory: python -m unittest discover -s landing_pipeline/tests -t .
+"""
+
+import contextlib
+import io
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from landing_pipeline import build
+from landing_pipeline.manifest import BuildManifest, hash_bytes
+
+APP = {"dir": "DemoApp", "title": "Demo App", "tagline": "Spatial demo"}
+
+def render_demo(app, site=None):
+    return f"<!DOCTYPE html><html><body><h1>{app['title']}</h1><p>{app['tagline']}</p></body></html>\n"
+
+class ManifestTest(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.base_dir = directory.name
+        self.paths = build.page_paths(self.base_dir, APP)
+        for path in self.paths:
+            os.makedirs(os.path.dirname(path))
+            with open(path, "wb") as f:
+                f.write(b"page")
+
+    def recorded(self):
+        manifest = BuildManifest(self.base_dir)
+        manifest.record("demo", APP, "sources-1", self.paths, hash_bytes(b"page"))
+        manifest.save()
+        return BuildManifest.load(self.base_dir)
+
+    def test_recorded_page_is_current(self):
+        self.assertTrue(self.recorded().is_current("demo", APP, "sources-1", self.paths))
+
+    def test_changed_catalog_entry_or_sources_are_stale(self):
+        manifest = self.recorded()
+        self.assertFalse(manifest.is_current("demo", {**APP, "tagline": "Edited"}, "sources-1", self.paths))
+        self.assertFalse(manifest.is_current("demo", APP, "sources-2", self.paths))
+        self.assertFalse(manifest.is_current("other", APP, "sources-1", self.paths))
+
+    def test_deleted_or_overwritten_output_is_stale(self):
+        manifest = self.recorded()
+        with open(self.paths[1], "wb") as f:
+            f.write(b"another generator's page")
+        self.assertFalse(manifest.is_current("demo", APP, "sources-1", self.paths))
+        os.remove(self.paths[1])
+        self.assertFalse(manifest.is_current("demo", APP, "sources-1", self.paths))
+
+    def test_unreadable_manifest_starts_empty(self):
+        with open(os.path.join(self.base_dir, ".landing-manifest.json"), "w") as f:
+            f.write("{not json")
+        self.assertEqual(BuildManifest.load(self.base_dir).entries, {})
+
+class RebuildTest(unittest.TestCase):
+    """build_pages() on a one-app catalog in a temporary directory"""
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.base_dir = directory.name
+        self.template = self.write("template.html", "<h1>{{ app.title }}</h1>")
+        self.pipeline_source = self.write("pipeline.py", "STAGE = 1\n")
+        patch = mock.patch.object(build, "pipeline_sources", lambda: [self.pipeline_source])
+        patch.start()
+        self.addCleanup(patch.stop)
+
+    def write(self, name, text):
+        path = os.path.join(self.base_dir, name)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(text)
+        return path
+
+    def build(self, app=APP):
+        """Status of the app after one build"""
+        with contextlib.redirect_stdout(io.StringIO()):
+            [(_, paths, status)] = build.build_pages([app], render_demo, self.base_dir, sources=[self.template])
+        self.assertTrue(all(os.path.exists(path) for path in paths))
+        return status
+
+    def test_unchanged_inputs_are_skipped(self):
+        self.assertEqual(self.build(), build.REBUILT)
+        self.assertEqual(self.build(), build.UP_TO_DATE)
+
+    def test_template_edit_rebuilds(self):
+        self.build()
+        self.write("template.html", "<h1 class='title'>{{ app.title }}</h1>")
+        self.assertEqual(self.build(), build.REBUILT)
+        self.assertEqual(self.build(), build.UP_TO_DATE)
+
+    def test_catalog_edit_rebuilds(self):
+        self.build()
+        self.assertEqual(self.build({**APP, "tagline": "Edited"}), build.REBUILT)
+        with open(build.page_paths(self.base_dir, APP)[0], encoding="utf-8") as f:
+            self.assertIn("Edited", f.read())
+
+    def test_pipeline_source_edit_rebuilds(self):
+        self.build()
+        self.write("pipeline.py", "STAGE = 2\n")
+        self.assertEqual(self.build(), build.REBUILT)
+
+    def test_deleted_output_is_rebuilt(self):
+        self.build()
+        docs, landing_page = build.page_paths(self.base_dir, APP)
+        os.remove(landing_page)
+        self.assertEqual(self.build(), build.REBUILT)
+        self.assertEqual(os.stat(docs).st_ino, os.stat(landing_page).st_ino)
+
+class PipelineSourcesTest(unittest.TestCase):
+    def test_every_pipeline_module_is_a_source(self):
+        names = {os.path.basename(path) for path in build.pipeline_sources()}
+        self.assertTrue({"build.py", "manifest.py", "hints.py", "treeshake.py"} <= names)
+        self.assertFalse(any(name.startswith("test_") for name in names))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,65 @@
+"""
+HTML / CSS / JS minification (landing_pipeline/minify.py)
+Run from the visionOS directory: python -m unittest discover -s landing_pipeline/tests -t .
+"""
+
+import unittest
+
+from landing_pipeline.minify import minify_css, minify_html, minify_js
+
+class MinifyCssTest(unittest.TestCase):
+    def test_whitespace_comments_and_last_semicolon(self):
+        css = "/* c */ .a > .b ,\n .c {\n  color: red;\n  margin: 0 auto;\n}\n"
+        self.assertEqual(minify_css(css), ".a>.b,.c{color:red;margin:0 auto}")
+
+    def test_nested_media_and_supports(self):
+        css = "@media (min-width: 600px) {\n  @supports (display: grid) {\n    .a { display: grid; }\n  }\n}"
+        self.assertEqual(minify_css(css), "@media (min-width:600px){@supports (display:grid){.a{display:grid}}}")
+
+    def test_selector_spaces_are_kept(self):
+        css = ".a :hover, .b:not(.c) .d::before { e: f }"
+        self.assertEqual(minify_css(css), ".a :hover,.b:not(.c) .d::before{e:f}")
+
+    def test_strings_containing_semicolons_and_braces(self):
+        css = '.a::before { content: "; }" ; } .b { content: \'/* x */\'; }'
+        self.assertEqual(minify_css(css), '.a::before{content:"; }"}.b{content:\'/* x */\'}')
+
+    def test_urls_containing_semicolons_and_braces(self):
+        css = (
+            ".a { background: url(a;}.png) ; } .b { background: URL( b;}.png ); } "
+            ".c { background: url( 'c d.png' ); }"
+        )
+        self.assertEqual(
+            minify_css(css), ".a{background:url(a;}.png)}.b{background:URL( b;}.png )}.c{background:url( 'c d.png' )}",
+        )
+
+    def test_url_containing_comment_start(self):
+        css = ".a { background: url(//cdn/a/*b.png) } /* c */ .d { e: f }"
+        self.assertEqual(minify_css(css), ".a{background:url(//cdn/a/*b.png)}.d{e:f}")
+
+    def test_values_with_operators(self):
+        css = ".a { width: calc(100% - 10px); grid-area: 1 / 2; }"
+        self.assertEqual(minify_css(css), ".a{width:calc(100% - 10px);grid-area:1 / 2}")
+
+class MinifyHtmlTest(unittest.TestCase):
+    def test_comments_and_whitespace(self):
+        html = "<div>\n  <!-- note -->\n  <p>Hello   <b>world</b></p>\n</div>\n"
+        self.assertEqual(minify_html(html), "<div><p>Hello <b>world</b></p></div>\n")
+
+    def test_pre_and_textarea_untouched(self):
+        html = "<div>\n<pre>  a\n   b </pre>\n<textarea> x  y </textarea>\n</div>"
+        self.assertEqual(minify_html(html), "<div><pre>  a\n   b </pre><textarea> x  y </textarea></div>\n")
+
+    def test_inline_style_and_script(self):
+        html = "<style>\n  .a { color: red; }\n</style>\n<script>\n    let a = 1;\n\n    a += 1;\n</script>"
+        self.assertEqual(minify_html(html), "<style>.a{color:red}</style><script>let a = 1;\na += 1;</script>\n")
+
+    def test_conditional_comments_kept(self):
+        self.assertIn("<!--[if IE]><p>old</p><![endif]-->", minify_html("<!--[if IE]><p>old</p><![endif]-->"))
+
+class MinifyJsTest(unittest.TestCase):
+    def test_only_indentation_and_blank_lines(self):
+        self.assertEqual(minify_js("  if (a) {\n\n      b();  \n  }\n"), "if (a) {\nb();\n}")
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,128 @@
+"""
+Atomic output sink and hardlink dedupe (landing_pipeline/output.py)
+Run from the visionOS directory: python -m unittest discover -s landing_pipeline/tests -t .
+"""
+
+import gzip
+import os
+import tempfile
+import unittest
+import zlib
+from unittest import mock
+
+from landing_pipeline import output
+from landing_pipeline.output import LINKED, UNCHANGED, WRITTEN, link_file, write_file, write_stream
+
+OLD_PAGE = b"<html>old</html>\n"
+
+def gzip_compressor():
+    """{suffix: (feed, finish)} like compress.precompressors(), gzip only"""
+    encoder = zlib.compressobj(9, zlib.DEFLATED, 31)
+    return {".gz": (encoder.compress, encoder.flush)}
+
+class OutputTestCase(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+        self.docs = os.path.join(self.directory, "App", "docs", "index.html")
+        self.landing_page = os.path.join(self.directory, "App", "landing-page", "index.html")
+
+    def read(self, path):
+        with open(path, "rb") as f:
+            return f.read()
+
+    def leftovers(self):
+        """Temp files left anywhere under the directory"""
+        return [name for _, _, names in os.walk(self.directory) for name in names if name.endswith(".tmp")]
+
+class AtomicWriteTest(OutputTestCase):
+    def test_page_is_renamed_into_place(self):
+        write_file(self.docs, OLD_PAGE)
+        old_inode = os.stat(self.docs).st_ino
+        seen = []
+
+        def chunks():
+            for chunk in ("<html>", "new", "</html>\n"):
+                seen.append(self.read(self.docs))  # readers still get the whole old page
+                yield chunk
+
+        replace = mock.Mock(wraps=os.replace)
+        with mock.patch.object(output.os, "replace", replace):
+            statuses, digest, sizes = write_stream(chunks(), [self.docs])
+        self.assertEqual(statuses, [WRITTEN])
+        self.assertEqual(seen, [OLD_PAGE] * 3)
+        self.assertEqual(self.read(self.docs), b"<html>new</html>\n")
+        self.assertEqual(replace.call_args.args, (f"{self.docs}.{os.getpid()}.tmp", self.docs))
+        self.assertNotEqual(os.stat(self.docs).st_ino, old_inode)
+        self.assertEqual(sizes, {"": 17})
+        self.assertEqual(self.leftovers(), [])
+
+    def test_unchanged_bytes_keep_the_file(self):
+        write_file(self.docs, OLD_PAGE)
+        os.utime(self.docs, (1_700_000_000, 1_700_000_000))
+        before = os.stat(self.docs)
+        self.assertEqual(write_file(self.docs, OLD_PAGE), UNCHANGED)
+        self.assertEqual(write_stream([OLD_PAGE.decode()], [self.docs])[0], [UNCHANGED])
+        after = os.stat(self.docs)
+        self.assertEqual((after.st_ino, after.st_mtime_ns), (before.st_ino, before.st_mtime_ns))
+
+    def test_compressed_siblings_are_written_in_the_same_pass(self):
+        statuses, _, sizes = write_stream(["<html>", "page</html>\n"], [self.docs], gzip_compressor())
+        self.assertEqual(statuses, [WRITTEN, WRITTEN])
+        self.assertEqual(gzip.decompress(self.read(self.docs + ".gz")), b"<html>page</html>\n")
+        self.assertEqual(sizes[".gz"], os.path.getsize(self.docs + ".gz"))
+
+class HardlinkTest(OutputTestCase):
+    def test_identical_outputs_are_hardlinked(self):
+        statuses, _, _ = write_stream(["<html>page</html>\n"], [self.docs, self.landing_page], gzip_compressor())
+        self.assertEqual(statuses, [WRITTEN, WRITTEN, LINKED, LINKED])
+        self.assertTrue(os.path.samefile(self.docs, self.landing_page))
+        self.assertTrue(os.path.samefile(self.docs + ".gz", self.landing_page + ".gz"))
+        statuses, _, _ = write_stream(["<html>page</html>\n"], [self.docs, self.landing_page], gzip_compressor())
+        self.assertEqual(statuses, [UNCHANGED] * 4)
+
+    def test_rewritten_page_relinks_the_copy(self):
+        write_stream(["<html>one</html>\n"], [self.docs, self.landing_page])
+        write_stream(["<html>two</html>\n"], [self.docs, self.landing_page])
+        self.assertTrue(os.path.samefile(self.docs, self.landing_page))
+        self.assertEqual(self.read(self.landing_page), b"<html>two</html>\n")
+
+    def test_copies_without_hardlink_support(self):
+        write_file(self.docs, OLD_PAGE)
+        with mock.patch.object(output.os, "link", side_effect=OSError("cross-device link")):
+            self.assertEqual(link_file(self.docs, self.landing_page), WRITTEN)
+        self.assertEqual(self.read(self.landing_page), OLD_PAGE)
+        self.assertFalse(os.path.samefile(self.docs, self.landing_page))
+
+class FailedWriteTest(OutputTestCase):
+    def setUp(self):
+        super().setUp()
+        write_stream([OLD_PAGE], [self.docs, self.landing_page], gzip_compressor())
+        self.old_gz = self.read(self.docs + ".gz")
+
+    def assert_old_output(self):
+        for path in (self.docs, self.landing_page):
+            self.assertEqual(self.read(path), OLD_PAGE)
+            self.assertEqual(self.read(path + ".gz"), self.old_gz)
+        self.assertEqual(self.leftovers(), [])
+
+    def test_render_error_partway_keeps_the_old_page(self):
+        def chunks():
+            yield "<html>half a page"
+            raise ValueError("template error")
+
+        with self.assertRaises(ValueError):
+            write_stream(chunks(), [self.docs, self.landing_page], gzip_compressor())
+        self.assert_old_output()
+
+    def test_failed_rename_keeps_the_old_page(self):
+        with mock.patch.object(output.os, "replace", side_effect=OSError("disk full")):
+            with self.assertRaises(OSError):
+                write_stream(["<html>new</html>\n"], [self.docs, self.landing_page], gzip_compressor())
+            with self.assertRaises(OSError):
+                write_file(self.docs, b"<html>new</html>\n")
+        self.assert_old_output()
+
+if __name__ == "__main__":
+    unittest.main()
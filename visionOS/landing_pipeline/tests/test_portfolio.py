@@ -0,0 +1,76 @@
+"""
+Portfolio search index and the search script in landing_templates/portfolio.html
+Run from the visionOS directory: python -m unittest discover -s landing_pipeline/tests -t .
+"""
+
+import json
+import re
+import shutil
+import subprocess
+import unittest
+
+from landing_pipeline.catalog import load_catalog
+from landing_pipeline.portfolio import SECTIONS, STOP_WORDS, app_entry, portfolio_html, search_index, tokenize
+
+# Runs the page's inline script against a stub DOM and prints the positions of the visible cards
+SEARCH_HARNESS = r"""
+const {script, index, query, count} = JSON.parse(require("fs").readFileSync(0, "utf8"));
+const cards = Array.from({length: count}, (_, position) => ({hidden: false, getAttribute: () => String(position)}));
+const sections = [{hidden: false, querySelector: () => cards.find((card) => !card.hidden) || null}];
+const input = {value: "", listeners: {}, addEventListener(type, listener) { this.listeners[type] = listener; }};
+const status = {textContent: ""};
+global.document = {
+    getElementById: (id) => (id === "portfolio-search" ? input : status),
+    querySelectorAll: (selector) => (selector === "[data-app]" ? cards : sections),
+};
+global.fetch = () => Promise.resolve({json: () => Promise.resolve(index)});
+eval(script);
+setTimeout(() => {
+    input.value = query;
+    input.listeners.input();
+    console.log(JSON.stringify(cards.filter((card) => !card.hidden).map((card) => Number(card.getAttribute()))));
+});
+"""
+
+def catalog_entries():
+    return [
+        app_entry(collection, app)
+        for _, collections in SECTIONS for collection in collections for app in load_catalog(collection)
+    ]
+
+class SearchIndexTest(unittest.TestCase):
+    def test_stop_words_are_not_indexed(self):
+        self.assertEqual(tokenize("Hide and Seek Evolved"), ["evolved", "hide", "seek"])
+
+    def test_index_ships_the_stop_words(self):
+        index = search_index(catalog_entries())
+        self.assertEqual(index["stop_words"], sorted(STOP_WORDS))
+        self.assertFalse(STOP_WORDS & index["tokens"].keys())
+
+@unittest.skipUnless(shutil.which("node"), "node is needed to run the page's search script")
+class PageSearchTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.entries = catalog_entries()
+        cls.index = json.loads(json.dumps(search_index(cls.entries)))
+        cls.script = re.search(r"<script>(.*?)</script>", portfolio_html(cls.entries), re.S).group(1)
+
+    def search(self, query):
+        """Titles of the cards the page shows for a query"""
+        payload = {"script": self.script, "index": self.index, "query": query, "count": len(self.entries)}
+        result = subprocess.run(
+            ["node", "-e", SEARCH_HARNESS], input=json.dumps(payload), capture_output=True, text=True, check=True,
+        )
+        return [self.entries[position]["title"] for position in json.loads(result.stdout)]
+
+    def test_query_with_stop_word_matches_title(self):
+        self.assertEqual(self.search("hide and seek"), ["Hide and Seek Evolved"])
+
+    def test_prefix_query_matches_title(self):
+        self.assertIn("Supply Chain Control Tower", self.search("control tow"))
+
+    def test_only_stop_words_shows_everything(self):
+        self.assertEqual(len(self.search("the and of")), len(self.entries))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,106 @@
+"""
+Unused-CSS tree shaking (landing_pipeline/treeshake.py)
+Run from the visionOS directory: python -m unittest discover -s landing_pipeline/tests -t .
+"""
+
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from landing_pipeline.build import tree_shake_site
+from landing_pipeline.treeshake import load_safelist, markup_selectors, shake_css, unused_selectors
+
+USED = {".card", "#hero", "h1"}
+
+class MarkupSelectorsTest(unittest.TestCase):
+    def test_classes_ids_and_elements(self):
+        self.assertEqual(markup_selectors('<h1 id="hero" class="card wide">'), {"h1", "#hero", ".card", ".wide"})
+
+    def test_template_placeholders_are_not_classes(self):
+        self.assertEqual(markup_selectors('<div class="card {{ app.status }} {{x}}">'), {"div", ".card"})
+
+    def test_classes_and_selectors_used_by_scripts(self):
+        script = 'el.classList.toggle("open", true); document.querySelectorAll(".menu-item > a")'
+        self.assertEqual(markup_selectors(script), {".open", ".menu-item"})
+
+class ShakeCssTest(unittest.TestCase):
+    def test_drops_rules_nobody_matches(self):
+        self.assertEqual(shake_css(".card { a: b } .gone { c: d }", USED), ".card { a: b }")
+
+    def test_keeps_used_part_of_selector_list(self):
+        self.assertEqual(shake_css("h1:hover, .gone:focus { color: red }", USED), "h1:hover { color: red }")
+
+    def test_nested_media_and_supports(self):
+        css = (
+            "@media (min-width: 600px) { @supports (display: grid) { .card { display: grid } .gone { a: b } } "
+            ".gone { c: d } } @media print { @supports (x: y) { .gone { e: f } } }"
+        )
+        self.assertEqual(
+            shake_css(css, USED), "@media (min-width: 600px) { @supports (display: grid) { .card { display: grid } } }",
+        )
+
+    def test_not_and_other_functional_pseudo_classes(self):
+        css = ".card:not(.gone) { a: b } .gone:not(.card) { c: d } .card:is(:not(.x), .y) > h1:nth-child(2n+1) { e: f }"
+        self.assertEqual(
+            shake_css(css, USED), ".card:not(.gone) { a: b } .card:is(:not(.x), .y) > h1:nth-child(2n+1) { e: f }",
+        )
+
+    def test_pseudo_elements(self):
+        css = ".card::before { content: '' } .gone::after { content: '' } #hero::-webkit-scrollbar { width: 0 }"
+        self.assertEqual(shake_css(css, USED), ".card::before { content: '' } #hero::-webkit-scrollbar { width: 0 }")
+
+    def test_strings_containing_semicolons_and_braces(self):
+        css = ".card::before { content: \"; }\" } .gone::after { content: '{ ;' } h1[title='}'] { a: b }"
+        self.assertEqual(shake_css(css, USED), ".card::before { content: \"; }\" } h1[title='}'] { a: b }")
+
+    def test_urls_containing_semicolons_and_braces(self):
+        css = (
+            ".card { background: url(a;b}.png) } .gone { background: url( c}.png ) } "
+            "#hero { background: url(\"d;}.png\") } .gone { background: URL(e}) }"
+        )
+        self.assertEqual(
+            shake_css(css, USED), ".card { background: url(a;b}.png) } #hero { background: url(\"d;}.png\") }",
+        )
+
+    def test_comments_are_not_rules(self):
+        css = "/* .gone { } */ .card { a: b } /* } */"
+        self.assertEqual(shake_css(css, USED), css)
+
+    def test_keyframes_only_kept_when_animated(self):
+        css = (
+            "@keyframes spin { to { a: b } } @keyframes fade { to { c: d } } "
+            ".card { animation: spin 1s } .gone { animation: fade 1s }"
+        )
+        self.assertEqual(shake_css(css, USED), "@keyframes spin { to { a: b } } .card { animation: spin 1s }")
+
+    def test_at_rules_without_selectors_are_kept(self):
+        css = "@import url(base.css); @font-face { font-family: x; src: url(x}.woff2) } :root { --a: 1 }"
+        self.assertEqual(shake_css(css, USED), css)
+
+class SafelistTest(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+
+    def test_missing_safelist_is_empty(self):
+        self.assertEqual(load_safelist(os.path.join(self.directory, "missing.json")), {})
+
+    def test_safelisted_dynamic_classes_are_kept(self):
+        source = os.path.join(self.directory, "page.html")
+        with open(source, "w", encoding="utf-8") as f:
+            f.write('<div class="card {{ app.state }}"></div>')
+        safelist = {"styles": [".is-live"], "other": [".is-beta"]}
+        with mock.patch("landing_pipeline.build.load_safelist", return_value=safelist):
+            used = tree_shake_site({}, [source], ["styles"])["used_selectors"]["styles"]
+        css = ".card.is-live { a: b } .card.is-beta { c: d } .card.is-new { e: f }"
+        self.assertEqual(shake_css(css, set(used)), ".card.is-live { a: b }")
+
+    def test_unused_selectors_reports_what_tree_shaking_dropped(self):
+        html = '<div class="card is-new is-unstyled"></div>'
+        css = ".card { a: b } .is-new { c: d }"
+        self.assertEqual(unused_selectors(html, USED, css), [".is-new"])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Design tokens for the generated landing pages
+- palette() computes every derived shade of a brand color once per color (alpha steps, gradient)
+- Shared stylesheets reference the tokens, e.g. var(--primary-30) or var(--primary-gradient)
+- design_tokens() emits only the tokens a stylesheet actually uses, as custom properties for the page's :root
+"""
+
+import re
+from functools import lru_cache
+
+from landing_pipeline.stylesheets import load_stylesheet
+
+# Opacity steps available as --<role>-05 ... --<role>-90
+ALPHA_STEPS = (5, 10, 15, 20, 25, 30, 40, 50, 60, 70, 80, 90)
+
+TOKEN_REFERENCE = re.compile(r"var\(--([a-z]+)(-[a-z0-9]+)?\)")
+
+def hex_to_rgb(hex_color):
+    """Convert '#rrggbb' to an (r, g, b) tuple"""
+    hex_color = hex_color.lstrip('#')
+    return tuple(int(hex_color[i:i + 2], 16) for i in (0, 2, 4))
+
+def _alpha(value):
+    return f"{value / 100:.2f}".rstrip("0").rstrip(".")
+
+@lru_cache(maxsize=None)
+def palette(hex_color):
+    """Every token suffix for one color: {'': '#ef4444', '-30': 'rgba(239, 68, 68, 0.3)', ...}"""
+    r, g, b = hex_to_rgb(hex_color)
+    tokens = {"": hex_color}
+    for step in ALPHA_STEPS:
+        tokens[f"-{step:02d}"] = f"rgba({r}, {g}, {b}, {_alpha(step)})"
+    tokens["-gradient"] = f"linear-gradient(135deg, {hex_color} 0%, {tokens['-80']} 100%)"
+    return tokens
+
+@lru_cache(maxsize=None)
+def _used_tokens(css):
+    """Sorted (role, suffix) pairs referenced by a stylesheet"""
+    return tuple(sorted(set(TOKEN_REFERENCE.findall(css))))
+
+@lru_cache(maxsize=None)
+def _declarations(css, indent, colors):
+    roles = dict(colors)
+    lines = []
+    for role, suffix in _used_tokens(css):
+        if role in roles:
+            lines.append(f"--{role}{suffix}: {palette(roles[role])[suffix]};")
+    return ("\n" + indent).join(lines)
+
+def design_tokens(stylesheet, site=None, indent="            ", **colors):
+    """Custom property declarations for a page, e.g. design_tokens('gaming_v2', site, primary='#ef4444')"""
+    _, css = load_stylesheet(stylesheet, site)
+    return _declarations(css, indent, tuple(sorted(colors.items())))
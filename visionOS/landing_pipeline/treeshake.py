@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""
+Unused-CSS tree shaking for the shared stylesheets
+- Collects the classes, ids and elements the generator can emit (page template,
+  fragments and markup strings in the generator module) plus a per-stylesheet safelist
+- Drops rules whose selectors match none of them, empty @media/@supports blocks
+  and @keyframes no kept rule animates
+- Runs before the pages are rendered, because each page links the fingerprint of the
+  shaken stylesheet; unused_selectors() checks rendered pages against the result
+"""
+
+import json
+import os
+import re
+
+from landing_pipeline.templates import TEMPLATE_DIR
+
+SAFELIST_PATH = os.path.join(TEMPLATE_DIR, "css_safelist.json")
+
+# Always kept: they match whatever document the stylesheet is loaded into
+ALWAYS_USED = {"*", ":root", "html", "body"}
+
+CLASS_ATTRIBUTE = re.compile(r"""\bclass\s*=\s*["']([^"']*)["']""", re.I)
+ID_ATTRIBUTE = re.compile(r"""\bid\s*=\s*["']([^"']*)["']""", re.I)
+TAG = re.compile(r"<([a-zA-Z][a-zA-Z0-9-]*)")
+# Classes and selectors that scripts add, toggle or query
+JS_CLASS_CALL = re.compile(r"classList\.(?:add|remove|toggle|contains|replace)\(([^)]*)\)")
+JS_SELECTOR_CALL = re.compile(r"""querySelector(?:All)?\(\s*["']([^"']+)["']""")
+STRING_LITERAL = re.compile(r"""["']([\w-]+)["']""")
+TEMPLATE_PLACEHOLDER = re.compile(r"\{\{.*?\}\}")
+
+PSEUDO = re.compile(r"::?[\w-]+")
+# Innermost parenthesised argument, e.g. of :not(), :is() or :nth-child(); removed until none are left
+PSEUDO_ARGUMENT = re.compile(r"\([^()]*\)")
+ATTRIBUTE_SELECTOR = re.compile(r"\[[^\]]*\]")
+COMBINATOR = re.compile(r"\s*[>+~]\s*|\s+")
+SIMPLE = re.compile(r"([.#]?)(-?[_a-zA-Z][\w-]*|\*)")
+ANIMATION = re.compile(r"animation(?:-name)?\s*:\s*([^;}]+)", re.I)
+# url(...) without quotes may contain ';', '{' and '}'
+UNQUOTED_URL = re.compile(r"""url\(\s*[^\s"')][^)]*\)""", re.I)
+
+def markup_selectors(text):
+    """'.class', '#id' and element names used by markup (or markup strings in source code)"""
+    used = set()
+    for value in CLASS_ATTRIBUTE.findall(text):
+        used.update("." + name for name in TEMPLATE_PLACEHOLDER.sub(" ", value).split())
+    for value in ID_ATTRIBUTE.findall(text):
+        if value.strip() and "{{" not in value:
+            used.add("#" + value.strip())
+    used.update(tag.lower() for tag in TAG.findall(text))
+    for arguments in JS_CLASS_CALL.findall(text):
+        used.update("." + name for name in STRING_LITERAL.findall(arguments))
+    for selector in JS_SELECTOR_CALL.findall(text):
+        used.update(prefix + name for prefix, name in SIMPLE.findall(selector) if prefix)
+    return used
+
+def source_selectors(paths):
+    """Union of markup_selectors() over template, fragment and generator source files"""
+    used = set()
+    for path in paths:
+        with open(path, encoding="utf-8") as f:
+            used |= markup_selectors(f.read())
+    return used
+
+def load_safelist(path=SAFELIST_PATH):
+    """{stylesheet name: [selector, ...]} for classes toggled at runtime; {} without a safelist file"""
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+def selector_can_match(selector, used):
+    """False only when some compound of the selector needs a class, id or element nobody uses"""
+    selector = ATTRIBUTE_SELECTOR.sub("", selector)
+    while PSEUDO_ARGUMENT.search(selector):
+        selector = PSEUDO_ARGUMENT.sub("", selector)
+    selector = PSEUDO.sub("", selector).strip()
+    if not selector:
+        return True
+    for compound in COMBINATOR.split(selector):
+        for prefix, name in SIMPLE.findall(compound):
+            token = prefix + (name if prefix else name.lower())
+            if token not in ALWAYS_USED and token not in used:
+                return False
+    return True
+
+def split_selectors(prelude):
+    """Split a selector list on top-level commas"""
+    parts, depth, start = [], 0, 0
+    for index, char in enumerate(prelude):
+        if char in "([":
+            depth += 1
+        elif char in ")]":
+            depth -= 1
+        elif char == "," and depth == 0:
+            parts.append(prelude[start:index])
+            start = index + 1
+    parts.append(prelude[start:])
+    return parts
+
+def _skip(css, index, stop):
+    """Index of the first character of stop outside strings, url(...) and comments"""
+    while index < len(css):
+        char = css[index]
+        url = UNQUOTED_URL.match(css, index) if char in "uU" else None
+        if url:
+            index = url.end() - 1
+        elif char in "\"'":
+            index = css.find(char, index + 1)
+            if index < 0:
+                return len(css)
+        elif css.startswith("/*", index):
+            index = css.find("*/", index + 2)
+            if index < 0:
+                return len(css)
+            index += 1
+        elif char in stop:
+            return index
+        index += 1
+    return len(css)
+
+def parse_rules(css):
+    """[(leading text, prelude, body or None, trailing '}' or ';')] for one level of a stylesheet"""
+    rules = []
+    index = 0
+    while index < len(css):
+        start = index
+        while index < len(css):
+            if css[index].isspace():
+                index += 1
+            elif css.startswith("/*", index):
+                end = css.find("*/", index + 2)
+                index = len(css) if end < 0 else end + 2
+            else:
+                break
+        if index >= len(css):
+            rules.append((css[start:], "", None, ""))
+            break
+        open_index = _skip(css, index, "{;")
+        if open_index >= len(css) or css[open_index] == ";":
+            end = min(open_index + 1, len(css))
+            rules.append((css[start:index], css[index:end - 1] if end > index else "", None, css[end - 1:end]))
+            index = end
+            continue
+        depth, cursor = 1, open_index + 1
+        while depth and cursor < len(css):
+            cursor = _skip(css, cursor, "{}")
+            if cursor < len(css):
+                depth += 1 if css[cursor] == "{" else -1
+                cursor += 1
+        rules.append((css[start:index], css[index:open_index], css[open_index + 1:cursor - 1], "}"))
+        index = cursor
+    return rules
+
+def _shake_level(css, used):
+    out = []
+    for leading, prelude, body, closing in parse_rules(css):
+        if body is None:
+            out.append(leading + prelude + closing)
+            continue
+        name = prelude.strip().lower()
+        if name.startswith(("@media", "@supports", "@layer", "@container")):
+            inner = _shake_level(body, used)
+            if inner.strip():
+                out.append(f"{leading}{prelude}{{{inner}}}")
+        elif name.startswith("@"):
+            out.append(f"{leading}{prelude}{{{body}}}")
+        else:
+            selectors = split_selectors(prelude)
+            kept = [s for s in selectors if selector_can_match(s, used)]
+            if len(kept) == len(selectors):
+                out.append(f"{leading}{prelude}{{{body}}}")
+            elif kept:
+                trailing = prelude[len(prelude.rstrip()):]
+                out.append(f"{leading}{','.join(kept).strip()}{trailing}{{{body}}}")
+    return "".join(out)
+
+def _drop_unused_keyframes(css):
+    animated = set()
+    for value in ANIMATION.findall(css):
+        animated.update(re.findall(r"-?[_a-zA-Z][\w-]*", value))
+    out = []
+    for leading, prelude, body, closing in parse_rules(css):
+        name = prelude.strip()
+        if body is not None and re.match(r"@(-\w+-)?keyframes\s", name, re.I):
+            if name.split()[-1] not in animated:
+                continue
+        out.append(leading + prelude + (f"{{{body}}}" if body is not None else closing))
+    return "".join(out)
+
+def shake_css(css, used):
+    """Stylesheet without the rules that cannot match the used selectors"""
+    return _drop_unused_keyframes(_shake_level(css, used))
+
+def stylesheet_selectors(css):
+    """Classes and ids a stylesheet has rules for"""
+    without_blocks = re.sub(r"\{[^{}]*\}", "{}", re.sub(r"/\*.*?\*/", "", css, flags=re.S))
+    return set(re.findall(r"[.#]-?[_a-zA-Z][\w-]*", without_blocks))
+
+def unused_selectors(html, used, full_css):
+    """Classes/ids a rendered page uses that the stylesheet styles but tree shaking dropped"""
+    page = {token for token in markup_selectors(html) if token[0] in ".#"}
+    return sorted((page - used) & stylesheet_selectors(full_css))
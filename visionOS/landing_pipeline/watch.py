@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+Watch mode for the landing-page generators (--watch)
+- Watches the generator's catalog file, everything under landing_templates/ and the loaded
+  generator and pipeline modules; inotify on Linux, mtime polling everywhere else
+- Catalog, template, stylesheet and config edits rebuild in-process, and the build
+  manifest limits the re-render to the apps whose inputs changed
+- Python edits restart the generator with the same arguments
+- serve.py --directory <visionOS dir> reloads open pages once their files are rewritten
+"""
+
+import ctypes
+import ctypes.util
+import os
+import select
+import sys
+import time
+import traceback
+
+from landing_pipeline.build import summarize
+from landing_pipeline.catalog import catalog_path, forget_catalog
+from landing_pipeline.templates import TEMPLATE_DIR
+
+VISIONOS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+POLL_INTERVAL = 0.25
+# Editors often save in several steps (truncate + write, or write + rename)
+SETTLE_DELAY = 0.02
+
+IN_MODIFY = 0x002
+IN_ATTRIB = 0x004
+IN_CLOSE_WRITE = 0x008
+IN_MOVED_TO = 0x080
+IN_CREATE = 0x100
+IN_DELETE = 0x200
+WATCH_MASK = IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE | IN_DELETE
+
+class InotifyWatcher:
+    """Blocks until something changes in one of the watched directories (Linux)"""
+
+    name = "inotify"
+
+    def __init__(self, directories):
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        self.fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        for directory in directories:
+            if libc.inotify_add_watch(self.fd, os.fsencode(directory), WATCH_MASK) < 0:
+                error = ctypes.get_errno()
+                self.close()
+                raise OSError(error, f"cannot watch {directory}")
+
+    def wait(self):
+        select.select([self.fd], [], [])
+        try:
+            while os.read(self.fd, 65536):
+                pass
+        except BlockingIOError:
+            pass  # queue drained; the snapshot decides what actually changed
+
+    def close(self):
+        os.close(self.fd)
+
+class PollingWatcher:
+    """Fallback when inotify is unavailable: the caller compares mtimes every interval"""
+
+    name = "polling"
+
+    def __init__(self, interval=POLL_INTERVAL):
+        self.interval = interval
+
+    def wait(self):
+        time.sleep(self.interval)
+
+    def close(self):
+        pass
+
+def make_watcher(directories):
+    """inotify when the platform has it, else mtime polling"""
+    if sys.platform.startswith("linux"):
+        try:
+            return InotifyWatcher(directories)
+        except (OSError, AttributeError):  # AttributeError: a libc without inotify symbols
+            pass
+    return PollingWatcher()
+
+def python_sources():
+    """Files of the loaded generator and pipeline modules"""
+    paths = set()
+    for module in list(sys.modules.values()):
+        path = getattr(module, "__file__", None)
+        if path and path.endswith(".py"):
+            path = os.path.abspath(path)
+            if path.startswith(VISIONOS_DIR + os.sep):
+                paths.add(path)
+    return paths
+
+def template_files():
+    """Templates, fragments, stylesheets and JSON configs under landing_templates/"""
+    paths = []
+    for root, directories, files in os.walk(TEMPLATE_DIR):
+        directories[:] = [name for name in directories if not name.startswith(".")]
+        paths.extend(os.path.join(root, name) for name in files if not name.startswith("."))
+    return paths
+
+def snapshot(paths):
+    """{path: mtime in ns, or None for missing files}"""
+    state = {}
+    for path in paths:
+        try:
+            state[path] = os.stat(path).st_mtime_ns
+        except FileNotFoundError:
+            state[path] = None
+    return state
+
+def changed_paths(before, after):
+    return sorted(path for path in set(before) | set(after) if before.get(path) != after.get(path))
+
+def restart():
+    """Re-run the generator with the same command line so edited Python code is loaded"""
+    sys.stdout.flush()
+    os.execv(sys.executable, [sys.executable, *sys.argv])
+
+def watch_pages(rebuild, catalog):
+    """Call rebuild() whenever a watched input changes; runs until Ctrl+C
+
+    rebuild re-selects the apps and returns build_pages() results. Errors (catalog
+    validation, budgets, template mistakes) are reported and the watch continues.
+    """
+    python = python_sources()
+
+    def watched():
+        return [catalog_path(catalog), *template_files(), *python]
+
+    state = snapshot(watched())
+    watcher = make_watcher(sorted({os.path.dirname(path) for path in state}))
+    print(f"👀 Watching {len(state)} files ({watcher.name}); press Ctrl+C to stop\n")
+    try:
+        while True:
+            watcher.wait()
+            time.sleep(SETTLE_DELAY)
+            current = snapshot(watched())
+            changed = changed_paths(state, current)
+            state = current
+            if not changed:
+                continue
+            names = ", ".join(os.path.relpath(path, VISIONOS_DIR) for path in changed)
+            if python.intersection(changed):
+                print(f"🔁 {names} changed; restarting")
+                restart()  # the inotify descriptor is close-on-exec
+            if catalog_path(catalog) in changed:
+                forget_catalog(catalog)
+            start = time.perf_counter()
+            try:
+                results = rebuild()
+            except SystemExit as e:
+                if isinstance(e.code, str):
+                    print(e.code)
+                print(f"⚠️  {names} changed; build failed, waiting for the next change\n")
+                continue
+            except Exception:
+                traceback.print_exc()
+                print(f"⚠️  {names} changed; build failed, waiting for the next change\n")
+                continue
+            elapsed = (time.perf_counter() - start) * 1000
+            print(f"🔄 {names} changed: {summarize(results)} in {elapsed:.0f} ms\n")
+    except KeyboardInterrupt:
+        print("\n👋 Stopped watching")
+    finally:
+        watcher.close()
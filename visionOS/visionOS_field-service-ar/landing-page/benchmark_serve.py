@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Benchmark for the landing-page server's large-file path
+Usage: python3 benchmark_serve.py [--size MB] [--requests N] [--clients N] [--mode asyncio|pool]
+
+Serves one large file (a stand-in for a trailer video) twice: with sendfile() and with
+--no-sendfile, which copies it through Python buffers. Each run downloads the file
+--requests times over keep-alive connections and reports throughput and the server
+process's CPU time per MB (user + system, from its resource usage once it exits).
+"""
+
+import argparse
+import http.client
+import os
+import resource
+import shutil
+import signal
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+SERVE_PY = os.path.join(os.path.dirname(os.path.abspath(__file__)), "serve.py")
+FILE_NAME = "trailer.mp4"
+READ_SIZE = 1024 * 1024
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+def wait_for(port, timeout=10):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=1).close()
+            return
+        except OSError:
+            time.sleep(0.05)
+    raise SystemExit(f"❌ serve.py did not start on port {port}")
+
+def download(port, requests):
+    """Fetch the file requests times on one keep-alive connection; returns bytes received"""
+    connection = http.client.HTTPConnection("127.0.0.1", port)
+    buffer = bytearray(READ_SIZE)
+    received = 0
+    for _ in range(requests):
+        connection.request("GET", "/" + FILE_NAME)
+        response = connection.getresponse()
+        if response.status != 200:
+            raise SystemExit(f"❌ GET /{FILE_NAME} answered {response.status}")
+        while True:
+            count = response.readinto(buffer)
+            if not count:
+                break
+            received += count
+    connection.close()
+    return received
+
+def run(directory, label, options, requests, clients):
+    """{"label", "seconds", "bytes", "cpu_seconds"} for one server configuration"""
+    port = free_port()
+    before = resource.getrusage(resource.RUSAGE_CHILDREN)
+    server = subprocess.Popen(
+        [sys.executable, SERVE_PY, "--port", str(port), "--directory", directory, "--no-livereload", *options],
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    try:
+        wait_for(port)
+        download(port, 1)  # warm the page cache
+        start = time.perf_counter()
+        shares = [requests // clients + (1 if i < requests % clients else 0) for i in range(clients)]
+        with ThreadPoolExecutor(clients) as pool:
+            received = sum(pool.map(lambda share: download(port, share), shares))
+        seconds = time.perf_counter() - start
+    finally:
+        server.send_signal(signal.SIGINT)
+        server.wait(30)
+    after = resource.getrusage(resource.RUSAGE_CHILDREN)
+    cpu = (after.ru_utime - before.ru_utime) + (after.ru_stime - before.ru_stime)
+    return {"label": label, "seconds": seconds, "bytes": received, "cpu_seconds": cpu}
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare sendfile() and buffered copies in serve.py")
+    parser.add_argument("--size", type=int, default=64, metavar="MB", help="size of the served file (default: 64)")
+    parser.add_argument("--requests", type=int, default=32, metavar="N", help="downloads per run (default: 32)")
+    parser.add_argument("--clients", type=int, default=4, metavar="N", help="concurrent connections (default: 4)")
+    parser.add_argument("--mode", choices=("asyncio", "pool"), default="asyncio", help="serve.py --mode (default: asyncio)")
+    args = parser.parse_args(argv)
+    if args.size < 1 or args.requests < 1 or args.clients < 1:
+        parser.error("--size, --requests and --clients must be positive")
+
+    directory = tempfile.mkdtemp(prefix="serve-benchmark-")
+    try:
+        with open(os.path.join(directory, FILE_NAME), "wb") as f:
+            for _ in range(args.size):
+                f.write(os.urandom(1024 * 1024))
+        common = ["--mode", args.mode, "--workers", str(args.clients)]
+        results = [
+            run(directory, "sendfile", common, args.requests, args.clients),
+            run(directory, "buffered", [*common, "--no-sendfile"], args.requests, args.clients),
+        ]
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+    print(f"{args.requests} × {args.size} MB over {args.clients} connection(s), {args.mode} mode "
+          "(server CPU includes startup):")
+    for result in results:
+        megabytes = result["bytes"] / (1024 * 1024)
+        print(f"  {result['label']:>8}: {megabytes / result['seconds']:8.0f} MB/s, "
+              f"{1000 * result['cpu_seconds'] / megabytes:6.3f} ms CPU/MB "
+              f"({result['cpu_seconds']:.2f} s CPU for {megabytes:.0f} MB)")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,22 +1,345 @@
 #!/usr/bin/env python3
 """
 Simple HTTP server for testing the Field Service AR landing page
-Usage: python3 serve.py
+Usage: python3 serve.py [--port 8000] [--directory DIR] [--no-livereload]
+                        [--mode asyncio|pool] [--workers N] [--max-connections N] [--timeout S]
+                        [--cache-size MB] [--cache-revalidate S] [--cache-mode dev|production]
+                        [--compress-cache MB] [--no-compress] [--sendfile-min KB] [--no-sendfile]
 Then open http://localhost:8000 in your browser
+
+Connections are kept alive (HTTP/1.1) and answered concurrently, so a page's HTML, CSS,
+JS and images load in parallel:
+- asyncio (default): an event loop owns every connection and hands single requests to the
+  worker threads, so idle keep-alive connections and live-reload streams cost no thread
+  and a slow or idle client never holds up anyone else's request
+- pool: each connection holds one of --workers threads for as long as it stays open,
+  idle time included; live-reload streams move to a light thread of their own. Give it
+  more --workers than the keep-alive connections you expect (browsers open about six
+  per host) or requests wait up to --timeout for a worker
+Connections beyond --max-connections get a 503; Ctrl+C closes open connections and exits.
+
+Files up to CACHE_FILE_LIMIT are served from an in-memory cache (bytes, type, ETag) capped
+at --cache-size MB and evicted least recently used first. An entry is revalidated against
+the file's mtime, size and inode once it is --cache-revalidate seconds old, so with the
+default of 0 a hit costs one stat() and no read; hit/miss counters are at /__stats.
+
+--cache-mode dev (default) tells browsers not to cache anything. --cache-mode production
+behaves like the CDN: strong ETags (content hash; size and mtime for files the cache
+skips) and Last-Modified, 304 answers to If-None-Match / If-Modified-Since, a year's immutable max-age for fingerprinted assets
+(name.<hash>.css, screenshot.<hash>.<width>.webp) and no-cache revalidation for the rest.
+Production mode implies --no-livereload, so pages, ETags and precompressed siblings are
+the bytes the CDN would serve.
+
+Text responses are negotiated on Accept-Encoding (brotli preferred, then gzip): a .br/.gz
+sibling written by the generators' --precompress is served as is, otherwise the body is
+compressed on the fly and kept in an LRU cache of --compress-cache MB keyed by ETag.
+Pages with the live-reload script are always compressed on the fly.
+
+Files that are not compressed and are at least --sendfile-min KB (trailer videos,
+screenshots) skip the cache and go from disk to socket with sendfile(), without passing
+through Python buffers; smaller and in-memory bodies are copied as before.
+python3 benchmark_serve.py compares throughput and CPU per byte of the two paths.
+
+Live reload: every HTML page gets a small script that listens on /__livereload
+(server-sent events) and reloads once its file changes on disk. Serve the whole
+visionOS directory and run a generator with --watch to preview template edits:
+    python3 serve.py --directory ../..
+    python3 generate_gaming_v2_complete.py --watch
 """
 
+import argparse
+import asyncio
+import email.utils
+import gzip
+import hashlib
 import http.server
-import socketserver
+import io
+import json
 import os
+import re
+import socket
+import stat
 import sys
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import parse_qs, urlsplit
+
+try:
+    import brotli
+except ImportError:  # optional dependency: pip install brotli
+    brotli = None
 
 PORT = 8000
+MODES = ("asyncio", "pool")
+WORKERS = 16
+MAX_CONNECTIONS = 128
+# Idle keep-alive connections are closed after this many seconds (also the socket write timeout)
+IDLE_TIMEOUT = 10
+
+CACHE_SIZE_MB = 64
+# Larger files are streamed from disk rather than cached
+CACHE_FILE_LIMIT = 4 * 1024 * 1024
+STATS_PATH = "/__stats"
+SENDFILE_MIN_KB = 256
+
+CACHE_MODES = ("dev", "production")
+# Cache-Control per mode; fingerprinted assets never change under their name
+DEV_CACHE_CONTROL = "no-store, no-cache, must-revalidate"
+REVALIDATE_CACHE_CONTROL = "no-cache"
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+# Published by the landing pipeline: <name>.<10 hex digits>.css, <stem>.<10 hex digits>.<width>.<ext>
+FINGERPRINTED = re.compile(r"\.[0-9a-f]{10}(?:\.\d+)?\.\w+$")
+
+COMPRESS_CACHE_MB = 16
+# Smaller bodies are not worth a Content-Encoding
+COMPRESS_MIN_SIZE = 512
+COMPRESSIBLE_TYPES = {
+    "application/javascript", "application/json", "application/manifest+json", "application/xml", "image/svg+xml",
+}
+# Content codings in order of preference, and the suffix of the sibling --precompress writes
+ENCODINGS = ("br", "gzip")
+SIBLING_SUFFIXES = {"br": ".br", "gzip": ".gz"}
+# On-the-fly levels favour speed; the build's --precompress siblings use the maximum
+ENCODERS = {"gzip": lambda data: gzip.compress(data, compresslevel=6, mtime=0)}
+if brotli is not None:
+    ENCODERS["br"] = lambda data: brotli.compress(data, quality=5)
+
+LIVERELOAD_PATH = "/__livereload"
+LIVERELOAD_SCRIPT = (
+    b'<script>new EventSource("/__livereload?page="+encodeURIComponent(location.pathname))'
+    b'.addEventListener("reload",function(){location.reload()});</script>\n'
+)
+# How often an open page's file is checked, and how often idle event streams are pinged
+CHECK_INTERVAL = 0.1
+KEEPALIVE_INTERVAL = 15
+
+REQUEST_LIMIT = 64 * 1024
+CONTENT_LENGTH = re.compile(rb"^content-length:[ \t]*(\d+)[ \t]*\r?$", re.I | re.M)
+BUSY_RESPONSE = (
+    b"HTTP/1.1 503 Service Unavailable\r\nRetry-After: 1\r\nContent-Length: 0\r\nConnection: close\r\n\r\n"
+)
+
+def file_mtime(path):
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+def reload_event(path, page, mtime):
+    """The 'reload' event for a page once its file changed since mtime, else None"""
+    if file_mtime(path) == mtime:
+        return None
+    return b"event: reload\ndata: " + page.encode("utf-8") + b"\n\n"
+
+def stream_reload_events(connection, path, page, mtime, stopping):
+    """Send 'reload' once the page's file is rewritten, pinging idle streams; owns the connection"""
+    try:
+        idle_since = time.monotonic()
+        while not stopping.wait(CHECK_INTERVAL):
+            event = reload_event(path, page, mtime)
+            if event:
+                connection.sendall(event)
+                return
+            if time.monotonic() - idle_since > KEEPALIVE_INTERVAL:
+                connection.sendall(b": keepalive\n\n")
+                idle_since = time.monotonic()
+    except OSError:
+        pass  # the page was closed or navigated away
+    finally:
+        close(connection)
+
+def not_modified(headers, etag, mtime):
+    """True when a conditional request's validators still match (If-None-Match wins over If-Modified-Since)"""
+    if_none_match = headers.get("If-None-Match")
+    if if_none_match:
+        tags = [tag.strip() for tag in if_none_match.split(",")]
+        return "*" in tags or etag in tags
+    if_modified_since = headers.get("If-Modified-Since")
+    if if_modified_since:
+        try:
+            since = email.utils.parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError, IndexError, OverflowError):
+            return False
+        if since.tzinfo is None:
+            return False
+        return int(mtime) <= since.timestamp()
+    return False
+
+def compressible(content_type):
+    return content_type.startswith("text/") or content_type.split(";")[0] in COMPRESSIBLE_TYPES
+
+def accepted_encodings(header):
+    """ENCODINGS the Accept-Encoding header allows (q > 0), in the server's order of preference"""
+    weights = {}
+    for item in (header or "").split(","):
+        coding, *params = [part.strip() for part in item.split(";")]
+        weight = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    weight = float(value)
+                except ValueError:
+                    weight = 0.0
+        coding = coding.lower()
+        weights["gzip" if coding == "x-gzip" else coding] = weight
+    return [coding for coding in ENCODINGS if weights.get(coding, weights.get("*", 0)) > 0]
+
+def with_reload_script(body):
+    """HTML page bytes with the live-reload script before </body>"""
+    index = body.rfind(b"</body>")
+    return body[:index] + LIVERELOAD_SCRIPT + body[index:] if index >= 0 else body + LIVERELOAD_SCRIPT
+
+class FileCache:
+    """Bytes and headers of recently served files, least recently used evicted beyond max_bytes"""
+
+    def __init__(self, max_bytes, revalidate=0.0):
+        self.max_bytes = max_bytes
+        self.revalidate = revalidate
+        self.entries = OrderedDict()
+        self.size = 0
+        self.lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0, "invalidations": 0, "evictions": 0}
+
+    def get(self, path, content_type, limit=CACHE_FILE_LIMIT):
+        """{"body", "type", "mtime", "etag"} for a regular file, or None when it is missing,
+        not a regular file or larger than limit bytes; content_type(path) names its type"""
+        now = time.monotonic()
+        with self.lock:
+            entry = self.entries.get(path)
+            if entry and now - entry["checked"] < self.revalidate:
+                return self.hit(path, entry)
+        try:
+            st = os.stat(path)
+        except OSError:
+            st = None
+        with self.lock:
+            if entry and st and entry["key"] == (st.st_mtime_ns, st.st_size, st.st_ino):
+                entry["checked"] = now
+                return self.hit(path, entry)
+            if entry and self.entries.get(path) is entry:
+                self.remove(path)
+                self.stats["invalidations"] += 1
+        if not st or not stat.S_ISREG(st.st_mode) or st.st_size > limit:
+            return None
+        try:
+            with open(path, "rb") as f:
+                st = os.fstat(f.fileno())
+                body = f.read()
+        except OSError:
+            return None
+        entry = {
+            "body": body,
+            "type": content_type(path),
+            "mtime": st.st_mtime,
+            "etag": '"%s"' % hashlib.sha256(body).hexdigest()[:32],
+            "key": (st.st_mtime_ns, st.st_size, st.st_ino),
+            "checked": now,
+        }
+        with self.lock:
+            self.stats["misses"] += 1
+            if len(body) <= self.max_bytes:
+                if path in self.entries:
+                    self.remove(path)
+                self.entries[path] = entry
+                self.size += len(body)
+                while self.size > self.max_bytes:
+                    self.remove(next(iter(self.entries)))
+                    self.stats["evictions"] += 1
+        return entry
+
+    def hit(self, path, entry):
+        self.entries.move_to_end(path)
+        self.stats["hits"] += 1
+        return entry
+
+    def remove(self, path):
+        self.size -= len(self.entries.pop(path)["body"])
+
+    def report(self):
+        with self.lock:
+            return {**self.stats, "entries": len(self.entries), "bytes": self.size, "max_bytes": self.max_bytes}
+
+class CompressedCache:
+    """On-the-fly compressed bodies keyed by (ETag, coding), least recently used evicted beyond max_bytes"""
+
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()
+        self.size = 0
+        self.lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0, "evictions": 0, "precompressed": 0}
+
+    def get(self, etag, coding, body):
+        key = (etag, coding)
+        with self.lock:
+            data = self.entries.get(key)
+            if data is not None:
+                self.entries.move_to_end(key)
+                self.stats["hits"] += 1
+                return data
+        data = ENCODERS[coding](body)
+        with self.lock:
+            self.stats["misses"] += 1
+            if len(data) <= self.max_bytes and key not in self.entries:
+                self.entries[key] = data
+                self.size += len(data)
+                while self.size > self.max_bytes:
+                    self.size -= len(self.entries.popitem(last=False)[1])
+                    self.stats["evictions"] += 1
+        return data
+
+    def served_sibling(self):
+        with self.lock:
+            self.stats["precompressed"] += 1
+
+    def report(self):
+        with self.lock:
+            return {**self.stats, "entries": len(self.entries), "bytes": self.size, "max_bytes": self.max_bytes}
+
+def refuse(connection):
+    """Answer a connection over the limit with 503 and close it"""
+    try:
+        connection.sendall(BUSY_RESPONSE)
+    except OSError:
+        pass
+    close(connection)
+
+def close(connection):
+    """Shut a connection down (waking any thread blocked on it) and close it"""
+    try:
+        connection.shutdown(socket.SHUT_RDWR)
+    except OSError:
+        pass
+    connection.close()
 
 class MyHTTPRequestHandler(http.server.SimpleHTTPRequestHandler):
+    cache_mode = "dev"
+    # Cache-Control for the response being sent; reset after each response
+    cache_control = None
+
+    # Keep-alive: every response has a Content-Length, and reload streams close their connection
+    protocol_version = "HTTP/1.1"
+    timeout = IDLE_TIMEOUT
+    livereload = True
+    file_cache = FileCache(CACHE_SIZE_MB * 1024 * 1024)
+    # None serves every response uncompressed (--no-compress)
+    compressed_cache = CompressedCache(COMPRESS_CACHE_MB * 1024 * 1024)
+    # Smallest file sent with sendfile(); None copies every file through Python (--no-sendfile)
+    sendfile_min = SENDFILE_MIN_KB * 1024
+    # (file, page, mtime) of a live-reload stream the server keeps open after the handler returns
+    reload_watch = None
+
     def end_headers(self):
         # Add CORS headers for local development
         self.send_header('Access-Control-Allow-Origin', '*')
-        self.send_header('Cache-Control', 'no-store, no-cache, must-revalidate')
+        if self.cache_mode == "dev":
+            self.send_header('Cache-Control', DEV_CACHE_CONTROL)
+        else:
+            self.send_header('Cache-Control', self.cache_control or REVALIDATE_CACHE_CONTROL)
+        self.cache_control = None
         super().end_headers()
 
     def log_message(self, format, *args):
@@ -26,24 +349,449 @@ class MyHTTPRequestHandler(http.server.SimpleHTTPRequestHandler):
                           self.log_date_time_string(),
                           format % args))
 
-def main():
+    def do_GET(self):
+        url_path = urlsplit(self.path).path
+        if self.livereload and url_path == LIVERELOAD_PATH:
+            self.send_reload_events()
+            return
+        if url_path == STATS_PATH:
+            self.send_stats()
+            return
+        super().do_GET()
+
+    def send_stats(self):
+        """File cache counters as JSON"""
+        stats = {"file_cache": self.file_cache.report()}
+        if self.compressed_cache:
+            stats["compression"] = self.compressed_cache.report()
+        body = json.dumps(stats, indent=2).encode("utf-8") + b"\n"
+        self.cache_control = "no-store"
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def page_file(self, url_path):
+        """File on disk behind a page URL ('/app/docs/' -> app/docs/index.html)"""
+        path = self.translate_path(url_path)
+        if os.path.isdir(path):
+            path = os.path.join(path, "index.html")
+        return path
+
+    def send_head(self):
+        """Serve files from the file cache, HTML pages with the live-reload script before </body>
+
+        Directory URLs map to their index.html; in production, files the cache skips are
+        sent by send_uncached(). Redirects, listings, errors and dev-mode uncached files are
+        left to SimpleHTTPRequestHandler.
+        """
+        url_path = urlsplit(self.path).path
+        path = self.translate_path(url_path)
+        if url_path.endswith("/"):
+            path = os.path.join(path, "index.html")
+        entry = self.file_cache.get(path, self.guess_type, self.cache_limit(path))
+        if entry is None:
+            if self.cache_mode == "production" and os.path.isfile(path):
+                return self.send_uncached(path)
+            return super().send_head()
+        body, etag = entry["body"], entry["etag"]
+        injected = self.livereload and path.endswith(".html")
+        if injected:
+            body = with_reload_script(body)
+            etag = etag[:-1] + '-livereload"'
+        negotiated = self.compressed_cache is not None and compressible(entry["type"])
+        encoding = None
+        if negotiated:
+            body, etag, encoding = self.negotiate_encoding(path, entry, body, etag, injected)
+        production = self.cache_mode == "production"
+        if production:
+            self.cache_control = IMMUTABLE_CACHE_CONTROL if FINGERPRINTED.search(path) else REVALIDATE_CACHE_CONTROL
+            if not_modified(self.headers, etag, entry["mtime"]):
+                self.send_response(304)
+                if negotiated:
+                    self.send_header("Vary", "Accept-Encoding")
+                self.send_header("ETag", etag)
+                self.send_header("Last-Modified", self.date_time_string(entry["mtime"]))
+                self.end_headers()
+                return None
+        self.send_response(200)
+        self.send_header("Content-Type", entry["type"])
+        self.send_header("Content-Length", str(len(body)))
+        if encoding:
+            self.send_header("Content-Encoding", encoding)
+        if negotiated:
+            self.send_header("Vary", "Accept-Encoding")
+        self.send_header("Last-Modified", self.date_time_string(entry["mtime"]))
+        if production:
+            self.send_header("ETag", etag)
+        self.end_headers()
+        return io.BytesIO(body)
+
+    def send_uncached(self, path):
+        """Production headers for a file the cache skips (sendfile-sized or over the limit)
+
+        The ETag comes from the file's size and mtime, so conditional requests get a 304
+        without reading the file.
+        """
+        try:
+            f = open(path, "rb")
+        except OSError:
+            return super().send_head()
+        try:
+            st = os.fstat(f.fileno())
+            etag = '"%x-%x"' % (st.st_size, st.st_mtime_ns)
+            self.cache_control = IMMUTABLE_CACHE_CONTROL if FINGERPRINTED.search(path) else REVALIDATE_CACHE_CONTROL
+            if not_modified(self.headers, etag, st.st_mtime):
+                f.close()
+                self.send_response(304)
+                self.send_header("ETag", etag)
+                self.send_header("Last-Modified", self.date_time_string(st.st_mtime))
+                self.end_headers()
+                return None
+            self.send_response(200)
+            self.send_header("Content-Type", self.guess_type(path))
+            self.send_header("Content-Length", str(st.st_size))
+            self.send_header("Last-Modified", self.date_time_string(st.st_mtime))
+            self.send_header("ETag", etag)
+            self.end_headers()
+            return f
+        except:
+            f.close()
+            raise
+
+    def cache_limit(self, path):
+        """Largest file served from memory; bigger files that are never compressed go out with sendfile()"""
+        if self.sendfile_min is not None and not compressible(self.guess_type(path)):
+            return min(CACHE_FILE_LIMIT, self.sendfile_min - 1)
+        return CACHE_FILE_LIMIT
+
+    def copyfile(self, source, outputfile):
+        """Send regular files of at least sendfile_min bytes with sendfile(); buffered copies otherwise"""
+        try:
+            size = os.fstat(source.fileno()).st_size
+        except (AttributeError, OSError):  # in-memory bodies have no file descriptor
+            size = -1
+        if self.sendfile_min is None or size < self.sendfile_min:
+            super().copyfile(source, outputfile)
+            return
+        outputfile.flush()
+        # socket.sendfile() uses os.sendfile() where the platform has it and send() elsewhere
+        self.connection.sendfile(source)
+
+    def negotiate_encoding(self, path, entry, body, etag, injected):
+        """(body, ETag, coding or None) in the best encoding the client accepts
+
+        A precompressed sibling is used when it is at least as new as the file; pages
+        with the live-reload script differ from their siblings and are compressed here.
+        """
+        for coding in accepted_encodings(self.headers.get("Accept-Encoding")):
+            if not injected:
+                sibling = self.file_cache.get(path + SIBLING_SUFFIXES[coding], self.guess_type)
+                if sibling and sibling["mtime"] >= entry["mtime"]:
+                    self.compressed_cache.served_sibling()
+                    return sibling["body"], sibling["etag"], coding
+            if coding in ENCODERS and len(body) >= COMPRESS_MIN_SIZE:
+                return self.compressed_cache.get(etag, coding, body), f'{etag[:-1]}-{coding}"', coding
+        return body, etag, None
+
+    def start_reload_events(self):
+        """Open the event stream for a page; returns (file, page, mtime) to watch"""
+        page = parse_qs(urlsplit(self.path).query).get("page", ["/"])[0]
+        path = self.page_file(page)
+        mtime = file_mtime(path)
+        self.close_connection = True
+        self.cache_control = "no-store"
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.end_headers()
+        self.wfile.write(b"retry: 500\n\n")
+        self.wfile.flush()
+        return path, page, mtime
+
+    def send_reload_events(self):
+        """Open the page's event stream; the server watches it once this worker is free"""
+        try:
+            self.reload_watch = self.start_reload_events()
+        except OSError:
+            pass  # the page was closed or navigated away
+
+class EventLoopRequestHandler(MyHTTPRequestHandler):
+    """Answers one request the event loop has already read"""
+
+    def setup(self):
+        self.connection, request = self.request
+        self.rfile = io.BytesIO(request)
+        self.wfile = self.connection.makefile("wb")
+
+    def handle(self):
+        self.handle_one_request()
+
+class PoolServer(http.server.HTTPServer):
+    """Serves each connection on one of a fixed number of worker threads, idle keep-alive time included"""
+    allow_reuse_address = True
+
+    def __init__(self, address, handler, workers=WORKERS, max_connections=MAX_CONNECTIONS):
+        super().__init__(address, handler)
+        self.pool = ThreadPoolExecutor(workers, thread_name_prefix="serve")
+        self.max_connections = max_connections
+        self.connections = set()
+        self.lock = threading.Lock()
+        self.stopping = threading.Event()
+
+    def process_request(self, request, client_address):
+        # Connections wait in the pool's queue until a worker is free, up to max_connections
+        with self.lock:
+            busy = len(self.connections) >= self.max_connections
+            if not busy:
+                self.connections.add(request)
+        if busy:
+            refuse(request)
+            return
+        self.pool.submit(self.process_request_thread, request, client_address)
+
+    def finish_request(self, request, client_address):
+        return self.RequestHandlerClass(request, client_address, self).reload_watch
+
+    def process_request_thread(self, request, client_address):
+        watch = None
+        try:
+            watch = self.finish_request(request, client_address)
+            if watch:
+                threading.Thread(
+                    target=self.stream_thread, args=(request, *watch), name="serve-livereload", daemon=True
+                ).start()
+        except Exception:
+            if not self.stopping.is_set():
+                self.handle_error(request, client_address)
+        finally:
+            if not watch:
+                self.release(request)
+                self.shutdown_request(request)
+
+    def stream_thread(self, request, *watch):
+        try:
+            stream_reload_events(request, *watch, self.stopping)
+        finally:
+            self.release(request)
+
+    def release(self, request):
+        with self.lock:
+            self.connections.discard(request)
+
+    def server_close(self):
+        self.stopping.set()
+        super().server_close()
+        with self.lock:
+            for connection in self.connections:
+                try:
+                    connection.shutdown(socket.SHUT_RDWR)
+                except OSError:
+                    pass
+        self.pool.shutdown(wait=True, cancel_futures=True)
+
+class EventLoopServer:
+    """asyncio server: the loop reads requests and holds idle connections, worker threads answer them"""
+
+    def __init__(self, address, handler, workers=WORKERS, max_connections=MAX_CONNECTIONS):
+        self.socket = socket.create_server(address, backlog=max_connections)
+        self.socket.setblocking(False)
+        self.handler = handler
+        self.pool = ThreadPoolExecutor(workers, thread_name_prefix="serve")
+        self.max_connections = max_connections
+        self.stopping = threading.Event()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.server_close()
+
+    def serve_forever(self):
+        asyncio.run(self.serve())
+
+    def server_close(self):
+        self.stopping.set()
+        self.socket.close()
+        self.pool.shutdown(wait=True, cancel_futures=True)
+
+    async def serve(self):
+        loop = asyncio.get_running_loop()
+        connections = set()
+        try:
+            while True:
+                connection, client_address = await loop.sock_accept(self.socket)
+                if len(connections) >= self.max_connections:
+                    refuse(connection)
+                    continue
+                task = asyncio.create_task(self.handle_connection(connection, client_address))
+                connections.add(task)
+                task.add_done_callback(connections.discard)
+        finally:
+            self.stopping.set()
+            for task in connections:
+                task.cancel()
+            await asyncio.gather(*connections, return_exceptions=True)
+
+    async def read_request(self, connection, buffer):
+        """(one request's bytes, what follows it); (None, b"") when the client went away or idled out"""
+        loop = asyncio.get_running_loop()
+        while True:
+            end = buffer.find(b"\r\n\r\n")
+            if end >= 0:
+                length = CONTENT_LENGTH.search(buffer, 0, end + 2)
+                size = end + 4 + (int(length.group(1)) if length else 0)
+                if len(buffer) >= size:
+                    return buffer[:size], buffer[size:]
+            if len(buffer) > REQUEST_LIMIT:
+                return None, b""
+            try:
+                data = await asyncio.wait_for(loop.sock_recv(connection, REQUEST_LIMIT), self.handler.timeout)
+            except (TimeoutError, asyncio.TimeoutError, OSError):
+                return None, b""
+            if not data:
+                return None, b""
+            buffer += data
+
+    def respond(self, connection, client_address, request):
+        """Answer one request on a worker thread; returns (keep alive, reload stream to watch)"""
+        connection.settimeout(self.handler.timeout)
+        try:
+            handler = EventLoopRequestHandler((connection, request), client_address, self)
+        except OSError:
+            return False, None
+        finally:
+            connection.setblocking(False)
+        return not handler.close_connection, handler.reload_watch
+
+    async def handle_connection(self, connection, client_address):
+        loop = asyncio.get_running_loop()
+        buffer = b""
+        try:
+            while True:
+                request, buffer = await self.read_request(connection, buffer)
+                if request is None:
+                    return
+                keep_alive, watch = await loop.run_in_executor(
+                    self.pool, self.respond, connection, client_address, request
+                )
+                if watch:
+                    await self.stream_reload_events(connection, *watch)
+                if not keep_alive:
+                    return
+        finally:
+            close(connection)
+
+    async def stream_reload_events(self, connection, path, page, mtime):
+        """stream_reload_events() on the event loop: one timer per open page instead of a thread"""
+        loop = asyncio.get_running_loop()
+        idle_since = time.monotonic()
+        try:
+            while True:
+                await asyncio.sleep(CHECK_INTERVAL)
+                event = reload_event(path, page, mtime)
+                if event:
+                    await loop.sock_sendall(connection, event)
+                    return
+                if time.monotonic() - idle_since > KEEPALIVE_INTERVAL:
+                    await loop.sock_sendall(connection, b": keepalive\n\n")
+                    idle_since = time.monotonic()
+        except OSError:
+            pass  # the page was closed or navigated away
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve landing pages locally with live reload")
+    parser.add_argument("--port", type=int, default=PORT, help=f"port to listen on (default: {PORT})")
+    parser.add_argument(
+        "--directory", metavar="DIR",
+        help="directory to serve (default: this landing page); e.g. ../.. for every visionOS app",
+    )
+    parser.add_argument(
+        "--no-livereload", action="store_true",
+        help="do not inject the live-reload script (implied by --cache-mode production)",
+    )
+    parser.add_argument(
+        "--mode", choices=MODES, default="asyncio",
+        help="asyncio: an event loop holds idle connections and workers answer single requests; "
+             "pool: each open connection holds a worker, so --workers must exceed the number of "
+             "concurrent keep-alive connections (default: asyncio)",
+    )
+    parser.add_argument(
+        "--workers", type=int, default=WORKERS, metavar="N",
+        help=f"worker threads answering requests (default: {WORKERS})",
+    )
+    parser.add_argument(
+        "--max-connections", type=int, default=MAX_CONNECTIONS, metavar="N",
+        help=f"open connections before new ones get a 503 (default: {MAX_CONNECTIONS})",
+    )
+    parser.add_argument(
+        "--timeout", type=float, default=IDLE_TIMEOUT, metavar="SECONDS",
+        help=f"close keep-alive connections idle this long (default: {IDLE_TIMEOUT})",
+    )
+    parser.add_argument(
+        "--cache-size", type=float, default=CACHE_SIZE_MB, metavar="MB",
+        help=f"memory for cached files (default: {CACHE_SIZE_MB}; 0 reads every file from disk)",
+    )
+    parser.add_argument(
+        "--cache-revalidate", type=float, default=0, metavar="SECONDS",
+        help="serve cached files without checking the disk for this long (default: 0, stat on every request)",
+    )
+    parser.add_argument(
+        "--cache-mode", choices=CACHE_MODES, default="dev",
+        help="dev: browsers cache nothing; production: ETag/Last-Modified, 304 responses, long "
+             "max-age on fingerprinted assets and no live reload, like the CDN (default: dev)",
+    )
+    parser.add_argument(
+        "--compress-cache", type=float, default=COMPRESS_CACHE_MB, metavar="MB",
+        help=f"memory for bodies compressed on the fly (default: {COMPRESS_CACHE_MB})",
+    )
+    parser.add_argument("--no-compress", action="store_true", help="ignore Accept-Encoding and serve identity bodies")
+    parser.add_argument(
+        "--sendfile-min", type=float, default=SENDFILE_MIN_KB, metavar="KB",
+        help=f"send uncompressed files of at least this size with sendfile() (default: {SENDFILE_MIN_KB})",
+    )
+    parser.add_argument("--no-sendfile", action="store_true", help="copy every file through Python buffers")
+    args = parser.parse_args(argv)
+    if args.workers < 1 or args.max_connections < 1 or args.timeout <= 0:
+        parser.error("--workers, --max-connections and --timeout must be positive")
+    if args.cache_size < 0 or args.cache_revalidate < 0 or args.compress_cache < 0 or args.sendfile_min < 0:
+        parser.error("--cache-size, --cache-revalidate, --compress-cache and --sendfile-min cannot be negative")
+
     # Change to landing page directory
-    os.chdir(os.path.dirname(os.path.abspath(__file__)))
+    os.chdir(args.directory or os.path.dirname(os.path.abspath(__file__)))
 
     Handler = MyHTTPRequestHandler
+    Handler.livereload = not args.no_livereload and args.cache_mode == "dev"
+    Handler.timeout = args.timeout
+    Handler.cache_mode = args.cache_mode
+    Handler.compressed_cache = None if args.no_compress else CompressedCache(int(args.compress_cache * 1024 * 1024))
+    Handler.sendfile_min = None if args.no_sendfile else max(1, int(args.sendfile_min * 1024))
+    Handler.file_cache = FileCache(int(args.cache_size * 1024 * 1024), args.cache_revalidate)
 
-    with socketserver.TCPServer(("", PORT), Handler) as httpd:
+    Server = EventLoopServer if args.mode == "asyncio" else PoolServer
+    with Server(("", args.port), Handler, args.workers, args.max_connections) as httpd:
         print("=" * 60)
         print("🚀 Field Service AR Landing Page Server")
         print("=" * 60)
-        print(f"\n✓ Server running at: http://localhost:{PORT}")
+        print(f"\n✓ Server running at: http://localhost:{args.port}")
+        print(f"✓ Serving: {os.getcwd()}")
+        print(f"✓ Mode: {args.mode}, {args.workers} workers, up to {args.max_connections} connections")
+        print(f"✓ File cache: {args.cache_size:g} MB (counters at {STATS_PATH}), {args.cache_mode} cache headers")
+        if Handler.compressed_cache:
+            print(f"✓ Compression: {', '.join(coding for coding in ENCODINGS if coding in ENCODERS)} on the fly, "
+                  f"precompressed .br/.gz siblings when present")
+        if Handler.sendfile_min is not None:
+            print(f"✓ sendfile() for uncompressed files from {Handler.sendfile_min // 1024} KB")
+        if Handler.livereload:
+            print("✓ Live reload: pages reload when their files change")
         print(f"✓ Press Ctrl+C to stop the server\n")
         print("=" * 60)
 
         try:
             httpd.serve_forever()
         except KeyboardInterrupt:
-            print("\n\n👋 Server stopped")
+            stats = Handler.file_cache.report()
+            print(f"\n\n👋 Server stopped (file cache: {stats['hits']} hits, {stats['misses']} misses)")
             sys.exit(0)
 
 if __name__ == "__main__":
@@ -0,0 +1,379 @@
+#!/usr/bin/env python3
+"""
+Tests for serve.py: the file cache, conditional requests and content negotiation
+Usage: python3 test_serve.py   (or python3 -m unittest test_serve from this directory)
+
+Each test serves a temporary directory from a PoolServer, or the default EventLoopServer,
+running in this process.
+"""
+
+import asyncio
+import contextlib
+import functools
+import gzip
+import http.client
+import io
+import json
+import os
+import shutil
+import socket
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import serve
+
+PAGE = b"<!DOCTYPE html><html><body>" + b"<p>Field Service AR</p>" * 100 + b"</body></html>\n"
+STYLES = b"body { color: #007AFF; }\n" * 100
+
+class ServerTestCase(unittest.TestCase):
+    """Serves a temporary directory with a handler configured by handler_options"""
+    handler_options = {}
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp(prefix="serve-test-")
+        self.addCleanup(shutil.rmtree, self.directory, True)
+        self.write("index.html", PAGE)
+        self.write("css/styles.css", STYLES)
+        self.file_cache = serve.FileCache(1024 * 1024)
+        options = {"file_cache": self.file_cache, "livereload": False, **self.handler_options}
+        self.address = self.start_server({"log_message": lambda *args: None, **options})
+
+    def start_server(self, options):
+        """Start a PoolServer with a handler subclass configured by options; returns its address"""
+        handler = type("Handler", (serve.MyHTTPRequestHandler,), options)
+        self.server = serve.PoolServer(("127.0.0.1", 0), functools.partial(handler, directory=self.directory), 4, 16)
+        thread = threading.Thread(target=self.server.serve_forever, args=(0.05,), daemon=True)
+        thread.start()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+        return self.server.server_address
+
+    def write(self, name, data, mtime=None):
+        path = os.path.join(self.directory, name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(data)
+        if mtime is not None:
+            os.utime(path, (mtime, mtime))
+        return path
+
+    def get(self, path, **headers):
+        """(status, headers, body) of one GET"""
+        with contextlib.closing(http.client.HTTPConnection(*self.address, timeout=5)) as connection:
+            connection.request("GET", path, headers=headers)
+            response = connection.getresponse()
+            return response.status, response.headers, response.read()
+
+class FileCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp(prefix="serve-test-")
+        self.addCleanup(shutil.rmtree, self.directory, True)
+
+    def write(self, name, size, mtime=1_700_000_000):
+        path = os.path.join(self.directory, name)
+        with open(path, "wb") as f:
+            f.write(b"x" * size)
+        os.utime(path, (mtime, mtime))
+        return path
+
+    def test_evicts_least_recently_used_by_bytes(self):
+        cache = serve.FileCache(250)
+        first, second, third = (self.write(name, 100) for name in ("a.css", "b.css", "c.css"))
+        cache.get(first, lambda path: "text/css")
+        cache.get(second, lambda path: "text/css")
+        cache.get(first, lambda path: "text/css")  # second is now least recently used
+        cache.get(third, lambda path: "text/css")
+        self.assertEqual(list(cache.entries), [first, third])
+        self.assertEqual(cache.size, 200)
+        self.assertEqual(cache.report()["evictions"], 1)
+
+    def test_files_larger_than_the_cache_are_served_but_not_kept(self):
+        cache = serve.FileCache(50)
+        path = self.write("big.css", 100)
+        self.assertEqual(len(cache.get(path, lambda path: "text/css")["body"]), 100)
+        self.assertEqual(cache.size, 0)
+
+    def test_mtime_change_invalidates(self):
+        cache = serve.FileCache(1024)
+        path = self.write("a.css", 10)
+        cache.get(path, lambda path: "text/css")
+        self.assertEqual(cache.get(path, lambda path: "text/css")["body"], b"x" * 10)
+        os.utime(path, (1_700_000_100, 1_700_000_100))
+        self.assertEqual(cache.get(path, lambda path: "text/css")["mtime"], 1_700_000_100)
+        self.assertEqual(cache.report()["invalidations"], 1)
+        self.assertEqual((cache.report()["hits"], cache.report()["misses"]), (1, 2))
+
+    def test_revalidate_window_skips_the_disk(self):
+        cache = serve.FileCache(1024, revalidate=60)
+        path = self.write("a.css", 10)
+        cache.get(path, lambda path: "text/css")
+        os.remove(path)
+        self.assertIsNotNone(cache.get(path, lambda path: "text/css"))
+
+    def test_missing_files_and_directories_are_not_cached(self):
+        cache = serve.FileCache(1024)
+        self.assertIsNone(cache.get(os.path.join(self.directory, "missing.css"), lambda path: "text/css"))
+        self.assertIsNone(cache.get(self.directory, lambda path: "text/css"))
+
+class CachedServingTest(ServerTestCase):
+    def test_repeat_requests_hit_the_cache(self):
+        for _ in range(3):
+            status, headers, body = self.get("/css/styles.css")
+            self.assertEqual((status, body), (200, STYLES))
+        stats = json.loads(self.get(serve.STATS_PATH)[2])["file_cache"]
+        self.assertEqual((stats["hits"], stats["misses"]), (2, 1))
+
+    def test_rewritten_file_is_served_fresh(self):
+        self.get("/css/styles.css")
+        self.write("css/styles.css", b"body { color: red; }\n" * 50, mtime=1_800_000_000)
+        self.assertEqual(self.get("/css/styles.css")[2], b"body { color: red; }\n" * 50)
+
+    def test_directory_url_serves_its_index(self):
+        status, headers, body = self.get("/")
+        self.assertEqual((status, body, headers["Content-Type"]), (200, PAGE, "text/html"))
+
+class ConditionalRequestTest(ServerTestCase):
+    handler_options = {"cache_mode": "production"}
+
+    def test_if_none_match_returns_304(self):
+        status, headers, _ = self.get("/css/styles.css")
+        self.assertEqual(status, 200)
+        status, headers_304, body = self.get("/css/styles.css", **{"If-None-Match": headers["ETag"]})
+        self.assertEqual((status, body, headers_304["ETag"]), (304, b"", headers["ETag"]))
+
+    def test_stale_etag_wins_over_if_modified_since(self):
+        _, headers, _ = self.get("/css/styles.css")
+        status, _, body = self.get(
+            "/css/styles.css", **{"If-None-Match": '"stale"', "If-Modified-Since": headers["Last-Modified"]}
+        )
+        self.assertEqual((status, body), (200, STYLES))
+
+    def test_if_modified_since_returns_304(self):
+        self.write("css/styles.css", STYLES, mtime=1_700_000_000)
+        _, headers, _ = self.get("/css/styles.css")
+        self.assertEqual(self.get("/css/styles.css", **{"If-Modified-Since": headers["Last-Modified"]})[0], 304)
+        self.assertEqual(self.get("/css/styles.css", **{"If-Modified-Since": "Mon, 01 Jan 2001 00:00:00 GMT"})[0], 200)
+
+    def test_fingerprinted_assets_are_immutable(self):
+        self.write("css/styles.0123456789.css", STYLES)
+        self.assertIn("immutable", self.get("/css/styles.0123456789.css")[1]["Cache-Control"])
+        self.assertEqual(self.get("/css/styles.css")[1]["Cache-Control"], serve.REVALIDATE_CACHE_CONTROL)
+
+    def test_files_the_cache_skips_get_an_etag(self):
+        # A sendfile-sized screenshot and a stylesheet over the cache's file limit
+        for name, size in (("shot.png", serve.SENDFILE_MIN_KB * 1024), ("big.css", serve.CACHE_FILE_LIMIT + 1)):
+            self.write(name, b"x" * size, mtime=1_700_000_000)
+            status, headers, body = self.get("/" + name)
+            self.assertEqual((status, len(body)), (200, size))
+            self.assertEqual(self.file_cache.report()["entries"], 0)
+            status, headers_304, body = self.get("/" + name, **{"If-None-Match": headers["ETag"]})
+            self.assertEqual((status, body, headers_304["ETag"]), (304, b"", headers["ETag"]))
+            status = self.get("/" + name, **{"If-Modified-Since": headers["Last-Modified"]})[0]
+            self.assertEqual(status, 304)
+            self.write(name, b"y" * size, mtime=1_700_000_100)
+            status, headers_200, _ = self.get("/" + name, **{"If-None-Match": headers["ETag"]})
+            self.assertEqual(status, 200)
+            self.assertNotEqual(headers_200["ETag"], headers["ETag"])
+
+    def test_fingerprinted_uncached_files_are_immutable(self):
+        self.write("shot.0123456789.png", b"x" * serve.SENDFILE_MIN_KB * 1024)
+        self.assertIn("immutable", self.get("/shot.0123456789.png")[1]["Cache-Control"])
+
+    def test_production_mode_disables_live_reload(self):
+        handler = serve.MyHTTPRequestHandler
+        self.addCleanup(os.chdir, os.getcwd())
+        settings = {name: getattr(handler, name) for name in (
+            "livereload", "timeout", "cache_mode", "file_cache", "compressed_cache", "sendfile_min"
+        )}
+        with mock.patch.multiple(handler, **settings), mock.patch.object(serve, "EventLoopServer", StoppedServer):
+            with contextlib.redirect_stdout(io.StringIO()), self.assertRaises(SystemExit):
+                serve.main(["--directory", self.directory, "--cache-mode", "production"])
+            self.assertFalse(handler.livereload)
+
+class AcceptEncodingTest(unittest.TestCase):
+    def test_q_values_and_wildcard(self):
+        self.assertEqual(serve.accepted_encodings("gzip;q=0, *"), ["br"])
+        self.assertEqual(serve.accepted_encodings("gzip, deflate, br;q=0.5"), ["br", "gzip"])
+        self.assertEqual(serve.accepted_encodings("x-gzip"), ["gzip"])
+        self.assertEqual(serve.accepted_encodings("*;q=0, gzip"), ["gzip"])
+
+    def test_identity_or_nothing_accepted(self):
+        self.assertEqual(serve.accepted_encodings("identity"), [])
+        self.assertEqual(serve.accepted_encodings(None), [])
+        self.assertEqual(serve.accepted_encodings("gzip;q=0, br;q=0.0"), [])
+
+class NegotiationTest(ServerTestCase):
+    handler_options = {"cache_mode": "production", "compressed_cache": None}
+
+    def setUp(self):
+        super().setUp()
+        self.compressed_cache = serve.CompressedCache(1024 * 1024)
+        self.server.RequestHandlerClass.func.compressed_cache = self.compressed_cache
+        # Siblings as the generators' --precompress writes them: renamed into place after the page
+        self.gzipped = gzip.compress(PAGE, 9)
+        self.write("index.html.gz", self.gzipped)
+        self.write("index.html.br", b"brotli bytes of index.html")
+
+    def test_index_served_from_br_sibling(self):
+        status, headers, body = self.get("/", **{"Accept-Encoding": "gzip, deflate, br"})
+        self.assertEqual((status, headers["Content-Encoding"], body), (200, "br", b"brotli bytes of index.html"))
+        self.assertEqual(self.compressed_cache.report()["precompressed"], 1)
+
+    def test_gzip_refused_wildcard_picks_br(self):
+        self.assertEqual(self.get("/", **{"Accept-Encoding": "gzip;q=0, *"})[1]["Content-Encoding"], "br")
+
+    def test_gzip_sibling(self):
+        status, headers, body = self.get("/", **{"Accept-Encoding": "gzip"})
+        self.assertEqual((headers["Content-Encoding"], body), ("gzip", self.gzipped))
+
+    def test_identity_fallback(self):
+        for accept in ("identity", "gzip;q=0, br;q=0", None):
+            status, headers, body = self.get("/", **({"Accept-Encoding": accept} if accept else {}))
+            self.assertEqual((status, body, headers["Content-Encoding"]), (200, PAGE, None))
+            self.assertEqual(headers["Vary"], "Accept-Encoding")
+
+    def test_vary_on_every_negotiated_response(self):
+        _, headers, _ = self.get("/css/styles.css", **{"Accept-Encoding": "gzip"})
+        for path, accept, etag in [
+            ("/", "br", None), ("/", "gzip", None), ("/css/styles.css", "gzip", None),
+            ("/css/styles.css", "identity", None), ("/css/styles.css", "gzip", headers["ETag"]),
+        ]:
+            request = {"Accept-Encoding": accept, **({"If-None-Match": etag} if etag else {})}
+            status, response, _ = self.get(path, **request)
+            self.assertEqual(response["Vary"], "Accept-Encoding", (path, accept, status))
+
+    def test_on_the_fly_gzip_is_cached_by_etag(self):
+        for _ in range(2):
+            status, headers, body = self.get("/css/styles.css", **{"Accept-Encoding": "gzip"})
+            self.assertEqual((headers["Content-Encoding"], gzip.decompress(body)), ("gzip", STYLES))
+        self.assertTrue(headers["ETag"].endswith('-gzip"'))
+        report = self.compressed_cache.report()
+        self.assertEqual((report["hits"], report["misses"]), (1, 1))
+
+    def test_sibling_older_than_the_page_is_ignored(self):
+        self.write("index.html.br", b"old brotli bytes", mtime=1_600_000_000)
+        self.write("index.html.gz", self.gzipped, mtime=1_600_000_000)
+        status, headers, body = self.get("/", **{"Accept-Encoding": "gzip, br"})
+        self.assertEqual(headers["Content-Encoding"], "br" if "br" in serve.ENCODERS else "gzip")
+        self.assertNotEqual(body, b"old brotli bytes")
+        self.assertNotEqual(headers["ETag"], self.get("/", **{"Accept-Encoding": "identity"})[1]["ETag"])
+
+    def test_images_are_not_negotiated(self):
+        self.write("shot.png", b"\x89PNG" + bytes(2048))
+        status, headers, _ = self.get("/shot.png", **{"Accept-Encoding": "gzip, br"})
+        self.assertEqual((headers["Content-Encoding"], headers["Vary"]), (None, None))
+
+class EventLoopServerTest(ServerTestCase):
+    """The default --mode asyncio server, configured the way main() does: on the handler class, serving the cwd"""
+    max_connections = 16
+
+    def start_server(self, options):
+        self.addCleanup(os.chdir, os.getcwd())
+        os.chdir(self.directory)
+        patch = mock.patch.multiple(serve.MyHTTPRequestHandler, **options)
+        patch.start()
+        self.addCleanup(patch.stop)
+        self.server = serve.EventLoopServer(("127.0.0.1", 0), serve.MyHTTPRequestHandler, 4, self.max_connections)
+        loop = asyncio.new_event_loop()
+        serving = loop.create_task(self.server.serve())
+
+        def run():
+            try:
+                loop.run_until_complete(serving)
+            except asyncio.CancelledError:
+                pass
+            finally:
+                loop.close()
+
+        thread = threading.Thread(target=run, daemon=True)
+        thread.start()
+
+        def stop():
+            loop.call_soon_threadsafe(serving.cancel)
+            thread.join(5)
+            self.server.server_close()
+
+        self.addCleanup(stop)
+        return self.server.socket.getsockname()
+
+    def test_keep_alive_reuses_the_connection(self):
+        with contextlib.closing(http.client.HTTPConnection(*self.address, timeout=5)) as connection:
+            sockets = set()
+            for path, expected in [("/", PAGE), ("/css/styles.css", STYLES), ("/", PAGE)]:
+                connection.request("GET", path)
+                response = connection.getresponse()
+                self.assertEqual((response.status, response.read()), (200, expected))
+                sockets.add(connection.sock)
+        self.assertEqual(len(sockets), 1)
+
+    def test_pipelined_requests_are_answered_in_order(self):
+        requests = (
+            b"GET /css/styles.css HTTP/1.1\r\nHost: test\r\n\r\n"
+            b"GET / HTTP/1.1\r\nHost: test\r\nConnection: close\r\n\r\n"
+        )
+        with socket.create_connection(self.address, timeout=5) as connection:
+            connection.sendall(requests)
+            received = b""
+            while data := connection.recv(65536):
+                received += data
+        self.assertEqual(received.count(b"HTTP/1.1 200 OK\r\n"), 2)
+        self.assertLess(received.index(STYLES), received.index(PAGE))
+        self.assertTrue(received.endswith(PAGE))
+
+    def test_connections_over_the_limit_get_503(self):
+        self.server.max_connections = 2
+        held = [http.client.HTTPConnection(*self.address, timeout=5) for _ in range(2)]
+        for connection in held:
+            self.addCleanup(connection.close)
+            connection.request("GET", "/css/styles.css")
+            self.assertEqual(connection.getresponse().read(), STYLES)  # accepted and now idle
+        with socket.create_connection(self.address, timeout=5) as connection:
+            self.assertEqual(connection.recv(1024), serve.BUSY_RESPONSE)
+        held[0].close()
+        deadline = time.monotonic() + 5
+        while self.get("/css/styles.css")[0] == 503 and time.monotonic() < deadline:
+            time.sleep(0.02)  # until the loop notices the closed connection and frees its slot
+        self.assertEqual(self.get("/css/styles.css")[0], 200)
+
+    def test_large_files_go_out_with_sendfile_on_a_kept_alive_connection(self):
+        video = bytes(range(256)) * (serve.SENDFILE_MIN_KB * 4 + 1)
+        self.write("trailer.mp4", video)
+        calls = []
+        sendfile = socket.socket.sendfile
+
+        def counting_sendfile(sock, *args, **kwargs):
+            calls.append(sock)
+            return sendfile(sock, *args, **kwargs)
+
+        with mock.patch.object(socket.socket, "sendfile", counting_sendfile):
+            with contextlib.closing(http.client.HTTPConnection(*self.address, timeout=5)) as connection:
+                for path, expected in [("/trailer.mp4", video), ("/css/styles.css", STYLES), ("/trailer.mp4", video)]:
+                    connection.request("GET", path)
+                    response = connection.getresponse()
+                    self.assertEqual((response.status, response.read()), (200, expected))
+        self.assertEqual(len(calls), 2)
+        self.assertEqual(self.file_cache.report()["entries"], 1)  # only the stylesheet
+
+class StoppedServer:
+    """Stands in for the real server in main(): stops as if Ctrl+C was pressed"""
+
+    def __init__(self, *args):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        pass
+
+    def serve_forever(self):
+        raise KeyboardInterrupt
+
+if __name__ == "__main__":
+    unittest.main()